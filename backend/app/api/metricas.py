@@ -0,0 +1,49 @@
+# app/api/metricas.py
+import secrets
+from datetime import datetime
+from fastapi import APIRouter, Header, HTTPException, Response, status
+from sqlmodel import select, func, col
+
+from app.core.config import settings
+from app.core.database import AsyncSessionDep
+from app.core.metricas import REGISTRO, medidor
+from app.models.email import EmailOutbox, StatusEmail
+
+router = APIRouter()
+
+email_fila = medidor("email_fila", "E-mails na caixa de saída por status (pendente/falhou).")
+email_fila_idade = medidor(
+    "email_fila_idade_segundos", "Idade do e-mail pendente mais antigo (0 se a fila está vazia)."
+)
+
+
+async def _atualizar_fila_email(session) -> None:
+    # Só pendentes e falhos: ambos pelo índice (status, proxima_tentativa_em),
+    # sem varrer o histórico de enviados
+    contagens = dict((await session.exec(
+        select(EmailOutbox.status, func.count())
+        .where(EmailOutbox.status != StatusEmail.ENVIADO)
+        .group_by(EmailOutbox.status)
+    )).all())
+    for situacao in (StatusEmail.PENDENTE, StatusEmail.FALHOU):
+        email_fila.definir(contagens.get(situacao, 0), status=situacao.value)
+
+    mais_antigo = (await session.exec(
+        select(func.min(col(EmailOutbox.criado_em))).where(EmailOutbox.status == StatusEmail.PENDENTE)
+    )).one()
+    email_fila_idade.definir((datetime.now() - mais_antigo).total_seconds() if mais_antigo else 0)
+
+
+@router.get("/metrics", include_in_schema=False)
+async def metricas(session: AsyncSessionDep, authorization: str | None = Header(default=None)):
+    """Métricas do processo no formato texto do Prometheus."""
+    if settings.METRICS_TOKEN and not secrets.compare_digest(
+        authorization or "", f"Bearer {settings.METRICS_TOKEN}"
+    ):
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Não autorizado")
+
+    await _atualizar_fila_email(session)
+    return Response(
+        content=REGISTRO.renderizar(),
+        media_type="text/plain; version=0.0.4; charset=utf-8"
+    )
@@ -1,5 +1,5 @@
 from fastapi import APIRouter
-from app.api.v1.endpoints import usuarios, auth#, #noticias
+from app.api.v1.endpoints import usuarios, auth, noticias, eventos, comentarios, admin, midia
 
 api_router = APIRouter()
 
@@ -11,4 +11,8 @@ api_router.include_router(usuarios.router, prefix="/usuarios", tags=["Usuarios"]
 # /api/v1/auth/verificar
 api_router.include_router(auth.router, prefix="/auth", tags=["Autenticação"]) 
 
-#api_router.include_router(noticias.router, prefix="/noticias", tags=["Notícias"])
\ No newline at end of file
+api_router.include_router(noticias.router, prefix="/noticias", tags=["Notícias"])
+api_router.include_router(eventos.router, prefix="/eventos", tags=["Eventos"])
+api_router.include_router(comentarios.router, prefix="/comentarios", tags=["Comentários"])
+api_router.include_router(admin.router, prefix="/admin", tags=["Administração"])
+api_router.include_router(midia.router, prefix="/midia", tags=["Mídia"])
@@ -0,0 +1,75 @@
+# app/api/endpoints/admin.py
+import io
+from datetime import datetime
+from typing import Literal
+from fastapi import APIRouter, HTTPException, Query, UploadFile
+from fastapi.responses import FileResponse, StreamingResponse
+from app.core.deps import AdminUser
+from app.core.perfilador import arquivo_perfil, listar_perfis
+from app.schemas.noticia import ResultadoImportacao
+from app.schemas.perfil import PerfilRequisicao
+from app.services.exportacao import exportar, FORMATOS
+from app.services.importacao import importar_arquivo
+
+router = APIRouter()
+
+@router.get("/exportar/{recurso}", response_class=StreamingResponse)
+async def exportar_dados(
+    recurso: Literal["noticias", "usuarios", "comentarios"],
+    current_user: AdminUser,
+    formato: Literal["ndjson", "csv"] = "ndjson",
+):
+    """
+    Exporta uma tabela inteira em NDJSON ou CSV, em streaming.
+    A memória do servidor não cresce com o tamanho da tabela.
+    """
+    nome_arquivo = f"{recurso}-{datetime.now():%Y%m%d-%H%M%S}.{formato}"
+    return StreamingResponse(
+        exportar(recurso, formato),
+        media_type=FORMATOS[formato],
+        headers={"Content-Disposition": f'attachment; filename="{nome_arquivo}"'}
+    )
+
+
+@router.post("/importar/noticias", response_model=ResultadoImportacao)
+def importar_noticias(arquivo: UploadFile, current_user: AdminUser):
+    """
+    Importa notícias de um arquivo NDJSON (uma notícia por linha).
+    Slugs já cadastrados são ignorados, então reenviar o arquivo é seguro.
+    Roda no threadpool: a importação usa a engine síncrona em lotes.
+    """
+    texto = io.TextIOWrapper(arquivo.file, encoding="utf-8")
+    return importar_arquivo(texto)
+
+
+@router.get("/perfis", response_model=list[PerfilRequisicao])
+def listar_perfis_requisicoes(
+    current_user: AdminUser,
+    rota: str | None = None,
+    limite: int = Query(100, ge=1, le=1000),
+):
+    """
+    Perfis de requisições gravados pelo perfilador (PROFILER_ENABLED), do
+    mais recente para o mais antigo. Filtre pelo modelo da rota, ex.:
+    ?rota=/api/v1/auth/login
+    """
+    return listar_perfis(rota, limite)
+
+
+@router.get("/perfis/{perfil_id}", response_class=FileResponse)
+def baixar_perfil(
+    perfil_id: str,
+    current_user: AdminUser,
+    formato: Literal["html", "speedscope", "pstats"] = "html",
+):
+    """
+    Um perfil gravado. html abre direto no navegador; speedscope é o flame
+    graph (https://www.speedscope.app); pstats serve para snakeviz/pstats.
+    """
+    encontrado = arquivo_perfil(perfil_id, formato)
+    if encontrado is None:
+        raise HTTPException(status_code=404, detail="Perfil não encontrado")
+    caminho, media_type = encontrado
+    if formato == "html":
+        return FileResponse(caminho, media_type=media_type)
+    return FileResponse(caminho, media_type=media_type, filename=caminho.name)
@@ -1,17 +1,19 @@
 # app/api/endpoints/auth.py
 from typing import Annotated
 from datetime import timedelta
-from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks
+from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
 from fastapi.responses import HTMLResponse
 from sqlmodel import select
-from jose import jwt, JWTError # type: ignore
-from pydantic import ValidationError
 
-from app.core.database import SessionDep
-from app.core.security import verify_password, create_access_token, get_password_hash
+from app.core.database import SessionDep, AsyncSessionDep
+from app.core.security import (
+    verify_password_async, create_access_token, decode_access_token, hash_password_async
+)
 from app.core.config import settings
-from app.core.email import enviar_email_simples
+from app.core.deps import invalidar_usuario_cache
+from app.core.email import enfileirar_email
+from app.core.rate_limit import admissao_auth, limite_por_ip, verificar_limite
 from app.models.usuario import Usuario 
 from app.schemas.token import Token
 # Importe os novos schemas aqui
@@ -20,21 +22,44 @@ from app.schemas.usuario import GenerateUserToken, ResetPassword
 router = APIRouter()
 
 # ... (Rota /login continua igual) ...
-@router.post("/login", response_model=Token)
-def login_access_token(
-    session: SessionDep, 
+@router.post(
+    "/login",
+    response_model=Token,
+    dependencies=[limite_por_ip("login:ip"), admissao_auth]
+)
+async def login_access_token(
+    session: AsyncSessionDep, 
     form_data: Annotated[OAuth2PasswordRequestForm, Depends()]
 ):
-    usuario = session.exec(
+    # Limite por conta: freia tentativas distribuídas em muitos IPs
+    await verificar_limite("login:conta", form_data.username)
+
+    usuario = (await session.exec(
         select(Usuario).where(Usuario.email == form_data.username)
-    ).first()
-
-    if not usuario or not verify_password(form_data.password, usuario.senha_hash):
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="E-mail ou senha incorretos",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
+    )).first()
+
+    credenciais_invalidas = HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="E-mail ou senha incorretos",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+    if not usuario:
+        raise credenciais_invalidas
+
+    # O bcrypt roda no pool de processos (503 se o pool estiver saturado)
+    senha_correta, novo_hash = await verify_password_async(
+        form_data.password, usuario.senha_hash
+    )
+    if not senha_correta:
+        raise credenciais_invalidas
+
+    # O custo do bcrypt mudou desde que a senha foi salva: aproveita a senha
+    # em texto puro que temos agora para regravar o hash com o custo atual
+    if novo_hash:
+        usuario.senha_hash = novo_hash
+        session.add(usuario)
+        await session.commit()
     
     if not usuario.is_active:
         raise HTTPException(status_code=400, detail="Usuário inativo.")
@@ -60,25 +85,31 @@ def verificar_email(email: str, session: SessionDep):
     usuario.is_active = True
     session.add(usuario)
     session.commit()
+    invalidar_usuario_cache(usuario.email)
     return HTMLResponse(content="<h1 style='color:green'>Sucesso! Conta ativada.</h1>")
 
 
 # --- NOVAS ROTAS DE REDEFINIÇÃO DE SENHA ---
 
-@router.post("/recover-password")
-def recover_password(
+@router.post(
+    "/recover-password",
+    dependencies=[limite_por_ip("recuperacao:ip"), admissao_auth]
+)
+async def recover_password(
     input_data: GenerateUserToken,
-    session: SessionDep,
-    background_tasks: BackgroundTasks
+    session: AsyncSessionDep
 ):
     """
     1. Recebe o e-mail.
     2. Gera token de 10 min.
     3. Envia e-mail com o token.
     """
-    usuario = session.exec(
+    # Evita usar a rota para lotar a caixa de entrada de alguém
+    await verificar_limite("recuperacao:conta", input_data.email)
+
+    usuario = (await session.exec(
         select(Usuario).where(Usuario.email == input_data.email)
-    ).first()
+    )).first()
 
     if not usuario:
         # Por segurança, não dizemos se o e-mail existe ou não, apenas retornamos sucesso.
@@ -104,46 +135,48 @@ def recover_password(
     </p>
     """
 
-    background_tasks.add_task(
-        enviar_email_simples,
+    enfileirar_email(
+        session,
         "Recuperação de Senha - Jornal UFC",
         [usuario.email],
         html_content
     )
+    await session.commit()
 
     return {"message": "E-mail de recuperação enviado (se o usuário existir)."}
 
 
-@router.post("/reset-password")
-def reset_password(
+@router.post(
+    "/reset-password",
+    dependencies=[limite_por_ip("redefinicao:ip"), admissao_auth]
+)
+async def reset_password(
     input_data: ResetPassword,
-    session: SessionDep
+    session: AsyncSessionDep
 ):
     """
     Recebe o token e a nova senha para efetivar a troca.
     """
-    try:
-        # 1. Decodifica e valida o token
-        payload = jwt.decode(
-            input_data.token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]
-        )
-        email: str = payload.get("sub")
-        token_type: str = payload.get("type")
-        
-        if email is None or token_type != "reset":
-            raise HTTPException(status_code=400, detail="Token inválido")
-            
-    except (JWTError, ValidationError):
+    # 1. Decodifica e valida o token
+    payload = decode_access_token(input_data.token)
+    if payload is None:
         raise HTTPException(status_code=400, detail="Token expirado ou inválido")
 
+    email: str = payload.get("sub")
+    token_type: str = payload.get("type")
+    
+    if email is None or token_type != "reset":
+        raise HTTPException(status_code=400, detail="Token inválido")
+
     # 2. Busca usuário
-    usuario = session.exec(select(Usuario).where(Usuario.email == email)).first()
+    usuario = (await session.exec(select(Usuario).where(Usuario.email == email))).first()
     if not usuario:
         raise HTTPException(status_code=404, detail="Usuário não encontrado")
 
     # 3. Atualiza senha
-    usuario.senha_hash = get_password_hash(input_data.new_password)
+    usuario.senha_hash = await hash_password_async(input_data.new_password)
     session.add(usuario)
-    session.commit()
+    await session.commit()
+    invalidar_usuario_cache(usuario.email)
 
     return {"message": "Senha alterada com sucesso."}
\ No newline at end of file
@@ -0,0 +1,35 @@
+# app/api/endpoints/comentarios.py
+from fastapi import APIRouter, HTTPException, status
+from sqlmodel import select
+from app.core.database import AsyncSessionDep
+from app.core.deps import CurrentUser
+from app.models.comentario import Comentario
+from app.schemas.curtida import EstadoCurtida
+from app.services.curtidas import curtir, descurtir
+
+router = APIRouter()
+
+@router.post("/{comentario_id}/curtida", response_model=EstadoCurtida)
+async def curtir_comentario(comentario_id: int, session: AsyncSessionDep, current_user: CurrentUser):
+    """
+    Curte um comentário aprovado (idempotente).
+    """
+    existe = (await session.exec(
+        select(Comentario.id)
+        .where(Comentario.id == comentario_id)
+        .where(Comentario.aprovado == True)
+    )).first()
+    if not existe:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Comentário não encontrado.")
+
+    await curtir(session, "comentarios", comentario_id, current_user.id)
+    return EstadoCurtida(curtido=True)
+
+
+@router.delete("/{comentario_id}/curtida", response_model=EstadoCurtida)
+async def descurtir_comentario(comentario_id: int, session: AsyncSessionDep, current_user: CurrentUser):
+    """
+    Remove a curtida do comentário (idempotente).
+    """
+    await descurtir(session, "comentarios", comentario_id, current_user.id)
+    return EstadoCurtida(curtido=False)
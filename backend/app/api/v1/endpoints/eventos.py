@@ -0,0 +1,153 @@
+# app/api/endpoints/eventos.py
+from datetime import date, datetime, time, timedelta
+from typing import Annotated
+from fastapi import APIRouter, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from sqlmodel import select, col
+from app.core.database import AsyncSessionDep
+from app.core.http_cache import gerar_etag, cabecalhos_cache, resposta_nao_modificada, versao_colecao
+from app.core.serializacao import ListaCompilada, RespostaJSON
+from app.models.evento import Evento
+from app.schemas.evento import EventoRead
+from app.services.calendario import query_periodo, gerar_ical
+
+router = APIRouter()
+
+# Janela máxima de uma consulta de calendário
+PERIODO_MAXIMO = timedelta(days=400)
+
+# Listagens servidas direto das tuplas do SELECT (ver app/core/serializacao.py)
+LISTA_EVENTOS = ListaCompilada(EventoRead, Evento)
+
+
+def _hora_local(momento: datetime) -> datetime:
+    """
+    As datas dos eventos são gravadas em hora local, sem fuso (datetime.now).
+    Um parâmetro com fuso (ex.: ...T00:00:00Z) é convertido para a hora local
+    e perde o fuso, para poder ser comparado e usado na consulta.
+    """
+    if momento.tzinfo is None:
+        return momento
+    return momento.astimezone().replace(tzinfo=None)
+
+
+def _validar_periodo(de: datetime, ate: datetime) -> tuple[datetime, datetime]:
+    """Normaliza o período para hora local e confere os limites."""
+    de, ate = _hora_local(de), _hora_local(ate)
+    if ate < de:
+        raise HTTPException(status_code=400, detail="'ate' deve ser posterior a 'de'.")
+    if ate - de > PERIODO_MAXIMO:
+        raise HTTPException(
+            status_code=400,
+            detail=f"O período máximo é de {PERIODO_MAXIMO.days} dias."
+        )
+    return de, ate
+
+@router.get("/", response_model=list[EventoRead], response_class=RespostaJSON)
+async def listar_eventos(
+    session: AsyncSessionDep,
+    request: Request,
+    a_partir_de: Annotated[date | None, Query(description="Padrão: hoje")] = None,
+    limit: Annotated[int, Query(ge=1, le=100)] = 50,
+):
+    """
+    Próximos eventos (que terminam a partir da data informada), em ordem de início.
+    Suporta GET condicional pela versão da coleção de eventos.
+    """
+    a_partir_de = a_partir_de or date.today()
+
+    # A data entra na ETag: a mesma versão da coleção gera listas diferentes
+    # conforme o dia consultado
+    versao, ultima_modificacao = await versao_colecao(session, "eventos")
+    etag = gerar_etag("eventos", versao, a_partir_de.isoformat())
+    nao_modificada = resposta_nao_modificada(request, etag, ultima_modificacao)
+    if nao_modificada:
+        return nao_modificada
+
+    eventos = LISTA_EVENTOS.itens(await session.exec(
+        LISTA_EVENTOS.select()
+        .where(Evento.data_fim >= datetime.combine(a_partir_de, time.min))
+        .order_by(col(Evento.data_inicio), col(Evento.id))
+        .limit(limit)
+    ))
+
+    return RespostaJSON(eventos, headers=cabecalhos_cache(etag, ultima_modificacao))
+
+
+@router.get("/calendario", response_model=list[EventoRead], response_class=RespostaJSON)
+async def calendario(
+    session: AsyncSessionDep,
+    request: Request,
+    de: datetime,
+    ate: datetime,
+):
+    """
+    Eventos que se sobrepõem ao período [de, ate] (usa o índice de intervalo).
+    """
+    de, ate = _validar_periodo(de, ate)
+
+    versao, ultima_modificacao = await versao_colecao(session, "eventos")
+    etag = gerar_etag("calendario", versao, de.isoformat(), ate.isoformat())
+    nao_modificado = resposta_nao_modificada(request, etag, ultima_modificacao)
+    if nao_modificado:
+        return nao_modificado
+
+    dialeto = session.get_bind().dialect.name
+    eventos = LISTA_EVENTOS.itens(
+        await session.exec(query_periodo(dialeto, de, ate, LISTA_EVENTOS.colunas))
+    )
+
+    return RespostaJSON(eventos, headers=cabecalhos_cache(etag, ultima_modificacao))
+
+
+@router.get("/calendario.ics", response_class=StreamingResponse)
+async def calendario_ical(
+    session: AsyncSessionDep,
+    request: Request,
+    de: datetime | None = None,
+    ate: datetime | None = None,
+):
+    """
+    Feed iCalendar para assinatura em apps de agenda.
+    Padrão: dos últimos 30 dias até 1 ano à frente. O arquivo é gerado em
+    streaming e, se a agenda não mudou, a resposta é 304 sem consultar eventos.
+    """
+    hoje = datetime.combine(date.today(), time.min)
+    de = de or hoje - timedelta(days=30)
+    ate = ate or hoje + timedelta(days=365)
+    de, ate = _validar_periodo(de, ate)
+
+    versao, ultima_modificacao = await versao_colecao(session, "eventos")
+    etag = gerar_etag("ical", versao, de.isoformat(), ate.isoformat())
+    nao_modificado = resposta_nao_modificada(request, etag, ultima_modificacao)
+    if nao_modificado:
+        return nao_modificado
+
+    return StreamingResponse(
+        gerar_ical(de, ate),
+        media_type="text/calendar; charset=utf-8",
+        headers=cabecalhos_cache(etag, ultima_modificacao)
+    )
+
+
+@router.get("/{evento_id}", response_model=EventoRead)
+async def ler_evento(evento_id: int, session: AsyncSessionDep, request: Request, response: Response):
+    """
+    Retorna um evento. Suporta If-None-Match / If-Modified-Since.
+    """
+    chave = (await session.exec(
+        select(Evento.id, Evento.atualizado_em).where(Evento.id == evento_id)
+    )).first()
+
+    if not chave:
+        raise HTTPException(status_code=404, detail="Evento não encontrado.")
+
+    _, atualizado_em = chave
+    etag = gerar_etag("evento", evento_id, atualizado_em.timestamp())
+    nao_modificado = resposta_nao_modificada(request, etag, atualizado_em)
+    if nao_modificado:
+        return nao_modificado
+
+    evento = await session.get(Evento, evento_id)
+    response.headers.update(cabecalhos_cache(etag, atualizado_em))
+    return evento
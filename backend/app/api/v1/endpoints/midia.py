@@ -0,0 +1,43 @@
+# app/api/endpoints/midia.py
+from fastapi import APIRouter, HTTPException, Request, status
+from app.core.deps import EditorUser
+from app.schemas.midia import ImagemEnviada
+from app.services.midia import salvar_imagem
+
+router = APIRouter()
+
+# O corpo não passa por parâmetro da rota (seria lido inteiro antes da
+# validação); a documentação do OpenAPI é declarada à mão
+_CORPO_IMAGEM = {
+    "requestBody": {
+        "required": True,
+        "content": {
+            tipo: {"schema": {"type": "string", "format": "binary"}}
+            for tipo in ("image/jpeg", "image/png", "image/gif", "image/webp")
+        },
+    }
+}
+
+@router.post(
+    "/imagens",
+    response_model=ImagemEnviada,
+    status_code=status.HTTP_201_CREATED,
+    openapi_extra=_CORPO_IMAGEM,
+)
+async def enviar_imagem(request: Request, current_user: EditorUser):
+    """
+    Envia uma imagem (capa de notícia ou imagem de evento).
+    - O corpo da requisição é a própria imagem (sem multipart), ex.:
+      `curl --data-binary @capa.jpg -H "Content-Type: image/jpeg" ...`
+    - Content-Length acima do limite é recusado (413) antes da leitura; sem
+      ele, o limite é conferido a cada bloco recebido.
+    - O arquivo é copiado para disco em blocos, sem carregá-lo inteiro na memória.
+    - Imagens idênticas são armazenadas uma única vez (mesma URL).
+    - As miniaturas são geradas em segundo plano e ficam disponíveis em instantes.
+    """
+    tamanho_declarado = request.headers.get("content-length")
+    if tamanho_declarado is not None and not tamanho_declarado.isdigit():
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Content-Length inválido.")
+    return await salvar_imagem(
+        request.stream(), int(tamanho_declarado) if tamanho_declarado else None
+    )
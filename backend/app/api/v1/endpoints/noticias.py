@@ -1 +1,283 @@
-##
\ No newline at end of file
+# app/api/endpoints/noticias.py
+from typing import Annotated
+from fastapi import APIRouter, HTTPException, Query, Request, Response, status
+from sqlmodel import select, col, tuple_
+from app.core.config import settings
+from app.core.database import AsyncSessionDep
+from app.core.deps import CurrentUser
+from app.core.http_cache import gerar_etag, cabecalhos_cache, resposta_nao_modificada, versao_colecao
+from app.core.pagination import encode_cursor, decode_cursor
+from app.core.serializacao import ListaCompilada, RespostaJSON
+from app.models.categoria import Categoria
+from app.models.comentario import Comentario
+from app.models.faceta import FacetaContagem
+from app.models.noticia import Noticia, NoticiasTags, Tag
+from app.models.usuario import Usuario
+from app.models.versao import VersaoColecao
+from app.schemas.comentario import ComentarioRead, PaginaComentarios
+from app.schemas.curtida import EstadoCurtida
+from app.schemas.noticia import (
+    NoticiaResumo, NoticiaDetalhe, NoticiaEmAlta, FeedNoticias, ResultadoBusca, FacetaItem, Facetas
+)
+from app.services.busca import buscar_noticias
+from app.services.cache_artigos import obter_artigo
+from app.services.curtidas import curtir, descurtir
+from app.services.tendencias import ranking
+
+router = APIRouter()
+
+# Listagens servidas direto das tuplas do SELECT (ver app/core/serializacao.py)
+LISTA_NOTICIAS = ListaCompilada(NoticiaResumo, Noticia)
+# Autor pelo JOIN e curtidas do contador desnormalizado
+LISTA_COMENTARIOS = ListaCompilada(
+    ComentarioRead, Comentario,
+    autor_nome=Usuario.nome,
+    curtidas=Comentario.total_curtidas,
+)
+
+@router.get("/", response_model=FeedNoticias, response_class=RespostaJSON)
+async def listar_noticias(
+    session: AsyncSessionDep,
+    request: Request,
+    limit: Annotated[int, Query(ge=1, le=100)] = 20,
+    cursor: str | None = None,
+    categoria_id: int | None = None,
+    tag: Annotated[str | None, Query(description="Slug da tag")] = None,
+):
+    """
+    Feed de notícias publicadas, da mais recente para a mais antiga.
+    - **cursor**: valor de `next_cursor` da página anterior (paginação keyset).
+    - **categoria_id** / **tag**: filtros opcionais.
+    """
+    # 0. GET condicional: a versão da coleção muda a cada escrita em notícias,
+    #    então se o cliente já tem esta versão nem consultamos o feed
+    versao, ultima_modificacao = await versao_colecao(session, "noticias")
+    etag = gerar_etag("noticias", versao)
+    nao_modificada = resposta_nao_modificada(request, etag, ultima_modificacao)
+    if nao_modificada:
+        return nao_modificada
+
+    # 1. Apenas notícias publicadas, ordenadas pela chave do índice
+    #    (só as colunas do resumo: sem instanciar Noticia)
+    query = (
+        LISTA_NOTICIAS.select()
+        .where(Noticia.publicado == True)
+        .where(col(Noticia.publicado_em).is_not(None))
+    )
+
+    # 2. Filtros opcionais
+    if categoria_id is not None:
+        query = query.where(Noticia.categoria_id == categoria_id)
+
+    if tag:
+        noticias_da_tag = (
+            select(NoticiasTags.noticia_id)
+            .join(Tag, col(Tag.id) == col(NoticiasTags.tag_id))
+            .where(Tag.slug == tag)
+        )
+        query = query.where(col(Noticia.id).in_(noticias_da_tag))
+
+    # 3. Continua a partir do último item da página anterior
+    if cursor:
+        ultimo_publicado_em, ultimo_id = decode_cursor(cursor)
+        query = query.where(
+            tuple_(Noticia.publicado_em, Noticia.id) < tuple_(ultimo_publicado_em, ultimo_id)
+        )
+
+    # 4. Busca um item a mais só para saber se existe próxima página
+    query = query.order_by(
+        col(Noticia.publicado_em).desc(), col(Noticia.id).desc()
+    ).limit(limit + 1)
+    noticias = LISTA_NOTICIAS.itens(await session.exec(query))
+
+    next_cursor = None
+    if len(noticias) > limit:
+        noticias = noticias[:limit]
+        ultima = noticias[-1]
+        next_cursor = encode_cursor(ultima["publicado_em"], ultima["id"])
+
+    return RespostaJSON(
+        {"items": noticias, "next_cursor": next_cursor},
+        headers=cabecalhos_cache(etag, ultima_modificacao)
+    )
+
+
+@router.get("/busca", response_model=list[ResultadoBusca])
+async def buscar(
+    session: AsyncSessionDep,
+    q: Annotated[str, Query(min_length=2, max_length=200, description="Texto a buscar")],
+    limit: Annotated[int, Query(ge=1, le=50)] = 20,
+    offset: Annotated[int, Query(ge=0, le=500)] = 0,
+):
+    """
+    Busca textual em título, subtítulo e conteúdo das notícias publicadas.
+    Resultados ordenados por relevância, com trecho destacado.
+    """
+    return await buscar_noticias(session, q, limit=limit, offset=offset)
+
+
+@router.get("/facetas", response_model=Facetas)
+async def listar_facetas(session: AsyncSessionDep, request: Request, response: Response):
+    """
+    Quantidade de notícias publicadas por categoria e por tag.
+    Lida da tabela de contagens mantida a cada escrita (sem GROUP BY por requisição).
+    """
+    versao, ultima_modificacao = await versao_colecao(session, "noticias")
+    etag = gerar_etag("facetas", versao)
+    nao_modificada = resposta_nao_modificada(request, etag, ultima_modificacao)
+    if nao_modificada:
+        return nao_modificada
+
+    facetas = {}
+    for tipo, modelo in (("categoria", Categoria), ("tag", Tag)):
+        linhas = (await session.exec(
+            select(modelo.id, modelo.nome, modelo.slug, FacetaContagem.total)
+            .join(FacetaContagem, col(FacetaContagem.ref_id) == col(modelo.id))
+            .where(FacetaContagem.tipo == tipo)
+            .where(FacetaContagem.total > 0)
+            .order_by(col(FacetaContagem.total).desc(), col(modelo.nome))
+        )).all()
+        facetas[tipo] = [
+            FacetaItem(id=id_, nome=nome, slug=slug, total=total)
+            for id_, nome, slug, total in linhas
+        ]
+
+    response.headers.update(cabecalhos_cache(etag, ultima_modificacao))
+    return Facetas(categorias=facetas["categoria"], tags=facetas["tag"])
+
+
+@router.get("/em-alta", response_model=list[NoticiaEmAlta], response_class=RespostaJSON)
+async def listar_em_alta(
+    categoria_id: int | None = None,
+    limit: Annotated[int, Query(ge=1, le=50)] = 10,
+):
+    """
+    Notícias em alta (geral ou da categoria), pela soma de visualizações,
+    curtidas e comentários recentes com peso decrescente no tempo.
+    Servido da memória; o ranking é recalculado a cada poucos segundos.
+    """
+    return RespostaJSON(
+        ranking.em_alta(categoria_id, limit),
+        headers={"Cache-Control": f"public, max-age={int(settings.TRENDING_INTERVALO_SECONDS)}"}
+    )
+
+
+@router.get("/{slug}", response_model=NoticiaDetalhe)
+async def ler_noticia(slug: str, session: AsyncSessionDep, request: Request):
+    """
+    Retorna uma notícia publicada pelo slug, com autor, categoria, tags e curtidas.
+    Suporta If-None-Match / If-Modified-Since (responde 304 se não mudou).
+    """
+    # 1. Consulta leve (sem o conteúdo), pelo índice do slug: o validador do
+    #    artigo é (id, atualizado_em) + a versão dos nomes de categorias,
+    #    tags e autores que ele embute + o contador de curtidas (a descarga
+    #    não mexe em atualizado_em). Editar outro artigo não o invalida.
+    chave = (await session.exec(
+        select(
+            Noticia.id, Noticia.atualizado_em, Noticia.total_curtidas,
+            VersaoColecao.versao, VersaoColecao.atualizado_em,
+        )
+        .outerjoin(VersaoColecao, col(VersaoColecao.nome) == "relacoes_artigo")
+        .where(Noticia.slug == slug)
+        .where(Noticia.publicado == True)
+    )).first()
+    if not chave:
+        raise HTTPException(status_code=404, detail="Notícia não encontrada.")
+
+    noticia_id, atualizado_em, curtidas, versao_relacoes, relacoes_em = chave
+    validador = f"{atualizado_em.timestamp()}-{versao_relacoes or 0}-{curtidas}"
+    ultima_modificacao = max(atualizado_em, relacoes_em or atualizado_em)
+    etag = gerar_etag("noticia", noticia_id, validador)
+    nao_modificada = resposta_nao_modificada(request, etag, ultima_modificacao)
+    if nao_modificada:
+        return nao_modificada
+
+    # 2. Payload já serializado (cache em memória / Redis / montagem no banco)
+    payload = await obter_artigo(session, noticia_id, validador)
+    if payload is None:
+        # Despublicada entre a consulta leve e a montagem
+        raise HTTPException(status_code=404, detail="Notícia não encontrada.")
+
+    # 3. Conta para o ranking "em alta" (revalidações 304 não contam)
+    ranking.registrar_visualizacao(slug)
+
+    return Response(
+        content=payload,
+        media_type="application/json",
+        headers=cabecalhos_cache(etag, ultima_modificacao)
+    )
+
+
+async def _garantir_noticia_publicada(session, noticia_id: int) -> None:
+    existe = (await session.exec(
+        select(Noticia.id).where(Noticia.id == noticia_id).where(Noticia.publicado == True)
+    )).first()
+    if not existe:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Notícia não encontrada.")
+
+
+@router.post("/{noticia_id}/curtida", response_model=EstadoCurtida)
+async def curtir_noticia(noticia_id: int, session: AsyncSessionDep, current_user: CurrentUser):
+    """
+    Curte a notícia (idempotente). O contador é atualizado em lote, alguns
+    segundos depois.
+    """
+    await _garantir_noticia_publicada(session, noticia_id)
+    if await curtir(session, "noticias", noticia_id, current_user.id):
+        ranking.registrar(noticia_id, "curtida")
+    return EstadoCurtida(curtido=True)
+
+
+@router.delete("/{noticia_id}/curtida", response_model=EstadoCurtida)
+async def descurtir_noticia(noticia_id: int, session: AsyncSessionDep, current_user: CurrentUser):
+    """
+    Remove a curtida da notícia (idempotente).
+    """
+    # Retira o peso que a curtida ainda tem: curtir e descurtir em sequência
+    # não sobe a notícia no ranking, e desfazer uma curtida antiga não tira
+    # mais do que ela vale hoje
+    curtida_em = await descurtir(session, "noticias", noticia_id, current_user.id)
+    if curtida_em is not None:
+        ranking.remover(noticia_id, "curtida", curtida_em)
+    return EstadoCurtida(curtido=False)
+
+
+@router.get("/{noticia_id}/comentarios", response_model=PaginaComentarios, response_class=RespostaJSON)
+async def listar_comentarios(
+    noticia_id: int,
+    session: AsyncSessionDep,
+    limit: Annotated[int, Query(ge=1, le=100)] = 20,
+    cursor: str | None = None,
+):
+    """
+    Comentários aprovados da notícia, do mais antigo para o mais recente.
+    - **cursor**: valor de `next_cursor` da página anterior (paginação keyset).
+    """
+    await _garantir_noticia_publicada(session, noticia_id)
+
+    # O autor vem no mesmo SELECT (JOIN) e a curtida do contador
+    # desnormalizado: a página custa sempre o mesmo número de queries,
+    # independente de quantos comentários traz
+    query = (
+        LISTA_COMENTARIOS.select()
+        .outerjoin(Usuario, col(Usuario.id) == col(Comentario.usuario_id))
+        .where(Comentario.noticia_id == noticia_id)
+        .where(Comentario.aprovado == True)
+    )
+
+    if cursor:
+        ultimo_criado_em, ultimo_id = decode_cursor(cursor)
+        query = query.where(
+            tuple_(Comentario.criado_em, Comentario.id) > tuple_(ultimo_criado_em, ultimo_id)
+        )
+
+    query = query.order_by(col(Comentario.criado_em), col(Comentario.id)).limit(limit + 1)
+    comentarios = LISTA_COMENTARIOS.itens(await session.exec(query))
+
+    next_cursor = None
+    if len(comentarios) > limit:
+        comentarios = comentarios[:limit]
+        ultimo = comentarios[-1]
+        next_cursor = encode_cursor(ultimo["criado_em"], ultimo["id"])
+
+    return RespostaJSON({"items": comentarios, "next_cursor": next_cursor})
@@ -1,21 +1,59 @@
 # app/api/endpoints/usuarios.py
-from fastapi import APIRouter, HTTPException, status, BackgroundTasks
-from sqlmodel import select
-from app.core.database import SessionDep
-from app.core.security import get_password_hash
-from app.core.email import enviar_email_simples
+from typing import Annotated
+from fastapi import APIRouter, HTTPException, Query, status
+from sqlmodel import select, update, col, tuple_
+from app.core.database import SessionDep, AsyncSessionDep
+from app.core.security import hash_password_async
+from app.core.email import enfileirar_email, enfileirar_emails_em_lote
+from app.core.pagination import encode_cursor, decode_cursor
+from app.core.rate_limit import admissao_auth, limite_por_ip
+from app.core.serializacao import ListaCompilada, RespostaJSON
 # Ajustei os imports para ficarem conforme sua estrutura de pastas (app.db...)
 from app.models.usuario import Usuario, RoleEnum
-from app.schemas.usuario import UsuarioCreate, UsuarioRead, SolicitacaoBolsa
-from app.core.deps import CurrentUser
+from app.schemas.usuario import (
+    UsuarioCreate, UsuarioRead, SolicitacaoBolsa,
+    BolsistaPendente, PaginaBolsistasPendentes, LoteBolsistas, ResultadoLoteBolsistas
+)
+from app.core.deps import CurrentUser, invalidar_usuario_cache
 
 router = APIRouter()
 
-@router.post("/", response_model=UsuarioRead, status_code=status.HTTP_201_CREATED)
-def create_usuario(
+# Fila do professor servida direto das tuplas do SELECT (ver app/core/serializacao.py)
+LISTA_BOLSISTAS_PENDENTES = ListaCompilada(BolsistaPendente, Usuario)
+
+
+# --- E-MAILS AOS BOLSISTAS ---
+# Mesmos textos nas rotas de um aluno e nas de lote
+
+def _email_aprovacao(aluno_nome: str, professor_nome: str) -> str:
+    return f"""
+    <h1 style="color: green;">Solicitação Aprovada!</h1>
+    <p>Olá, <b>{aluno_nome}</b>.</p>
+    <p>O Professor <b>{professor_nome}</b> aprovou seu vínculo de bolsa.</p>
+    <p>Sua conta de Bolsista está ativa e você já pode publicar notícias.</p>
+    """
+
+
+def _email_encerramento(aluno_nome: str, professor_nome: str) -> str:
+    return f"""
+    <h1>Vínculo de Bolsa Encerrado</h1>
+    <p>Olá, <b>{aluno_nome}</b>.</p>
+    <p>O Professor <b>{professor_nome}</b> encerrou seu vínculo de bolsista.</p>
+    <p>Sua conta agora tem perfil de <b>Leitor</b>.</p>
+    """
+
+ASSUNTO_APROVACAO = "Sua Bolsa foi Aprovada - Jornal UFC"
+ASSUNTO_ENCERRAMENTO = "Atualização de Perfil - Jornal UFC"
+
+@router.post(
+    "/",
+    response_model=UsuarioRead,
+    status_code=status.HTTP_201_CREATED,
+    dependencies=[limite_por_ip("cadastro:ip"), admissao_auth]
+)
+async def create_usuario(
     usuario_in: UsuarioCreate, 
-    session: SessionDep,
-    background_tasks: BackgroundTasks # <--- Injeção para enviar e-mail em 2º plano
+    session: AsyncSessionDep
 ):
     """
     Cria um novo usuário no sistema.
@@ -25,9 +63,9 @@ def create_usuario(
     """
 
     # 1. Verificar se o email já existe
-    usuario_existente = session.exec(
+    usuario_existente = (await session.exec(
         select(Usuario).where(Usuario.email == usuario_in.email)
-    ).first()
+    )).first()
     
     if usuario_existente:
         raise HTTPException(
@@ -36,8 +74,10 @@ def create_usuario(
         )
 
     # 2. Preparar objeto para o Banco
+    # (o hash bcrypt roda no pool de processos para não bloquear o event loop)
+    senha_hash = await hash_password_async(usuario_in.senha)
     novo_usuario = Usuario.model_validate(
-        usuario_in, update={"senha_hash": get_password_hash(usuario_in.senha)}
+        usuario_in, update={"senha_hash": senha_hash}
     )
 
     # 3. Lógica específica por PERFIL (Role)
@@ -55,8 +95,8 @@ def create_usuario(
         <a href="{link_ativacao}" style="padding: 10px; background-color: #007bff; color: white; text-decoration: none; border-radius: 5px;">ATIVAR MINHA CONTA</a>
         """
         
-        background_tasks.add_task(
-            enviar_email_simples,
+        enfileirar_email(
+            session,
             "Ativação de Conta - Jornal UFC",
             [novo_usuario.email],
             html_content
@@ -65,9 +105,9 @@ def create_usuario(
     # --- REGRA DO BOLSISTA ---
     elif usuario_in.role == RoleEnum.BOLSISTA:
         # Busca o ID do professor baseado no email fornecido
-        orientador = session.exec(
+        orientador = (await session.exec(
             select(Usuario).where(Usuario.email == usuario_in.email_orientador)
-        ).first()
+        )).first()
 
         if not orientador or orientador.role != RoleEnum.PROFESSOR:
             raise HTTPException(
@@ -85,8 +125,8 @@ def create_usuario(
         <p>Acesse o painel do sistema para aprovar ou rejeitar esta solicitação.</p>
         """
         
-        background_tasks.add_task(
-            enviar_email_simples,
+        enfileirar_email(
+            session,
             "Aprovação Pendente - Jornal UFC",
             [orientador.email],
             html_content
@@ -98,18 +138,131 @@ def create_usuario(
 
     # 4. Salvar no Banco
     session.add(novo_usuario)
-    session.commit()
-    session.refresh(novo_usuario)
+    await session.commit()
+    await session.refresh(novo_usuario)
 
     return novo_usuario
 
 
+# --- BOLSISTAS DO PROFESSOR (fila e operações em lote) ---
+# Declaradas antes das rotas /{aluno_id}/... para "bolsistas" não ser lido como id
+
+def _exigir_professor(current_user) -> None:
+    if current_user.role != RoleEnum.PROFESSOR:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Apenas professores podem gerenciar bolsistas."
+        )
+
+
+@router.get("/bolsistas/pendentes", response_model=PaginaBolsistasPendentes, response_class=RespostaJSON)
+async def listar_bolsistas_pendentes(
+    session: AsyncSessionDep,
+    current_user: CurrentUser,
+    limit: Annotated[int, Query(ge=1, le=100)] = 50,
+    cursor: str | None = None,
+):
+    """
+    Alunos aguardando a aprovação do professor logado, dos mais antigos
+    para os mais recentes.
+    - **cursor**: valor de `next_cursor` da página anterior (paginação keyset).
+    """
+    _exigir_professor(current_user)
+
+    # Desce direto no índice (orientador_id, is_active, criado_em, id)
+    query = (
+        LISTA_BOLSISTAS_PENDENTES.select()
+        .where(Usuario.orientador_id == current_user.id)
+        .where(Usuario.is_active == False)
+        .where(Usuario.role == RoleEnum.BOLSISTA)
+    )
+    if cursor:
+        ultimo_criado_em, ultimo_id = decode_cursor(cursor)
+        query = query.where(
+            tuple_(Usuario.criado_em, Usuario.id) > tuple_(ultimo_criado_em, ultimo_id)
+        )
+
+    query = query.order_by(col(Usuario.criado_em), col(Usuario.id)).limit(limit + 1)
+    alunos = LISTA_BOLSISTAS_PENDENTES.itens(await session.exec(query))
+
+    next_cursor = None
+    if len(alunos) > limit:
+        alunos = alunos[:limit]
+        next_cursor = encode_cursor(alunos[-1]["criado_em"], alunos[-1]["id"])
+
+    return RespostaJSON({"items": alunos, "next_cursor": next_cursor})
+
+
+async def _atualizar_lote(session, current_user, aluno_ids: list[int], filtros, valores,
+                          assunto: str, corpo) -> ResultadoLoteBolsistas:
+    """
+    Um UPDATE para todos os alunos do lote que pertencem ao professor e
+    estão no estado esperado; o RETURNING diz quais foram alterados. Os
+    e-mails entram na mesma transação, num único INSERT na caixa de saída.
+    """
+    ids = sorted(set(aluno_ids))
+    alterados = (await session.exec(
+        update(Usuario)
+        .where(col(Usuario.id).in_(ids))
+        .where(Usuario.orientador_id == current_user.id)
+        .where(Usuario.role == RoleEnum.BOLSISTA)
+        .where(*filtros)
+        .values(**valores)
+        .returning(Usuario.id, Usuario.nome, Usuario.email)
+    )).all()
+
+    await enfileirar_emails_em_lote(session, [
+        (assunto, [email], corpo(nome, current_user.nome)) for _, nome, email in alterados
+    ])
+    await session.commit()
+
+    for _, _, email in alterados:
+        invalidar_usuario_cache(email)
+
+    atualizados = sorted(aluno_id for aluno_id, _, _ in alterados)
+    return ResultadoLoteBolsistas(
+        atualizados=atualizados,
+        ignorados=sorted(set(ids) - set(atualizados))
+    )
+
+
+@router.post("/bolsistas/aprovar", response_model=ResultadoLoteBolsistas)
+async def aprovar_bolsistas(lote: LoteBolsistas, session: AsyncSessionDep, current_user: CurrentUser):
+    """
+    Aprova de uma vez vários alunos pendentes do professor logado.
+    Ids de outros orientadores ou já ativos voltam em `ignorados`.
+    """
+    _exigir_professor(current_user)
+    return await _atualizar_lote(
+        session, current_user, lote.aluno_ids,
+        filtros=[Usuario.is_active == False],
+        valores={"is_active": True},
+        assunto=ASSUNTO_APROVACAO,
+        corpo=_email_aprovacao,
+    )
+
+
+@router.post("/bolsistas/encerrar", response_model=ResultadoLoteBolsistas)
+async def encerrar_bolsas(lote: LoteBolsistas, session: AsyncSessionDep, current_user: CurrentUser):
+    """
+    Encerra o vínculo de vários bolsistas do professor logado (voltam a ser
+    Leitores ativos). Ids que não são bolsistas dele voltam em `ignorados`.
+    """
+    _exigir_professor(current_user)
+    return await _atualizar_lote(
+        session, current_user, lote.aluno_ids,
+        filtros=[],
+        valores={"role": RoleEnum.LEITOR, "orientador_id": None, "is_active": True},
+        assunto=ASSUNTO_ENCERRAMENTO,
+        corpo=_email_encerramento,
+    )
+
+
 @router.patch("/{user_id}/virar-bolsista", response_model=UsuarioRead)
 def tornar_se_bolsista(
     user_id: int, 
     solicitacao: SolicitacaoBolsa, 
-    session: SessionDep,
-    background_tasks: BackgroundTasks # <--- Injeção aqui também
+    session: SessionDep
 ):
     # Busca o usuário
     usuario = session.get(Usuario, user_id)
@@ -135,23 +288,24 @@ def tornar_se_bolsista(
     usuario.orientador_id = orientador.id
     usuario.is_active = False  # Bloqueia até aprovação
     
-    session.add(usuario)
-    session.commit()
-    session.refresh(usuario)
-    
-    # Envia email para o professor
+    # Envia email para o professor (gravado na mesma transação da mudança)
     html_content = f"""
     <h1>Solicitação de Vínculo de Bolsa</h1>
     <p>O usuário leitor <b>{usuario.nome}</b> solicitou alteração para Bolsista sob sua orientação.</p>
     <p>Acesse o sistema para aprovar.</p>
     """
     
-    background_tasks.add_task(
-        enviar_email_simples,
+    enfileirar_email(
+        session,
         "Solicitação de Novo Bolsista",
         [orientador.email],
         html_content
     )
+
+    session.add(usuario)
+    session.commit()
+    session.refresh(usuario)
+    invalidar_usuario_cache(usuario.email)
     
     return usuario
 
@@ -160,8 +314,7 @@ def tornar_se_bolsista(
 def encerrar_bolsa(
     aluno_id: int, 
     session: SessionDep,
-    current_user: CurrentUser, # <--- Garante que tem alguém logado
-    background_tasks: BackgroundTasks
+    current_user: CurrentUser # <--- Garante que tem alguém logado
 ):
     """
     Rota para o Professor encerrar o vínculo de um bolsista.
@@ -196,24 +349,19 @@ def encerrar_bolsa(
     aluno.orientador_id = None
     aluno.is_active = True # Garante que ele continue acessando como leitor
     
-    session.add(aluno)
-    session.commit()
-    session.refresh(aluno)
-    
     # 6. Envia e-mail avisando o aluno
-    html_content = f"""
-    <h1>Vínculo de Bolsa Encerrado</h1>
-    <p>Olá, <b>{aluno.nome}</b>.</p>
-    <p>O Professor <b>{current_user.nome}</b> encerrou seu vínculo de bolsista.</p>
-    <p>Sua conta agora tem perfil de <b>Leitor</b>.</p>
-    """
-    
-    background_tasks.add_task(
-        enviar_email_simples,
-        "Atualização de Perfil - Jornal UFC",
+    enfileirar_email(
+        session,
+        ASSUNTO_ENCERRAMENTO,
         [aluno.email],
-        html_content
+        _email_encerramento(aluno.nome, current_user.nome)
     )
+
+    # 7. Salva a mudança e o e-mail juntos
+    session.add(aluno)
+    session.commit()
+    session.refresh(aluno)
+    invalidar_usuario_cache(aluno.email)
     
     return aluno
 
@@ -221,8 +369,7 @@ def encerrar_bolsa(
 def aprovar_bolsista(
     aluno_id: int,
     session: SessionDep,
-    current_user: CurrentUser, # Garante que está logado
-    background_tasks: BackgroundTasks
+    current_user: CurrentUser # Garante que está logado
 ):
     """
     Rota para o Professor aprovar um aluno bolsista pendente.
@@ -252,23 +399,19 @@ def aprovar_bolsista(
 
     # 5. APROVAÇÃO (Ativa a conta)
     aluno.is_active = True
-    session.add(aluno)
-    session.commit()
-    session.refresh(aluno)
 
     # 6. Envia e-mail de boas-vindas para o aluno
-    html_content = f"""
-    <h1 style="color: green;">Solicitação Aprovada!</h1>
-    <p>Olá, <b>{aluno.nome}</b>.</p>
-    <p>O Professor <b>{current_user.nome}</b> aprovou seu vínculo de bolsa.</p>
-    <p>Sua conta de Bolsista está ativa e você já pode publicar notícias.</p>
-    """
-
-    background_tasks.add_task(
-        enviar_email_simples,
-        "Sua Bolsa foi Aprovada - Jornal UFC",
+    enfileirar_email(
+        session,
+        ASSUNTO_APROVACAO,
         [aluno.email],
-        html_content
+        _email_aprovacao(aluno.nome, current_user.nome)
     )
 
+    # 7. Salva a aprovação e o e-mail juntos
+    session.add(aluno)
+    session.commit()
+    session.refresh(aluno)
+    invalidar_usuario_cache(aluno.email)
+
     return aluno
\ No newline at end of file
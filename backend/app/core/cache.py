@@ -0,0 +1,53 @@
+# app/core/cache.py
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable
+
+_AUSENTE = object()
+
+
+class TTLCache:
+    """
+    Cache em memória com limite de itens (LRU) e tempo de expiração (TTL).
+    Thread-safe: é usado tanto por rotas async quanto por rotas síncronas
+    que rodam no threadpool.
+    Cada worker tem a sua cópia, então o TTL limita quanto tempo um dado
+    pode ficar desatualizado em outro processo.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._dados: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, chave: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            item = self._dados.get(chave, _AUSENTE)
+            if item is _AUSENTE:
+                return default
+            expira_em, valor = item
+            if expira_em < time.monotonic():
+                del self._dados[chave]
+                return default
+            self._dados.move_to_end(chave)
+            return valor
+
+    def set(self, chave: Hashable, valor: Any) -> None:
+        with self._lock:
+            self._dados[chave] = (time.monotonic() + self.ttl, valor)
+            self._dados.move_to_end(chave)
+            while len(self._dados) > self.maxsize:
+                self._dados.popitem(last=False)
+
+    def delete(self, chave: Hashable) -> None:
+        with self._lock:
+            self._dados.pop(chave, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._dados.clear()
+
+    def __len__(self) -> int:
+        return len(self._dados)
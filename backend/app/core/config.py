@@ -9,12 +9,83 @@ class Settings(BaseSettings):
     # Banco de Dados
     # Atenção: O Pydantic vai tentar ler isso do arquivo .env
     DATABASE_URL: str
+    DB_ECHO: bool = False # Loga cada SQL no stdout (apenas para depuração)
+
+    # Instrumentação por requisição (contagem de queries / detector de N+1)
+    DB_QUERY_STATS: bool = True # Alimenta o /metrics e o log app.db
+    # Server-Timing / X-DB-Queries nas respostas: só em desenvolvimento (expõe
+    # contagem e tempo de queries a qualquer cliente)
+    DB_QUERY_STATS_HEADERS: bool = False
+    DB_N_PLUS_ONE_THRESHOLD: int = 10 # Mesma query repetida mais que N vezes
+    DB_N_PLUS_ONE_RAISE: bool = False # Em CI: transforma o aviso em erro
+
+    # Métricas no formato do Prometheus em /metrics (app/core/metricas.py)
+    METRICS_ENABLED: bool = True
+    METRICS_TOKEN: str | None = None # Se definido, exige "Authorization: Bearer <token>"
+
+    # Perfilador por amostragem (app/core/perfilador.py, requer pyinstrument)
+    PROFILER_ENABLED: bool = False
+    PROFILER_SAMPLE_RATE: float = 0.0 # Fração das requisições perfiladas ao acaso
+    PROFILER_TOKEN: str | None = None # "X-Profile: <token>" perfila a requisição
+    PROFILER_INTERVAL: float = 0.001 # Segundos entre amostras da pilha
+    PROFILER_DIR: str = "perfis"
+    PROFILER_MAX_POR_ROTA: int = 20 # Perfis mais antigos da rota são apagados
 
     # Segurança (JWT)
     SECRET_KEY: str = "sua_chave_super_secreta_e_aleatoria_aqui"
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
 
+    # Hash de senhas (bcrypt) em um pool de processos dedicado
+    BCRYPT_ROUNDS: int = 12 # Alterar o custo regera o hash no próximo login
+    PASSWORD_HASH_WORKERS: int = 2
+    PASSWORD_HASH_MAX_PENDING: int = 32 # Acima disso responde 503
+
+    # Limites das rotas de autenticação (app/core/rate_limit.py)
+    RATE_LIMIT_ENABLED: bool = True
+    RATE_LIMIT_BACKEND: str = "memoria" # "memoria" ou "redis" (usa REDIS_URL)
+    RATE_LIMIT_CONFIAR_PROXY: bool = False # Usa X-Forwarded-For como IP do cliente
+    RATE_LIMIT_LOGIN_IP: int = 30 # Por minuto
+    RATE_LIMIT_LOGIN_CONTA: int = 10 # Por minuto
+    RATE_LIMIT_RECUPERACAO_IP: int = 10 # Por hora
+    RATE_LIMIT_RECUPERACAO_CONTA: int = 3 # Por hora
+    RATE_LIMIT_REDEFINICAO_IP: int = 20 # Por hora
+    RATE_LIMIT_CADASTRO_IP: int = 20 # Por hora
+    AUTH_MAX_CONCORRENTES: int = 16 # Requisições de auth simultâneas por worker
+
+    # Cache do usuário autenticado (evita 1 SELECT por requisição protegida)
+    AUTH_CACHE_MAXSIZE: int = 10_000
+    AUTH_CACHE_TTL_SECONDS: int = 60
+
+    # Contadores de curtidas: intervalo entre os UPDATEs em lote
+    LIKES_FLUSH_SECONDS: float = 2.0
+
+    # Ranking "em alta" (app/services/tendencias.py)
+    TRENDING_MEIA_VIDA_HORAS: float = 12.0 # O peso de um evento cai à metade nesse tempo
+    TRENDING_PESO_VISUALIZACAO: float = 1.0
+    TRENDING_PESO_CURTIDA: float = 5.0
+    TRENDING_PESO_COMENTARIO: float = 10.0
+    TRENDING_TOP_K: int = 50 # Itens guardados por categoria (e no geral)
+    TRENDING_INTERVALO_SECONDS: float = 15.0 # Grava os eventos e recarrega o top-K
+
+    # Cache de artigos renderizados (app/services/cache_artigos.py)
+    ARTICLE_CACHE_MAXSIZE: int = 1_000
+    ARTICLE_CACHE_TTL_SECONDS: int = 300
+    # Camada compartilhada opcional (Redis ou qualquer servidor compatível)
+    REDIS_URL: str | None = None
+    ARTICLE_CACHE_REDIS_TTL_SECONDS: int = 3_600
+
+    # Uploads de imagens (app/services/midia.py), servidos em MEDIA_URL
+    MEDIA_ROOT: str = "media"
+    MEDIA_URL: str = "/media"
+    # Arquivos ainda em envio: fora de MEDIA_ROOT (nunca servidos), mas no mesmo
+    # sistema de arquivos, porque o arquivo pronto é movido com os.replace
+    UPLOAD_TMP_DIR: str = "media-tmp"
+    UPLOAD_MAX_BYTES: int = 15 * 1024 * 1024
+    THUMBNAIL_LARGURAS: list[int] = [320, 640, 1280]
+    THUMBNAIL_WORKERS: int = 2
+    THUMBNAIL_MAX_PENDING: int = 64 # Acima disso as miniaturas ficam para depois
+
     # --- CONFIGURAÇÃO CORRETA (Pydantic v2) ---
     # Removemos qualquer "class Config" e usamos apenas isto:
     model_config = SettingsConfigDict(
@@ -32,4 +103,11 @@ class Settings(BaseSettings):
     MAIL_STARTTLS: bool = True
     MAIL_SSL_TLS: bool = False
 
+    # Caixa de saída de e-mails (app/services/email_worker.py)
+    EMAIL_WORKER_EMBEDDED: bool = True # False quando o worker roda em processo separado
+    EMAIL_WORKER_POLL_SECONDS: float = 2.0
+    EMAIL_WORKER_BATCH_SIZE: int = 50 # Mensagens enviadas por conexão SMTP
+    EMAIL_MAX_TENTATIVAS: int = 6
+    EMAIL_RETRY_BASE_SECONDS: int = 30 # Espera dobra a cada tentativa
+
 settings = Settings()
\ No newline at end of file
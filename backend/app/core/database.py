@@ -1,8 +1,12 @@
 # app/core/database.py
-from typing import Annotated
+from typing import Annotated, AsyncIterator
 from fastapi import Depends
+from sqlalchemy.ext.asyncio import create_async_engine
 from sqlmodel import SQLModel, Session, create_engine
+from sqlmodel.ext.asyncio.session import AsyncSession
 from app.core.config import settings
+from app.core.instrumentation import instrumentar_engine
+from app.core.metricas import instrumentar_pool
 
 # --- CORREÇÃO AQUI ---
 # Mudamos de settings.SQLALCHEMY_DATABASE_URI para settings.DATABASE_URL
@@ -12,16 +16,45 @@ database_url = settings.DATABASE_URL
 if database_url and database_url.startswith("postgresql://"):
     database_url = database_url.replace("postgresql://", "postgresql+psycopg://")
 
+# URL assíncrona: o psycopg 3 atende os dois modos com o mesmo nome de driver;
+# no SQLite usamos o aiosqlite.
+async_database_url = database_url
+if async_database_url.startswith("sqlite://"):
+    async_database_url = async_database_url.replace("sqlite://", "sqlite+aiosqlite://", 1)
+
 # Criação da Engine
-engine = create_engine(database_url, echo=True)
+engine = create_engine(database_url, echo=settings.DB_ECHO)
+
+# Engine assíncrona: as esperas pelo banco liberam o event loop em vez de
+# ocupar uma thread do threadpool durante toda a requisição
+async_engine = create_async_engine(async_database_url, echo=settings.DB_ECHO)
+
+# Contagem de queries, tempo de banco e detector de N+1 por requisição
+if settings.DB_QUERY_STATS:
+    instrumentar_engine(engine)
+    instrumentar_engine(async_engine.sync_engine)
+
+# Espera por conexão e ocupação dos pools (expostas em /metrics)
+if settings.METRICS_ENABLED:
+    instrumentar_pool(engine, "sync")
+    instrumentar_pool(async_engine.sync_engine, "async")
 
 # Função Geradora de Sessão
 def get_session():
     with Session(engine) as session:
         yield session
 
+# expire_on_commit=False: evita recarregar (com I/O implícito) os atributos
+# após o commit, o que não é permitido em uma sessão assíncrona
+async def get_async_session() -> AsyncIterator[AsyncSession]:
+    async with AsyncSession(async_engine, expire_on_commit=False) as session:
+        yield session
+
 # Injeção de Dependência
 SessionDep = Annotated[Session, Depends(get_session)]
+AsyncSessionDep = Annotated[AsyncSession, Depends(get_async_session)]
 
+# Apenas para scripts e testes locais: em produção o esquema vem das
+# migrações do Alembic (pasta migrations/)
 def create_db_and_tables():
-    SQLModel.metadata.create_all(engine)
\ No newline at end of file
+    SQLModel.metadata.create_all(engine)
@@ -2,14 +2,16 @@
 from typing import Annotated
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from jose import jwt, JWTError
 from pydantic import ValidationError
 from sqlmodel import select
 
+from app.core.cache import TTLCache
 from app.core.config import settings
-from app.core.database import SessionDep
-from app.models.usuario import Usuario
+from app.core.database import AsyncSessionDep
+from app.core.security import decode_access_token
+from app.models.usuario import Usuario, RoleEnum
 from app.schemas.token import TokenData
+from app.schemas.usuario import UsuarioAutenticado
 
 # 1. Configura o Swagger para saber onde pegar o token
 # O caminho deve bater com sua rota de login (/api/v1/auth/login)
@@ -17,10 +19,24 @@ reusable_oauth2 = OAuth2PasswordBearer(
     tokenUrl=f"{settings.API_V1_STR}/auth/login"
 )
 
-def get_current_user(
-    session: SessionDep, 
+# Cache do usuário autenticado, indexado pelo "sub" do token (e-mail).
+# Toda rota que muda perfil, ativação ou senha deve chamar
+# invalidar_usuario_cache; o TTL cobre os demais workers.
+usuarios_autenticados = TTLCache(
+    maxsize=settings.AUTH_CACHE_MAXSIZE,
+    ttl=settings.AUTH_CACHE_TTL_SECONDS
+)
+
+def invalidar_usuario_cache(email: str) -> None:
+    """
+    Remove o usuário do cache de autenticação (após mudar role, ativação ou senha).
+    """
+    usuarios_autenticados.delete(email)
+
+async def get_current_user(
+    session: AsyncSessionDep, 
     token: Annotated[str, Depends(reusable_oauth2)]
-) -> Usuario:
+) -> UsuarioAutenticado:
     """
     Função que valida o Token JWT e retorna o Usuário logado.
     Se o token for inválido ou expirado, lança erro 401.
@@ -31,11 +47,12 @@ def get_current_user(
         headers={"WWW-Authenticate": "Bearer"},
     )
     
+    # 2. Decodifica o Token JWT usando a SECRET_KEY
+    payload = decode_access_token(token)
+    if payload is None:
+        raise credentials_exception
+
     try:
-        # 2. Decodifica o Token JWT usando a SECRET_KEY
-        payload = jwt.decode(
-            token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]
-        )
         email: str = payload.get("sub")
         
         if email is None:
@@ -43,14 +60,20 @@ def get_current_user(
             
         token_data = TokenData(email=email)
         
-    except (JWTError, ValidationError):
+    except ValidationError:
         raise credentials_exception
 
-    # 3. Busca o usuário no banco de dados
-    user = session.exec(select(Usuario).where(Usuario.email == token_data.email)).first()
-    
+    # 3. Busca o usuário no cache e, se não estiver lá, no banco de dados
+    user = usuarios_autenticados.get(token_data.email)
+
     if user is None:
-        raise credentials_exception
+        usuario = (await session.exec(select(Usuario).where(Usuario.email == token_data.email))).first()
+
+        if usuario is None:
+            raise credentials_exception
+
+        user = UsuarioAutenticado.model_validate(usuario)
+        usuarios_autenticados.set(token_data.email, user)
         
     # 4. Bloqueia se a conta estiver inativa (ainda não ativou o email)
     if not user.is_active:
@@ -60,4 +83,32 @@ def get_current_user(
 
 # Atalho para usar nas rotas: CurrentUser
 # Ao colocar isso na função da rota, o FastAPI exige login automaticamente
-CurrentUser = Annotated[Usuario, Depends(get_current_user)]
\ No newline at end of file
+CurrentUser = Annotated[UsuarioAutenticado, Depends(get_current_user)]
+
+def get_current_admin(current_user: CurrentUser) -> UsuarioAutenticado:
+    """
+    Exige um usuário logado com perfil de administrador.
+    """
+    if current_user.role != RoleEnum.ADMIN:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Apenas administradores podem acessar este recurso."
+        )
+    return current_user
+
+# Atalho para rotas administrativas
+AdminUser = Annotated[UsuarioAutenticado, Depends(get_current_admin)]
+
+def get_current_editor(current_user: CurrentUser) -> UsuarioAutenticado:
+    """
+    Exige um usuário que publica conteúdo (admin, professor ou bolsista).
+    """
+    if current_user.role == RoleEnum.LEITOR:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Apenas editores podem enviar arquivos."
+        )
+    return current_user
+
+# Atalho para rotas de edição de conteúdo
+EditorUser = Annotated[UsuarioAutenticado, Depends(get_current_editor)]
@@ -1,26 +1,38 @@
 # app/core/email.py
-from fastapi_mail import FastMail, MessageSchema, ConnectionConfig, MessageType # type: ignore
+from functools import lru_cache
 from pydantic import EmailStr
+from sqlalchemy import insert
 from app.core.config import settings
+from app.models.email import EmailOutbox
 from typing import List
 
-# Configuração da biblioteca usando nossas variáveis de ambiente
-conf = ConnectionConfig(
-    MAIL_USERNAME=settings.MAIL_USERNAME,
-    MAIL_PASSWORD=settings.MAIL_PASSWORD,
-    MAIL_FROM=settings.MAIL_FROM,
-    MAIL_PORT=settings.MAIL_PORT,
-    MAIL_SERVER=settings.MAIL_SERVER,
-    MAIL_STARTTLS=settings.MAIL_STARTTLS,
-    MAIL_SSL_TLS=settings.MAIL_SSL_TLS,
-    USE_CREDENTIALS=True,
-    VALIDATE_CERTS=True
-)
+# As rotas só gravam na caixa de saída (enfileirar_email). O fastapi_mail
+# (jinja2 e companhia, ~0,2 s de import) só é carregado se alguém enviar
+# direto por enviar_email_simples.
+
+@lru_cache
+def get_mail_config():
+    """Configuração da biblioteca usando nossas variáveis de ambiente (criada no primeiro uso)."""
+    from fastapi_mail import ConnectionConfig # type: ignore
+
+    return ConnectionConfig(
+        MAIL_USERNAME=settings.MAIL_USERNAME,
+        MAIL_PASSWORD=settings.MAIL_PASSWORD,
+        MAIL_FROM=settings.MAIL_FROM,
+        MAIL_PORT=settings.MAIL_PORT,
+        MAIL_SERVER=settings.MAIL_SERVER,
+        MAIL_STARTTLS=settings.MAIL_STARTTLS,
+        MAIL_SSL_TLS=settings.MAIL_SSL_TLS,
+        USE_CREDENTIALS=True,
+        VALIDATE_CERTS=True
+    )
 
 async def enviar_email_simples(assunto: str, emails_destino: List[EmailStr], corpo_html: str):
     """
     Envia um e-mail assíncrono.
     """
+    from fastapi_mail import FastMail, MessageSchema, MessageType # type: ignore
+
     message = MessageSchema(
         subject=assunto,
         recipients=emails_destino,
@@ -28,5 +40,40 @@ async def enviar_email_simples(assunto: str, emails_destino: List[EmailStr], cor
         subtype=MessageType.html
     )
 
-    fm = FastMail(conf)
-    await fm.send_message(message)
\ No newline at end of file
+    fm = FastMail(get_mail_config())
+    await fm.send_message(message)
+
+def enfileirar_email(session, assunto: str, emails_destino: List[EmailStr], corpo_html: str) -> EmailOutbox:
+    """
+    Grava o e-mail na caixa de saída usando a sessão da rota.
+    O envio acontece quando a transação é confirmada (commit) e o worker
+    processa a fila; se a transação falhar, o e-mail também não sai.
+    Aceita tanto Session quanto AsyncSession (session.add é síncrono).
+    """
+    email = EmailOutbox(
+        assunto=assunto,
+        destinatarios=[str(e) for e in emails_destino],
+        corpo_html=corpo_html
+    )
+    session.add(email)
+    return email
+
+
+async def enfileirar_emails_em_lote(session, mensagens: List[tuple[str, List[EmailStr], str]]) -> None:
+    """
+    Como enfileirar_email, para várias mensagens (assunto, destinatários,
+    corpo) de uma vez: um único INSERT em lote na transação da AsyncSession,
+    em vez de um INSERT ... RETURNING por e-mail no flush do ORM.
+    """
+    if not mensagens:
+        return
+    linhas = [
+        EmailOutbox(
+            assunto=assunto,
+            destinatarios=[str(e) for e in emails_destino],
+            corpo_html=corpo_html
+        ).model_dump(exclude={"id"})
+        for assunto, emails_destino, corpo_html in mensagens
+    ]
+    conexao = await session.connection()
+    await conexao.execute(insert(EmailOutbox.__table__), linhas)
@@ -0,0 +1,33 @@
+# app/core/hashing.py
+from functools import lru_cache
+
+# Funções executadas dentro dos processos do pool de hash (ver security.py).
+# Este módulo não importa settings nem o resto da aplicação, para que cada
+# processo filho suba rápido e sem precisar das variáveis de ambiente.
+# O passlib só é importado no primeiro hash, não na subida da API.
+
+@lru_cache
+def get_crypt_context(rounds: int) -> "CryptContext":
+    """
+    Contexto bcrypt com custo fixo: hashes com outro custo (maior ou menor)
+    são marcados como desatualizados e regerados no próximo login.
+    """
+    from passlib.context import CryptContext
+
+    return CryptContext(
+        schemes=["bcrypt"],
+        deprecated="auto",
+        bcrypt__rounds=rounds,
+        bcrypt__min_rounds=rounds,
+        bcrypt__max_rounds=rounds,
+    )
+
+def hash_senha(senha: str, rounds: int) -> str:
+    return get_crypt_context(rounds).hash(senha)
+
+def verificar_e_atualizar(senha: str, senha_hash: str, rounds: int) -> tuple[bool, str | None]:
+    """
+    Retorna (senha_correta, novo_hash). novo_hash só vem preenchido quando a
+    senha confere e o hash salvo usa um custo diferente do configurado.
+    """
+    return get_crypt_context(rounds).verify_and_update(senha, senha_hash)
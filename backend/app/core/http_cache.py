@@ -0,0 +1,76 @@
+# app/core/http_cache.py
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from fastapi import Request, Response, status
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from app.models.versao import VersaoColecao
+
+# GET condicional (ETag / Last-Modified).
+# O cliente (ou a CDN) reenvia If-None-Match / If-Modified-Since e, se nada
+# mudou, respondemos 304 sem carregar nem serializar o conteúdo.
+
+# "no-cache" = pode guardar, mas deve revalidar antes de reutilizar
+CACHE_CONTROL = "public, no-cache"
+
+
+def gerar_etag(*partes) -> str:
+    return 'W/"' + "-".join(str(p) for p in partes) + '"'
+
+
+def _para_utc(momento: datetime) -> datetime:
+    # As datas do banco são "naive" em horário local (datetime.now)
+    if momento.tzinfo is None:
+        momento = momento.astimezone()
+    # HTTP-date tem resolução de segundos
+    return momento.astimezone(timezone.utc).replace(microsecond=0)
+
+
+def cabecalhos_cache(etag: str, ultima_modificacao: datetime | None) -> dict[str, str]:
+    cabecalhos = {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+    if ultima_modificacao is not None:
+        cabecalhos["Last-Modified"] = format_datetime(_para_utc(ultima_modificacao), usegmt=True)
+    return cabecalhos
+
+
+def resposta_nao_modificada(
+    request: Request, etag: str, ultima_modificacao: datetime | None
+) -> Response | None:
+    """
+    Retorna uma resposta 304 se a cópia do cliente ainda é válida, ou None
+    se o conteúdo precisa ser enviado. If-None-Match tem precedência sobre
+    If-Modified-Since (RFC 9110).
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if_modified_since = request.headers.get("if-modified-since")
+    valido = False
+
+    if if_none_match is not None:
+        # Comparação fraca: ignora o prefixo W/
+        recebidas = {t.strip().removeprefix("W/") for t in if_none_match.split(",")}
+        valido = "*" in recebidas or etag.removeprefix("W/") in recebidas
+
+    elif if_modified_since is not None and ultima_modificacao is not None:
+        try:
+            desde = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            desde = None
+        if desde is not None and desde.tzinfo is not None:
+            valido = _para_utc(ultima_modificacao) <= desde
+
+    if not valido:
+        return None
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers=cabecalhos_cache(etag, ultima_modificacao)
+    )
+
+
+async def versao_colecao(session: AsyncSession, nome: str) -> tuple[int, datetime | None]:
+    """
+    Versão atual de uma coleção (lookup pela PK), para ETag das listagens.
+    """
+    versao = await session.get(VersaoColecao, nome)
+    if versao is None:
+        return 0, None
+    return versao.versao, versao.atualizado_em
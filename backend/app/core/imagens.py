@@ -0,0 +1,49 @@
+# app/core/imagens.py
+import os
+
+# Funções executadas dentro dos processos do pool de miniaturas (ver
+# app/services/midia.py). Assim como hashing.py, este módulo não importa
+# settings nem o resto da aplicação.
+
+# Assinaturas (magic bytes) dos formatos aceitos -> extensão do arquivo
+FORMATOS_IMAGEM = {
+    b"\xff\xd8\xff": "jpg",
+    b"\x89PNG\r\n\x1a\n": "png",
+    b"GIF87a": "gif",
+    b"GIF89a": "gif",
+}
+
+def detectar_formato(inicio: bytes) -> str | None:
+    """Extensão da imagem a partir dos primeiros bytes (ignora o Content-Type do cliente)."""
+    if inicio[:4] == b"RIFF" and inicio[8:12] == b"WEBP":
+        return "webp"
+    for assinatura, extensao in FORMATOS_IMAGEM.items():
+        if inicio.startswith(assinatura):
+            return extensao
+    return None
+
+def gerar_miniaturas(origem: str, destinos: dict[int, str], qualidade: int = 80) -> list[str]:
+    """
+    Gera uma versão WebP de `origem` para cada largura em `destinos`
+    ({largura: caminho}). Nunca amplia a imagem; miniaturas já existentes
+    são mantidas. Cada arquivo é gravado com nome temporário e renomeado,
+    para que o servidor estático nunca entregue um arquivo pela metade.
+    """
+    from PIL import Image, ImageOps
+
+    gerados = []
+    with Image.open(origem) as imagem:
+        imagem = ImageOps.exif_transpose(imagem)
+        if imagem.mode not in ("RGB", "RGBA"):
+            imagem = imagem.convert("RGBA" if "transparency" in imagem.info else "RGB")
+
+        for largura, destino in sorted(destinos.items()):
+            if os.path.exists(destino):
+                continue
+            copia = imagem.copy()
+            copia.thumbnail((largura, largura * 4))
+            temporario = f"{destino}.{os.getpid()}.tmp"
+            copia.save(temporario, "WEBP", quality=qualidade)
+            os.replace(temporario, destino)
+            gerados.append(destino)
+    return gerados
@@ -0,0 +1,141 @@
+# app/core/instrumentation.py
+import json
+import logging
+import time
+from collections import Counter
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from app.core.config import settings
+
+logger = logging.getLogger("app.db")
+
+
+class NPlusOneError(RuntimeError):
+    """Disparado quando DB_N_PLUS_ONE_RAISE está ativo e um N+1 é detectado."""
+
+
+@dataclass
+class EstatisticasDB:
+    """Acumula as queries executadas durante uma requisição."""
+    queries: int = 0
+    tempo_total: float = 0.0
+    mais_lenta_tempo: float = 0.0
+    mais_lenta_sql: str | None = None
+    repeticoes: Counter = field(default_factory=Counter)
+    suspeitas_n_mais_um: set[str] = field(default_factory=set)
+
+    def registrar(self, sql: str, duracao: float) -> None:
+        self.queries += 1
+        self.tempo_total += duracao
+        if duracao > self.mais_lenta_tempo:
+            self.mais_lenta_tempo = duracao
+            self.mais_lenta_sql = sql
+
+        # O texto do SQL é parametrizado (valores vão à parte), então a mesma
+        # query com ids diferentes conta como repetição: o padrão do N+1
+        self.repeticoes[sql] += 1
+        if (
+            self.repeticoes[sql] > settings.DB_N_PLUS_ONE_THRESHOLD
+            and sql not in self.suspeitas_n_mais_um
+        ):
+            self.suspeitas_n_mais_um.add(sql)
+            logger.warning(
+                "Possível N+1: query repetida mais de %s vezes na mesma requisição: %s",
+                settings.DB_N_PLUS_ONE_THRESHOLD, sql
+            )
+            if settings.DB_N_PLUS_ONE_RAISE:
+                raise NPlusOneError(f"N+1 detectado: {sql}")
+
+
+# Estatísticas da requisição atual (None fora de uma requisição HTTP).
+# O objeto é mutável, então as threads do threadpool e os greenlets do
+# SQLAlchemy assíncrono, que herdam o contexto, somam no mesmo lugar.
+_estatisticas: ContextVar[EstatisticasDB | None] = ContextVar("estatisticas_db", default=None)
+
+
+def estatisticas_atuais() -> EstatisticasDB | None:
+    return _estatisticas.get()
+
+
+def _antes_de_executar(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("inicio_query", []).append(time.perf_counter())
+
+
+def _depois_de_executar(conn, cursor, statement, parameters, context, executemany):
+    inicio = conn.info["inicio_query"].pop()
+    estatisticas = _estatisticas.get()
+    if estatisticas is not None:
+        estatisticas.registrar(statement, time.perf_counter() - inicio)
+
+
+def _erro_ao_executar(exception_context):
+    # Mantém a pilha de inícios consistente quando a query falha
+    pilha = exception_context.connection.info.get("inicio_query") if exception_context.connection else None
+    if pilha:
+        pilha.pop()
+
+
+def instrumentar_engine(engine: Engine) -> None:
+    """
+    Registra os eventos de medição na engine (para a assíncrona, passe
+    `async_engine.sync_engine`).
+    """
+    event.listen(engine, "before_cursor_execute", _antes_de_executar)
+    event.listen(engine, "after_cursor_execute", _depois_de_executar)
+    event.listen(engine, "handle_error", _erro_ao_executar)
+
+
+class DBStatsMiddleware:
+    """
+    Middleware ASGI que mede as queries de cada requisição e expõe o resumo
+    em um log estruturado (JSON) no logger app.db e, com
+    DB_QUERY_STATS_HEADERS, nos cabeçalhos Server-Timing e X-DB-Queries.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        estatisticas = EstatisticasDB()
+        token = _estatisticas.set(estatisticas)
+        status_code = 500
+
+        async def send_com_cabecalhos(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            if message["type"] == "http.response.start" and settings.DB_QUERY_STATS_HEADERS:
+                cabecalhos = list(message.get("headers", []))
+                cabecalhos.append((
+                    b"server-timing",
+                    (
+                        f'db;dur={estatisticas.tempo_total * 1000:.1f};'
+                        f'desc="{estatisticas.queries} queries"'
+                    ).encode()
+                ))
+                cabecalhos.append((b"x-db-queries", str(estatisticas.queries).encode()))
+                message = {**message, "headers": cabecalhos}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_com_cabecalhos)
+        finally:
+            _estatisticas.reset(token)
+            if estatisticas.queries:
+                logger.info(json.dumps({
+                    "evento": "db_requisicao",
+                    "metodo": scope["method"],
+                    "rota": scope["path"],
+                    "status": status_code,
+                    "queries": estatisticas.queries,
+                    "db_ms": round(estatisticas.tempo_total * 1000, 2),
+                    "mais_lenta_ms": round(estatisticas.mais_lenta_tempo * 1000, 2),
+                    "mais_lenta_sql": estatisticas.mais_lenta_sql,
+                    "suspeitas_n_mais_um": len(estatisticas.suspeitas_n_mais_um),
+                }, ensure_ascii=False))
@@ -0,0 +1,273 @@
+# app/core/metricas.py
+import bisect
+import threading
+import time
+from typing import Callable, Iterable
+from sqlalchemy.engine import Engine
+from starlette.routing import Mount
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+from app.core.instrumentation import estatisticas_atuais
+
+# Métricas no formato texto do Prometheus (exposition format 0.0.4), sem
+# dependências externas. Cada worker do uvicorn tem o seu registro: com
+# vários workers, cada scrape vê apenas o processo que atendeu.
+
+LIMITES_PADRAO = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+Rotulos = tuple[tuple[str, str], ...]
+
+
+def _rotulos(valores: dict[str, str]) -> Rotulos:
+    return tuple(sorted((chave, str(valor)) for chave, valor in valores.items()))
+
+
+def _formatar_rotulos(rotulos: Rotulos, extra: Rotulos = ()) -> str:
+    todos = rotulos + extra
+    if not todos:
+        return ""
+    escapar = lambda v: v.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+    return "{" + ",".join(f'{chave}="{escapar(valor)}"' for chave, valor in todos) + "}"
+
+
+def _formatar_numero(valor: float) -> str:
+    if valor == float("inf"):
+        return "+Inf"
+    return repr(float(valor)) if not float(valor).is_integer() else str(int(valor))
+
+
+class Metrica:
+    tipo = ""
+
+    def __init__(self, nome: str, ajuda: str):
+        self.nome = nome
+        self.ajuda = ajuda
+        self._lock = threading.Lock()
+
+    def amostras(self) -> Iterable[str]:
+        raise NotImplementedError
+
+    def renderizar(self) -> str:
+        linhas = [f"# HELP {self.nome} {self.ajuda}", f"# TYPE {self.nome} {self.tipo}"]
+        linhas.extend(self.amostras())
+        return "\n".join(linhas)
+
+
+class Contador(Metrica):
+    tipo = "counter"
+
+    def __init__(self, nome: str, ajuda: str):
+        super().__init__(nome, ajuda)
+        self._valores: dict[Rotulos, float] = {}
+
+    def inc(self, valor: float = 1, **rotulos) -> None:
+        chave = _rotulos(rotulos)
+        with self._lock:
+            self._valores[chave] = self._valores.get(chave, 0) + valor
+
+    def amostras(self):
+        with self._lock:
+            itens = list(self._valores.items())
+        for rotulos, valor in itens:
+            yield f"{self.nome}{_formatar_rotulos(rotulos)} {_formatar_numero(valor)}"
+
+
+class Medidor(Metrica):
+    """
+    Valor instantâneo. Pode ser definido com .definir() ou calculado na hora
+    do scrape por `coletar`, que devolve [(rotulos, valor), ...].
+    """
+    tipo = "gauge"
+
+    def __init__(self, nome: str, ajuda: str, coletar: Callable[[], Iterable[tuple[dict, float]]] | None = None):
+        super().__init__(nome, ajuda)
+        self._valores: dict[Rotulos, float] = {}
+        self._coletar = coletar
+
+    def definir(self, valor: float, **rotulos) -> None:
+        with self._lock:
+            self._valores[_rotulos(rotulos)] = valor
+
+    def amostras(self):
+        if self._coletar is not None:
+            itens = [(_rotulos(rotulos), valor) for rotulos, valor in self._coletar()]
+        else:
+            with self._lock:
+                itens = list(self._valores.items())
+        for rotulos, valor in itens:
+            yield f"{self.nome}{_formatar_rotulos(rotulos)} {_formatar_numero(valor)}"
+
+
+class Histograma(Metrica):
+    tipo = "histogram"
+
+    def __init__(self, nome: str, ajuda: str, limites: tuple[float, ...] = LIMITES_PADRAO):
+        super().__init__(nome, ajuda)
+        self.limites = tuple(sorted(limites))
+        # rotulos -> [contagem por faixa (não cumulativa)..., soma, total]
+        self._series: dict[Rotulos, list[float]] = {}
+
+    def observar(self, valor: float, **rotulos) -> None:
+        chave = _rotulos(rotulos)
+        faixa = bisect.bisect_left(self.limites, valor)
+        with self._lock:
+            serie = self._series.get(chave)
+            if serie is None:
+                serie = self._series[chave] = [0] * (len(self.limites) + 1) + [0.0, 0]
+            serie[faixa] += 1
+            serie[-2] += valor
+            serie[-1] += 1
+
+    def amostras(self):
+        with self._lock:
+            itens = [(rotulos, list(serie)) for rotulos, serie in self._series.items()]
+        for rotulos, serie in itens:
+            acumulado = 0
+            for limite, contagem in zip(self.limites + (float("inf"),), serie):
+                acumulado += contagem
+                le = (("le", _formatar_numero(limite)),)
+                yield f"{self.nome}_bucket{_formatar_rotulos(rotulos, le)} {acumulado}"
+            yield f"{self.nome}_sum{_formatar_rotulos(rotulos)} {_formatar_numero(serie[-2])}"
+            yield f"{self.nome}_count{_formatar_rotulos(rotulos)} {serie[-1]}"
+
+
+class Registro:
+    def __init__(self):
+        self._metricas: dict[str, Metrica] = {}
+
+    def registrar(self, metrica: Metrica) -> Metrica:
+        self._metricas[metrica.nome] = metrica
+        return metrica
+
+    def renderizar(self) -> str:
+        return "\n".join(m.renderizar() for m in self._metricas.values()) + "\n"
+
+
+REGISTRO = Registro()
+
+def contador(nome: str, ajuda: str) -> Contador:
+    return REGISTRO.registrar(Contador(nome, ajuda))
+
+def medidor(nome: str, ajuda: str, coletar=None) -> Medidor:
+    return REGISTRO.registrar(Medidor(nome, ajuda, coletar))
+
+def histograma(nome: str, ajuda: str, limites: tuple[float, ...] = LIMITES_PADRAO) -> Histograma:
+    return REGISTRO.registrar(Histograma(nome, ajuda, limites))
+
+
+# --- HTTP ---
+http_requisicoes = contador(
+    "http_requisicoes_total", "Requisições HTTP atendidas, por rota e status."
+)
+http_duracao = histograma(
+    "http_requisicao_duracao_segundos", "Tempo de resposta por rota (até o fim do corpo)."
+)
+http_db_duracao = histograma(
+    "http_requisicao_db_segundos", "Tempo gasto no banco por requisição, por rota."
+)
+http_db_queries = contador(
+    "http_requisicao_db_queries_total", "Queries executadas, por rota."
+)
+
+
+def _modelo_rota(scope) -> str:
+    """
+    Modelo completo da rota atendida (/api/v1/noticias/{slug}). Conforme a
+    versão do FastAPI, o path_format da rota incluída vem com ou sem o
+    prefixo do router; o prefixo é recuperado do caminho real.
+    """
+    rota = scope.get("route")
+    if isinstance(rota, Mount):
+        return f"{rota.path}/{{path}}"
+    modelo = getattr(rota, "path_format", None)
+    if not modelo:
+        return "sem_rota" # 404 e redirecionamentos: um rótulo só
+    partes = scope["path"].split("/")
+    return "/".join(partes[:max(1, len(partes) - modelo.count("/"))]) + modelo
+
+
+class MetricasMiddleware:
+    """
+    Middleware ASGI que alimenta as métricas HTTP. O rótulo `rota` é o
+    modelo da rota (/api/v1/noticias/{slug}), nunca o caminho cru, para que
+    o número de séries não cresça com slugs e ids.
+    Deve ficar DENTRO do DBStatsMiddleware para enxergar o tempo de banco.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        inicio = time.perf_counter()
+        status_code = 500
+
+        async def send_medido(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_medido)
+        finally:
+            rota = _modelo_rota(scope)
+            metodo = scope["method"]
+            http_requisicoes.inc(metodo=metodo, rota=rota, status=status_code)
+            http_duracao.observar(time.perf_counter() - inicio, metodo=metodo, rota=rota)
+
+            estatisticas = estatisticas_atuais()
+            if estatisticas is not None and estatisticas.queries:
+                http_db_duracao.observar(estatisticas.tempo_total, metodo=metodo, rota=rota)
+                http_db_queries.inc(estatisticas.queries, metodo=metodo, rota=rota)
+
+
+# --- POOL DE CONEXÕES ---
+_engines: dict[str, Engine] = {}
+
+db_pool_espera = histograma(
+    "db_pool_espera_segundos", "Tempo para obter uma conexão do pool (inclui abrir conexões novas).",
+    (0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0)
+)
+db_pool_timeouts = contador(
+    "db_pool_timeouts_total", "Pedidos de conexão que estouraram o pool_timeout."
+)
+
+
+def _coletar_pool(atributo: str):
+    def coletar():
+        for nome, engine in _engines.items():
+            funcao = getattr(engine.pool, atributo, None)
+            if funcao is not None: # NullPool/StaticPool não têm contadores
+                yield {"engine": nome}, funcao()
+    return coletar
+
+medidor("db_pool_em_uso", "Conexões emprestadas (checked out).", _coletar_pool("checkedout"))
+medidor("db_pool_ociosas", "Conexões abertas e livres no pool.", _coletar_pool("checkedin"))
+medidor("db_pool_tamanho", "Tamanho configurado do pool (pool_size).", _coletar_pool("size"))
+medidor("db_pool_overflow", "Conexões além do pool_size (negativo: vagas ainda não abertas).", _coletar_pool("overflow"))
+
+
+def instrumentar_pool(engine: Engine, nome: str) -> None:
+    """
+    Mede o tempo de espera por conexão no pool da engine (para a assíncrona,
+    passe `async_engine.sync_engine`) e expõe os contadores do pool.
+    """
+    _engines[nome] = engine
+    pool = engine.pool
+    conectar_original = pool.connect
+
+    def conectar_medido():
+        inicio = time.perf_counter()
+        try:
+            return conectar_original()
+        except PoolTimeoutError:
+            db_pool_timeouts.inc(engine=nome)
+            raise
+        finally:
+            db_pool_espera.observar(time.perf_counter() - inicio, engine=nome)
+
+    pool.connect = conectar_medido
@@ -0,0 +1,33 @@
+# app/core/pagination.py
+import base64
+import binascii
+from datetime import datetime
+from fastapi import HTTPException, status
+
+
+# Paginação por cursor (keyset): em vez de OFFSET, o cliente devolve a chave
+# (data, id) do último item recebido. O custo de qualquer página é o mesmo
+# da primeira, pois o banco desce direto no índice a partir dessa chave.
+
+def encode_cursor(momento: datetime, item_id: int) -> str:
+    """
+    Gera um cursor opaco a partir da chave de ordenação do último item.
+    """
+    bruto = f"{momento.isoformat()}|{item_id}".encode()
+    return base64.urlsafe_b64encode(bruto).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    """
+    Converte o cursor de volta para (data, id).
+    Cursores adulterados ou malformados geram erro 400.
+    """
+    try:
+        preenchido = cursor + "=" * (-len(cursor) % 4)
+        momento, item_id = base64.urlsafe_b64decode(preenchido).decode().split("|")
+        return datetime.fromisoformat(momento), int(item_id)
+    except (ValueError, binascii.Error, UnicodeDecodeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Cursor de paginação inválido."
+        )
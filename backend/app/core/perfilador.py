@@ -0,0 +1,187 @@
+# app/core/perfilador.py
+import asyncio
+import json
+import logging
+import os
+import random
+import re
+import secrets
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+from app.core.config import settings
+from app.core.metricas import _modelo_rota
+
+logger = logging.getLogger("app.perfilador")
+
+# Perfilador por amostragem (pyinstrument) ligado em produção sem redeploy:
+# 1. Uma fração PROFILER_SAMPLE_RATE das requisições é perfilada ao acaso.
+# 2. Qualquer requisição com "X-Profile: <PROFILER_TOKEN>" também é, e a
+#    resposta traz "X-Profile-Id" para buscar o resultado em /admin/perfis.
+#
+# O pyinstrument amostra a pilha a cada PROFILER_INTERVAL segundos em vez de
+# rastrear cada chamada, então o custo na requisição perfilada é pequeno e
+# nas demais é zero. O perfil cobre a thread do event loop: o bcrypt (pool de
+# processos) e as queries assíncronas aparecem como o `await` que esperou por
+# eles, e a validação do pydantic aparece com as próprias funções.
+#
+# Os resultados ficam em PROFILER_DIR/<rota>/<id>.* (metadados, HTML,
+# speedscope para flame graph e pstats), no máximo PROFILER_MAX_POR_ROTA por
+# rota. No disco, e não na memória, para que o endpoint de admin enxergue os
+# perfis de todos os workers.
+
+CABECALHO = b"x-profile"
+FORMATOS = {
+    "html": ("html", "text/html; charset=utf-8"),
+    "speedscope": ("speedscope.json", "application/json"),
+    "pstats": ("pstats", "application/octet-stream"),
+}
+_ID_VALIDO = re.compile(r"^[0-9]+-[0-9]+-[0-9a-f]+$")
+_tarefas: set[asyncio.Task] = set() # Referências das gravações em andamento
+
+
+def _diretorio_rota(metodo: str, rota: str) -> str:
+    # "GET /api/v1/noticias/{slug}" -> "GET_api_v1_noticias_slug"
+    return re.sub(r"[^A-Za-z0-9]+", "_", f"{metodo} {rota}").strip("_")
+
+
+def _salvar(sessao, meta: dict) -> None:
+    """Renderiza e grava o perfil; roda em thread, depois da resposta enviada."""
+    from pyinstrument.renderers import HTMLRenderer, PstatsRenderer, SpeedscopeRenderer
+
+    pasta = Path(settings.PROFILER_DIR) / _diretorio_rota(meta["metodo"], meta["rota"])
+    pasta.mkdir(parents=True, exist_ok=True)
+    base = pasta / meta["id"]
+
+    base.with_suffix(".html").write_text(HTMLRenderer().render(sessao), encoding="utf-8")
+    Path(f"{base}.speedscope.json").write_text(SpeedscopeRenderer().render(sessao), encoding="utf-8")
+    # PstatsRenderer devolve os bytes do marshal em str (utf-8 + surrogateescape)
+    pstats = PstatsRenderer().render(sessao).encode("utf-8", errors="surrogateescape")
+    Path(f"{base}.pstats").write_bytes(pstats)
+    # Metadados por último: o perfil só aparece na listagem quando está completo
+    base.with_suffix(".json").write_text(json.dumps(meta), encoding="utf-8")
+
+    # Retenção: mantém só os mais recentes da rota
+    metas = sorted(pasta.glob("*.json"), key=lambda p: p.name)
+    metas = [p for p in metas if not p.name.endswith(".speedscope.json")]
+    for antigo in metas[:-settings.PROFILER_MAX_POR_ROTA]:
+        _remover(pasta, antigo.stem)
+
+
+def _remover(pasta: Path, perfil_id: str) -> None:
+    for sufixo in (".json", ".html", ".speedscope.json", ".pstats"):
+        (pasta / f"{perfil_id}{sufixo}").unlink(missing_ok=True)
+
+
+def _caminho_perfil(perfil_id: str) -> Path | None:
+    if not _ID_VALIDO.match(perfil_id):
+        return None
+    encontrados = list(Path(settings.PROFILER_DIR).glob(f"*/{perfil_id}.json"))
+    return encontrados[0] if encontrados else None
+
+
+def listar_perfis(rota: str | None = None, limite: int = 100) -> list[dict]:
+    """Metadados dos perfis guardados, do mais recente para o mais antigo."""
+    raiz = Path(settings.PROFILER_DIR)
+    if not raiz.is_dir():
+        return []
+    metas = []
+    for caminho in raiz.glob("*/*.json"):
+        if caminho.name.endswith(".speedscope.json"):
+            continue
+        try:
+            meta = json.loads(caminho.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            continue # Removido pela retenção no meio da listagem
+        if rota is None or meta["rota"] == rota:
+            metas.append(meta)
+    metas.sort(key=lambda m: m["id"], reverse=True)
+    return metas[:limite]
+
+
+def arquivo_perfil(perfil_id: str, formato: str) -> tuple[Path, str] | None:
+    """Caminho e media type de um perfil no formato pedido (None se não existe)."""
+    meta = _caminho_perfil(perfil_id)
+    if meta is None:
+        return None
+    sufixo, media_type = FORMATOS[formato]
+    caminho = meta.parent / f"{perfil_id}.{sufixo}"
+    return (caminho, media_type) if caminho.is_file() else None
+
+
+class PerfiladorMiddleware:
+    """
+    Middleware ASGI que perfila uma amostra das requisições (ver o topo do
+    módulo). Fica por fora dos demais middlewares para que o perfil inclua
+    o custo deles.
+    """
+
+    def __init__(self, app):
+        try:
+            from pyinstrument import Profiler
+        except ImportError as exc:
+            raise RuntimeError(
+                "PROFILER_ENABLED=True, mas o pacote 'pyinstrument' não está instalado."
+            ) from exc
+        self.app = app
+        self._profiler = Profiler
+        self._token = (settings.PROFILER_TOKEN or "").encode()
+
+    def _pedido_explicito(self, scope) -> bool:
+        if not self._token:
+            return False
+        for nome, valor in scope["headers"]:
+            if nome == CABECALHO:
+                return secrets.compare_digest(valor, self._token)
+        return False
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        explicito = self._pedido_explicito(scope)
+        if not explicito and random.random() >= settings.PROFILER_SAMPLE_RATE:
+            await self.app(scope, receive, send)
+            return
+
+        perfil_id = f"{time.time_ns() // 1_000_000}-{os.getpid()}-{secrets.token_hex(3)}"
+        status_code = 500
+
+        async def send_perfilado(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                if explicito:
+                    message["headers"] = [*message.get("headers", []), (b"x-profile-id", perfil_id.encode())]
+            await send(message)
+
+        profiler = self._profiler(interval=settings.PROFILER_INTERVAL, async_mode="enabled")
+        profiler.start()
+        try:
+            await self.app(scope, receive, send_perfilado)
+        finally:
+            sessao = profiler.stop()
+            meta = {
+                "id": perfil_id,
+                "metodo": scope["method"],
+                "rota": _modelo_rota(scope),
+                "caminho": scope["path"],
+                "status": status_code,
+                "duracao_ms": round(sessao.duration * 1000, 2),
+                "amostras": sessao.sample_count,
+                "explicito": explicito,
+                "criado_em": datetime.now(timezone.utc).isoformat(),
+            }
+            # Renderizar custa alguns ms: fica fora do caminho da resposta
+            tarefa = asyncio.create_task(asyncio.to_thread(self._gravar, sessao, meta))
+            _tarefas.add(tarefa)
+            tarefa.add_done_callback(_tarefas.discard)
+
+    @staticmethod
+    def _gravar(sessao, meta: dict) -> None:
+        try:
+            _salvar(sessao, meta)
+        except Exception:
+            logger.exception("Falha ao gravar o perfil %s", meta["id"])
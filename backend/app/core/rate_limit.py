@@ -0,0 +1,211 @@
+# app/core/rate_limit.py
+import logging
+import math
+import threading
+import time
+from collections import OrderedDict
+from typing import NamedTuple
+from fastapi import Depends, HTTPException, Request, status
+
+from app.core.config import settings
+
+logger = logging.getLogger("app.rate_limit")
+
+# Controle de admissão das rotas caras (bcrypt / envio de e-mail):
+# 1. Token bucket por IP e por conta: cada chave tem um balde com
+#    `capacidade` fichas que se repõe em `periodo` segundos. Sem ficha -> 429.
+# 2. Limite global de concorrência: no máximo AUTH_MAX_CONCORRENTES dessas
+#    requisições em andamento por worker. Acima disso -> 503 imediato, em vez
+#    de enfileirar trabalho de CPU na frente das rotas de leitura.
+#
+# Backend em memória por padrão (cada worker conta separado). Com
+# RATE_LIMIT_BACKEND="redis" os baldes ficam no REDIS_URL e valem para o
+# cluster inteiro; se o Redis cair, volta para a memória em vez de bloquear.
+
+
+class Regra(NamedTuple):
+    capacidade: int # Rajada máxima
+    periodo: float # Segundos para repor o balde inteiro
+
+    @property
+    def taxa(self) -> float:
+        return self.capacidade / self.periodo
+
+
+REGRAS = {
+    "login:ip": Regra(settings.RATE_LIMIT_LOGIN_IP, 60),
+    "login:conta": Regra(settings.RATE_LIMIT_LOGIN_CONTA, 60),
+    "recuperacao:ip": Regra(settings.RATE_LIMIT_RECUPERACAO_IP, 3600),
+    "recuperacao:conta": Regra(settings.RATE_LIMIT_RECUPERACAO_CONTA, 3600),
+    "redefinicao:ip": Regra(settings.RATE_LIMIT_REDEFINICAO_IP, 3600),
+    "cadastro:ip": Regra(settings.RATE_LIMIT_CADASTRO_IP, 3600),
+}
+
+
+class LimitadorMemoria:
+    """
+    Baldes em memória, com limite de chaves (LRU). Um balde descartado por
+    falta de espaço é o menos usado recentemente, ou seja, já estaria cheio.
+    """
+
+    def __init__(self, maxsize: int = 100_000):
+        self.maxsize = maxsize
+        self._baldes: OrderedDict[str, tuple[float, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    async def consumir(self, chave: str, regra: Regra, custo: float = 1) -> float:
+        """Retira `custo` fichas. Retorna 0 se conseguiu ou quantos segundos esperar."""
+        agora = time.monotonic()
+        with self._lock:
+            fichas, ultimo = self._baldes.get(chave, (regra.capacidade, agora))
+            fichas = min(regra.capacidade, fichas + (agora - ultimo) * regra.taxa)
+            espera = 0.0
+            if fichas >= custo:
+                fichas -= custo
+            else:
+                espera = (custo - fichas) / regra.taxa
+            self._baldes[chave] = (fichas, agora)
+            self._baldes.move_to_end(chave)
+            while len(self._baldes) > self.maxsize:
+                self._baldes.popitem(last=False)
+        return espera
+
+    def clear(self) -> None:
+        with self._lock:
+            self._baldes.clear()
+
+
+# Mesmo algoritmo, executado de forma atômica dentro do Redis
+_SCRIPT_REDIS = """
+local capacidade = tonumber(ARGV[1])
+local taxa = tonumber(ARGV[2])
+local agora = tonumber(ARGV[3])
+local custo = tonumber(ARGV[4])
+local dados = redis.call('HMGET', KEYS[1], 'fichas', 'ultimo')
+local fichas = tonumber(dados[1]) or capacidade
+local ultimo = tonumber(dados[2]) or agora
+fichas = math.min(capacidade, fichas + math.max(0, agora - ultimo) * taxa)
+local espera = 0
+if fichas >= custo then
+    fichas = fichas - custo
+else
+    espera = (custo - fichas) / taxa
+end
+redis.call('HSET', KEYS[1], 'fichas', fichas, 'ultimo', agora)
+redis.call('EXPIRE', KEYS[1], math.ceil(capacidade / taxa) + 1)
+return tostring(espera)
+"""
+
+
+class LimitadorRedis:
+    def __init__(self, url: str, reserva: LimitadorMemoria):
+        try:
+            import redis.asyncio as redis_asyncio
+        except ImportError as erro:
+            raise RuntimeError(
+                "RATE_LIMIT_BACKEND='redis', mas o pacote 'redis' não está instalado."
+            ) from erro
+        self._cliente = redis_asyncio.from_url(url)
+        self._script = self._cliente.register_script(_SCRIPT_REDIS)
+        self._reserva = reserva
+
+    async def consumir(self, chave: str, regra: Regra, custo: float = 1) -> float:
+        try:
+            # Relógio de parede: precisa ser comparável entre os nós da API
+            espera = await self._script(
+                keys=[chave], args=[regra.capacidade, regra.taxa, time.time(), custo]
+            )
+            return float(espera)
+        except Exception as erro:
+            logger.warning("Rate limit no Redis indisponível, usando memória: %s", erro)
+            return await self._reserva.consumir(chave, regra, custo)
+
+    async def aclose(self) -> None:
+        await self._cliente.aclose()
+
+
+_memoria = LimitadorMemoria()
+_limitador: LimitadorMemoria | LimitadorRedis | None = None
+
+
+def get_limitador() -> LimitadorMemoria | LimitadorRedis:
+    global _limitador
+    if _limitador is None:
+        if settings.RATE_LIMIT_BACKEND == "redis" and settings.REDIS_URL:
+            _limitador = LimitadorRedis(settings.REDIS_URL, _memoria)
+        else:
+            _limitador = _memoria
+    return _limitador
+
+
+async def fechar_limitador() -> None:
+    global _limitador
+    if isinstance(_limitador, LimitadorRedis):
+        await _limitador.aclose()
+    _limitador = None
+
+
+def ip_cliente(request: Request) -> str:
+    """
+    IP de origem. Atrás de proxy reverso, ative RATE_LIMIT_CONFIAR_PROXY para
+    usar o X-Forwarded-For (nunca ative com a API exposta diretamente: o
+    cliente poderia escolher o próprio IP).
+    """
+    if settings.RATE_LIMIT_CONFIAR_PROXY:
+        encaminhado = request.headers.get("x-forwarded-for")
+        if encaminhado:
+            return encaminhado.split(",")[0].strip()
+    return request.client.host if request.client else "desconhecido"
+
+
+async def verificar_limite(nome_regra: str, identificador: str) -> None:
+    """
+    Consome uma ficha do balde (regra, identificador); 429 se estiver vazio.
+    Chame dentro da rota para chaves que vêm do corpo (ex.: e-mail da conta).
+    """
+    if not settings.RATE_LIMIT_ENABLED:
+        return
+    espera = await get_limitador().consumir(
+        f"rl:{nome_regra}:{identificador.lower()}", REGRAS[nome_regra]
+    )
+    if espera > 0:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Muitas tentativas. Tente novamente mais tarde.",
+            headers={"Retry-After": str(math.ceil(espera))},
+        )
+
+
+def limite_por_ip(nome_regra: str):
+    """Dependência de rota: aplica `nome_regra` ao IP do cliente."""
+    async def dependencia(request: Request) -> None:
+        await verificar_limite(nome_regra, ip_cliente(request))
+    return Depends(dependencia)
+
+
+class LimiteConcorrencia:
+    """
+    Dependência que admite no máximo `maximo` requisições simultâneas (por
+    worker) e recusa as demais com 503, sem esperar na fila.
+    """
+
+    def __init__(self, maximo: int):
+        self.maximo = maximo
+        self.em_uso = 0
+
+    async def __call__(self):
+        if self.em_uso >= self.maximo:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Servidor ocupado. Tente novamente em instantes.",
+                headers={"Retry-After": "1"},
+            )
+        self.em_uso += 1
+        try:
+            yield
+        finally:
+            self.em_uso -= 1
+
+
+# Compartilhado por login, cadastro e recuperação/redefinição de senha
+admissao_auth = Depends(LimiteConcorrencia(settings.AUTH_MAX_CONCORRENTES))
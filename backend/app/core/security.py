@@ -1,19 +1,96 @@
 # app/core/security.py
+import asyncio
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta, timezone
-from passlib.context import CryptContext
-from jose import jwt # type: ignore
+from fastapi import HTTPException, status
 from app.core.config import settings
+from app.core.hashing import get_crypt_context, hash_senha, verificar_e_atualizar
+from app.core.metricas import contador, histograma, medidor
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# passlib/bcrypt e python-jose (que puxa o cryptography) somam dezenas de ms
+# de import: ficam para o primeiro uso, fora da subida de cada worker.
 
+# Versões síncronas (scripts, testes e código que já roda fora do event loop)
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
+    return get_crypt_context(settings.BCRYPT_ROUNDS).verify(plain_password, hashed_password)
 
 def get_password_hash(password: str) -> str:
-    return pwd_context.hash(password)
+    return get_crypt_context(settings.BCRYPT_ROUNDS).hash(password)
+
+# --- POOL DE HASH ---
+# O bcrypt gasta ~100-300 ms de CPU segurando o GIL. Rodando em processos
+# separados ele não disputa CPU com o event loop nem ocupa o threadpool.
+# A fila é limitada: com o pool saturado respondemos 503 em vez de acumular
+# logins esperando (e segurar todas as outras requisições do worker).
+_executor: ProcessPoolExecutor | None = None
+_pendentes = 0
+
+senha_hash_duracao = histograma(
+    "senha_hash_duracao_segundos",
+    "Tempo do bcrypt visto pela requisição (fila do pool + cálculo), por operação.",
+    (0.01, 0.05, 0.1, 0.2, 0.3, 0.5, 1.0, 2.0, 5.0)
+)
+senha_hash_rejeitadas = contador(
+    "senha_hash_rejeitadas_total", "Operações recusadas com 503 por pool de hash saturado."
+)
+medidor(
+    "senha_hash_pendentes", "Operações de bcrypt em andamento ou na fila do pool.",
+    lambda: [({}, _pendentes)]
+)
+
+def _get_executor() -> ProcessPoolExecutor:
+    global _executor
+    if _executor is None:
+        # "spawn": processos limpos, sem herdar threads/conexões do servidor
+        _executor = ProcessPoolExecutor(
+            max_workers=settings.PASSWORD_HASH_WORKERS,
+            mp_context=multiprocessing.get_context("spawn")
+        )
+    return _executor
+
+async def _executar_no_pool(operacao: str, funcao, *args):
+    global _pendentes
+    if _pendentes >= settings.PASSWORD_HASH_MAX_PENDING:
+        senha_hash_rejeitadas.inc(operacao=operacao)
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Servidor ocupado. Tente novamente em instantes.",
+            headers={"Retry-After": "1"},
+        )
+
+    _pendentes += 1
+    inicio = time.perf_counter()
+    try:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_get_executor(), funcao, *args)
+    finally:
+        _pendentes -= 1
+        senha_hash_duracao.observar(time.perf_counter() - inicio, operacao=operacao)
+
+async def hash_password_async(password: str) -> str:
+    return await _executar_no_pool("hash", hash_senha, password, settings.BCRYPT_ROUNDS)
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> tuple[bool, str | None]:
+    """
+    Retorna (senha_correta, novo_hash). Se novo_hash vier preenchido, o custo
+    configurado mudou e o chamador deve salvar o hash novo.
+    """
+    return await _executar_no_pool(
+        "verificar", verificar_e_atualizar, plain_password, hashed_password, settings.BCRYPT_ROUNDS
+    )
+
+def shutdown_hash_pool() -> None:
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
 
 # --- NOVO: Função para criar Token JWT ---
 def create_access_token(data: dict, expires_delta: timedelta | None = None):
+    from jose import jwt # type: ignore
+
     to_encode = data.copy()
     if expires_delta:
         expire = datetime.now(timezone.utc) + expires_delta
@@ -22,4 +99,17 @@ def create_access_token(data: dict, expires_delta: timedelta | None = None):
     
     to_encode.update({"exp": expire})
     encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
-    return encoded_jwt
\ No newline at end of file
+    return encoded_jwt
+
+
+def decode_access_token(token: str) -> dict | None:
+    """
+    Payload de um token emitido por create_access_token, ou None se a
+    assinatura não confere ou ele já expirou.
+    """
+    from jose import jwt, JWTError # type: ignore
+
+    try:
+        return jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+    except JWTError:
+        return None
@@ -0,0 +1,54 @@
+# app/core/serializacao.py
+from typing import Any, Iterable
+import orjson
+from fastapi.responses import JSONResponse
+from sqlalchemy import select
+from sqlmodel import SQLModel
+
+# Caminho rápido das listagens (feed, comentários, eventos, bolsistas):
+# 1. O SELECT traz só as colunas do schema de leitura, como tuplas (nada de
+#    instâncias do ORM, identity map ou carregamento de relacionamentos).
+# 2. Cada tupla vira um dict com os nomes dos campos do schema.
+# 3. O orjson transforma a página em bytes (datetime e Enum nativos).
+# O schema continua como response_model, só para a documentação: a rota
+# devolve a resposta pronta e o FastAPI não valida os itens de novo.
+
+
+class RespostaJSON(JSONResponse):
+    """
+    Resposta JSON serializada pelo orjson. Herda de JSONResponse para o
+    OpenAPI continuar descrevendo o response_model da rota.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content)
+
+
+class ListaCompilada:
+    """
+    Liga um schema de leitura às colunas SQL que o preenchem, uma vez só, na
+    importação. Campos sem coluna homônima no modelo vêm em `expressoes`
+    (ex.: autor_nome=Usuario.nome, vindo de um JOIN); faltou algum campo,
+    o erro aparece na subida, não na primeira requisição.
+    """
+
+    def __init__(self, schema: type[SQLModel], modelo: type[SQLModel], **expressoes):
+        self.schema = schema
+        self.campos = tuple(schema.model_fields)
+        colunas = []
+        for campo in self.campos:
+            coluna = expressoes.get(campo)
+            if coluna is None:
+                coluna = getattr(modelo, campo, None)
+            if coluna is None:
+                raise ValueError(f"{schema.__name__}.{campo}: sem coluna em {modelo.__name__}")
+            colunas.append(coluna)
+        self.colunas = tuple(colunas)
+
+    def select(self):
+        """SELECT das colunas do schema, na ordem dos campos."""
+        return select(*self.colunas)
+
+    def itens(self, linhas: Iterable[tuple]) -> list[dict]:
+        campos = self.campos
+        return [dict(zip(campos, linha)) for linha in linhas]
@@ -2,4 +2,8 @@ from .usuario import Usuario
 from .noticia import Noticia, Tag, NoticiasTags, CurtidaNoticia
 from .categoria import Categoria
 from .comentario import Comentario, CurtidaComentario
-from .evento import Evento
\ No newline at end of file
+from .evento import Evento
+from .email import EmailOutbox, StatusEmail
+from .versao import VersaoColecao
+from .faceta import FacetaContagem
+from .tendencia import PontuacaoTendencia
@@ -1,6 +1,6 @@
 from typing import TYPE_CHECKING, Optional
 from datetime import datetime
-from sqlmodel import SQLModel, Field, Relationship
+from sqlmodel import SQLModel, Field, Relationship, Index
 
 if TYPE_CHECKING:
     from .usuario import Usuario
@@ -9,6 +9,10 @@ if TYPE_CHECKING:
 # ---Curtidas em Comentários ---
 class CurtidaComentario(SQLModel, table=True):
     __tablename__ = "curtidas_comentarios"
+    # Índice reverso da PK (usuario_id, comentario_id), como em curtidas_noticias
+    __table_args__ = (
+        Index("ix_curtidas_comentarios_comentario_id_usuario_id", "comentario_id", "usuario_id"),
+    )
 
     usuario_id: int = Field(foreign_key="usuarios.id", primary_key=True)
     comentario_id: int = Field(foreign_key="comentarios.id", primary_key=True)
@@ -19,11 +23,17 @@ class CurtidaComentario(SQLModel, table=True):
 
 class Comentario(SQLModel, table=True):
     __tablename__ = "comentarios"
+    # Thread de comentários da notícia, paginada por (criado_em, id)
+    __table_args__ = (
+        Index("ix_comentarios_noticia_id_criado_em_id", "noticia_id", "criado_em", "id"),
+    )
 
     id: int | None = Field(default=None, primary_key=True)
     conteudo: str
     criado_em: datetime = Field(default_factory=datetime.now)
     aprovado: bool = True
+    # Contador desnormalizado de curtidas (atualizado em lote, ver app/services/curtidas.py)
+    total_curtidas: int = Field(default=0)
     
     usuario_id: int | None = Field(default=None, foreign_key="usuarios.id")
     noticia_id: int | None = Field(default=None, foreign_key="noticias.id")
@@ -0,0 +1,32 @@
+from datetime import datetime
+from enum import Enum
+from sqlmodel import SQLModel, Field, Column, JSON, Index
+
+class StatusEmail(str, Enum):
+    PENDENTE = "pendente"
+    ENVIADO = "enviado"
+    FALHOU = "falhou" # Esgotou as tentativas
+
+# --- Caixa de saída de e-mails ---
+# O e-mail é gravado na mesma transação da mudança que o originou e enviado
+# depois pelo worker (app/services/email_worker.py). Assim nenhuma mensagem
+# se perde se o servidor reiniciar, e falhas de SMTP são retentadas.
+class EmailOutbox(SQLModel, table=True):
+    __tablename__ = "email_outbox"
+    # O worker busca sempre "pendentes cuja próxima tentativa já venceu"
+    __table_args__ = (
+        Index("ix_email_outbox_status_proxima_tentativa_em", "status", "proxima_tentativa_em"),
+    )
+
+    id: int | None = Field(default=None, primary_key=True)
+    assunto: str
+    destinatarios: list[str] = Field(sa_column=Column(JSON, nullable=False))
+    corpo_html: str
+
+    status: StatusEmail = Field(default=StatusEmail.PENDENTE)
+    tentativas: int = 0
+    proxima_tentativa_em: datetime = Field(default_factory=datetime.now)
+    ultimo_erro: str | None = None
+
+    criado_em: datetime = Field(default_factory=datetime.now)
+    enviado_em: datetime | None = None
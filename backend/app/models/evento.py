@@ -1,6 +1,7 @@
 from typing import TYPE_CHECKING, Optional
 from datetime import datetime
-from sqlmodel import SQLModel, Field, Relationship
+from sqlalchemy import DDL, event
+from sqlmodel import SQLModel, Field, Relationship, Index
 
 # Evita erro de importação circular
 if TYPE_CHECKING:
@@ -8,6 +9,11 @@ if TYPE_CHECKING:
 
 class Evento(SQLModel, table=True):
     __tablename__ = "eventos"
+    # B-tree composto para "eventos que se sobrepõem a [de, ate]" e para a
+    # ordenação por data de início (no Postgres há também o índice GiST abaixo)
+    __table_args__ = (
+        Index("ix_eventos_data_inicio_data_fim", "data_inicio", "data_fim"),
+    )
 
     id: int | None = Field(default=None, primary_key=True)
     titulo: str
@@ -18,9 +24,24 @@ class Evento(SQLModel, table=True):
     imagem_url: str | None = None
     destaque: bool = False
     criado_em: datetime = Field(default_factory=datetime.now)
+    # onupdate: qualquer UPDATE no evento renova a data (usada como Last-Modified/ETag)
+    atualizado_em: datetime = Field(
+        default_factory=datetime.now, sa_column_kwargs={"onupdate": datetime.now}
+    )
 
     # Chave Estrangeira
     usuario_id: int | None = Field(default=None, foreign_key="usuarios.id")
 
     # Relacionamento: Uso de aspas "Usuario" para o SQLModel resolver depois
-    usuario: Optional["Usuario"] = Relationship(back_populates="eventos")
\ No newline at end of file
+    usuario: Optional["Usuario"] = Relationship(back_populates="eventos")
+
+
+# Postgres: índice GiST sobre o intervalo do evento, usado pelo operador &&
+# (ver app/services/calendario.py). A expressão precisa ser idêntica à da query.
+event.listen(
+    Evento.__table__, "after_create",
+    DDL(
+        "CREATE INDEX ix_eventos_periodo ON eventos "
+        "USING GIST (tsrange(data_inicio, data_fim, '[]'))"
+    ).execute_if(dialect="postgresql")
+)
@@ -0,0 +1,146 @@
+from sqlalchemy import bindparam, event, delete, select, func, inspect, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+from sqlmodel import SQLModel, Field
+
+from .noticia import Noticia, Tag, NoticiasTags
+from .categoria import Categoria
+
+# --- Contagem de facetas ---
+# Quantas notícias PUBLICADAS existem por categoria e por tag (sidebar e
+# filtros da busca). Mantida incrementalmente: a cada flush que mexe em
+# publicado, categoria_id ou nas tags de uma notícia, só as categorias/tags
+# envolvidas são recontadas, usando os índices de noticias/noticiastags.
+class FacetaContagem(SQLModel, table=True):
+    __tablename__ = "facetas"
+
+    tipo: str = Field(primary_key=True) # "categoria" ou "tag"
+    ref_id: int = Field(primary_key=True)
+    total: int = 0
+
+
+def _insert(conexao, tabela):
+    return (pg_insert if conexao.dialect.name == "postgresql" else sqlite_insert)(tabela)
+
+
+def recalcular_facetas(conexao, categoria_ids: set[int], tag_ids: set[int]) -> None:
+    """
+    Recalcula as contagens das categorias e tags informadas.
+    Escritas que não passam pelo ORM (ex.: importação em massa) devem chamar
+    esta função (ou reconstruir_facetas) explicitamente.
+    """
+    tabela = FacetaContagem.__table__
+    noticias = Noticia.__table__
+    links = NoticiasTags.__table__
+
+    chaves = sorted([("categoria", i) for i in categoria_ids] + [("tag", i) for i in tag_ids])
+    if not chaves:
+        return
+
+    # 1. Cria (se faltar) e trava a linha de cada faceta, em ordem fixa. Duas
+    #    transações que recontam a mesma categoria não inserem a mesma chave
+    #    (o ON CONFLICT espera a outra terminar e vira UPDATE) nem se cruzam
+    #    em deadlock.
+    stmt = _insert(conexao, tabela)
+    conexao.execute(
+        stmt.on_conflict_do_update(
+            index_elements=[tabela.c.tipo, tabela.c.ref_id],
+            set_={"total": tabela.c.total},
+        ),
+        [{"tipo": tipo, "ref_id": ref_id, "total": 0} for tipo, ref_id in chaves]
+    )
+
+    # 2. Conta com as linhas já travadas: em READ COMMITTED este SELECT já
+    #    enxerga o que a transação que segurava a trava gravou
+    totais = dict.fromkeys(chaves, 0)
+    if categoria_ids:
+        linhas = conexao.execute(
+            select(noticias.c.categoria_id, func.count())
+            .where(noticias.c.publicado == True)
+            .where(noticias.c.categoria_id.in_(categoria_ids))
+            .group_by(noticias.c.categoria_id)
+        )
+        totais.update((("categoria", ref_id), total) for ref_id, total in linhas)
+    if tag_ids:
+        linhas = conexao.execute(
+            select(links.c.tag_id, func.count())
+            .select_from(links.join(noticias, noticias.c.id == links.c.noticia_id))
+            .where(noticias.c.publicado == True)
+            .where(links.c.tag_id.in_(tag_ids))
+            .group_by(links.c.tag_id)
+        )
+        totais.update((("tag", ref_id), total) for ref_id, total in linhas)
+
+    # 3. Grava os totais (contagem zero fica como 0; a listagem filtra total > 0)
+    conexao.execute(
+        update(tabela)
+        .where(tabela.c.tipo == bindparam("b_tipo"), tabela.c.ref_id == bindparam("b_ref_id"))
+        .values(total=bindparam("b_total")),
+        [{"b_tipo": tipo, "b_ref_id": ref_id, "b_total": total} for (tipo, ref_id), total in totais.items()]
+    )
+
+
+def reconstruir_facetas(conexao) -> None:
+    """Recalcula todas as facetas do zero."""
+    categoria_ids = set(conexao.execute(select(Categoria.__table__.c.id)).scalars())
+    tag_ids = set(conexao.execute(select(Tag.__table__.c.id)).scalars())
+    conexao.execute(delete(FacetaContagem.__table__))
+    recalcular_facetas(conexao, categoria_ids, tag_ids)
+
+
+def _tags_da_noticia(conexao, noticia_id: int) -> set[int]:
+    links = NoticiasTags.__table__
+    return set(conexao.execute(
+        select(links.c.tag_id).where(links.c.noticia_id == noticia_id)
+    ).scalars())
+
+
+def _afeta_facetas(noticia: Noticia) -> bool:
+    estado = inspect(noticia)
+    return any(
+        estado.attrs[campo].history.has_changes()
+        for campo in ("publicado", "categoria_id", "tags")
+    )
+
+
+def _afetadas(session) -> tuple[set[int], set[int]]:
+    return session.info.setdefault("facetas_afetadas", (set(), set()))
+
+
+@event.listens_for(Session, "before_flush")
+def _facetas_antes(session, flush_context, instances):
+    # Estado ANTIGO das notícias alteradas/removidas (antes de gravar)
+    categorias, tags = _afetadas(session)
+    for obj in list(session.dirty) + list(session.deleted):
+        if not isinstance(obj, Noticia) or obj.id is None:
+            continue
+        if obj in session.dirty and not _afeta_facetas(obj):
+            continue
+        historico = inspect(obj).attrs.categoria_id.history
+        categorias.update(c for c in (*historico.deleted, *historico.unchanged) if c is not None)
+        tags.update(_tags_da_noticia(session.connection(), obj.id))
+
+
+@event.listens_for(Session, "after_flush")
+def _facetas_depois(session, flush_context):
+    # Estado NOVO (já gravado) e vínculos de tags manipulados diretamente
+    categorias, tags = _afetadas(session)
+    for obj in list(session.new) + list(session.dirty):
+        if isinstance(obj, Noticia) and (obj in session.new or _afeta_facetas(obj)):
+            if obj.categoria_id is not None:
+                categorias.add(obj.categoria_id)
+            tags.update(_tags_da_noticia(session.connection(), obj.id))
+        elif isinstance(obj, NoticiasTags) and obj.tag_id is not None:
+            tags.add(obj.tag_id)
+    for obj in session.deleted:
+        if isinstance(obj, NoticiasTags) and obj.tag_id is not None:
+            tags.add(obj.tag_id)
+        elif isinstance(obj, Categoria) and obj.id is not None:
+            categorias.add(obj.id)
+        elif isinstance(obj, Tag) and obj.id is not None:
+            tags.add(obj.id)
+
+    if categorias or tags:
+        recalcular_facetas(session.connection(), categorias, tags)
+        session.info.pop("facetas_afetadas", None)
@@ -1,6 +1,7 @@
 from typing import TYPE_CHECKING, Optional
 from datetime import datetime
-from sqlmodel import SQLModel, Field, Relationship
+from sqlalchemy import DDL, event
+from sqlmodel import SQLModel, Field, Relationship, Index
 
 if TYPE_CHECKING:
     from .usuario import Usuario
@@ -10,6 +11,11 @@ if TYPE_CHECKING:
 # --- Curtidas em Notícias ---
 class CurtidaNoticia(SQLModel, table=True):
     __tablename__ = "curtidas_noticias"
+    # A PK começa por usuario_id; o índice reverso atende "curtidas da
+    # notícia" (contagem, reconciliação dos contadores, remoção em cascata)
+    __table_args__ = (
+        Index("ix_curtidas_noticias_noticia_id_usuario_id", "noticia_id", "usuario_id"),
+    )
 
     # Chave primária composta (usuario + noticia) impede likes duplicados
     usuario_id: int = Field(foreign_key="usuarios.id", primary_key=True)
@@ -22,6 +28,11 @@ class CurtidaNoticia(SQLModel, table=True):
 
 # Tabela associativa pode ficar aqui ou em um arquivo separado se preferir
 class NoticiasTags(SQLModel, table=True):
+    # A PK começa por noticia_id; o índice reverso atende o filtro por tag
+    __table_args__ = (
+        Index("ix_noticiastags_tag_id_noticia_id", "tag_id", "noticia_id"),
+    )
+
     noticia_id: int | None = Field(default=None, foreign_key="noticias.id", primary_key=True)
     tag_id: int | None = Field(default=None, foreign_key="tags.id", primary_key=True)
 
@@ -35,6 +46,16 @@ class Tag(SQLModel, table=True):
 
 class Noticia(SQLModel, table=True):
     __tablename__ = "noticias"
+    # Índices compostos do feed: (publicado, publicado_em, id) casa com a
+    # ordenação e o cursor da paginação keyset; a variante com categoria_id
+    # atende o feed filtrado por categoria sem ordenar em memória.
+    __table_args__ = (
+        Index("ix_noticias_publicado_publicado_em_id", "publicado", "publicado_em", "id"),
+        Index(
+            "ix_noticias_categoria_id_publicado_publicado_em_id",
+            "categoria_id", "publicado", "publicado_em", "id"
+        ),
+    )
 
     id: int | None = Field(default=None, primary_key=True)
     titulo: str
@@ -44,8 +65,13 @@ class Noticia(SQLModel, table=True):
     imagem_capa: str | None = None
     publicado: bool = False
     publicado_em: datetime | None = None
+    # Contador desnormalizado de curtidas (atualizado em lote, ver app/services/curtidas.py)
+    total_curtidas: int = Field(default=0)
     criado_em: datetime = Field(default_factory=datetime.now)
-    atualizado_em: datetime = Field(default_factory=datetime.now)
+    # onupdate: qualquer UPDATE na notícia renova a data (usada como Last-Modified/ETag)
+    atualizado_em: datetime = Field(
+        default_factory=datetime.now, sa_column_kwargs={"onupdate": datetime.now}
+    )
 
     autor_id: int | None = Field(default=None, foreign_key="usuarios.id")
     categoria_id: int | None = Field(default=None, foreign_key="categorias.id")
@@ -58,4 +84,65 @@ class Noticia(SQLModel, table=True):
     
     # --- NOVO RELACIONAMENTO ---
     curtidas: list["CurtidaNoticia"] = Relationship(back_populates="noticia")
-    
\ No newline at end of file
+
+
+# --- BUSCA TEXTUAL ---
+# Estruturas de busca que não são colunas do modelo: criadas junto com a tabela
+# e mantidas pelo próprio banco (ver app/services/busca.py).
+
+# Postgres: coluna tsvector gerada (dicionário português) + índice GIN.
+# Pesos: título (A) > subtítulo (B) > conteúdo (D).
+_BUSCA_POSTGRES = [
+    """
+    ALTER TABLE noticias ADD COLUMN busca tsvector GENERATED ALWAYS AS (
+        setweight(to_tsvector('portuguese', coalesce(titulo, '')), 'A') ||
+        setweight(to_tsvector('portuguese', coalesce(subtitulo, '')), 'B') ||
+        setweight(to_tsvector('portuguese', coalesce(conteudo, '')), 'D')
+    ) STORED
+    """,
+    "CREATE INDEX ix_noticias_busca ON noticias USING GIN (busca)",
+]
+
+# SQLite: tabela FTS5 de conteúdo externo, sincronizada por triggers.
+# O trigger de UPDATE só dispara quando muda algum campo indexado.
+_BUSCA_SQLITE = [
+    """
+    CREATE VIRTUAL TABLE noticias_fts USING fts5(
+        titulo, subtitulo, conteudo,
+        content='noticias', content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2'
+    )
+    """,
+    """
+    CREATE TRIGGER noticias_fts_ai AFTER INSERT ON noticias BEGIN
+        INSERT INTO noticias_fts(rowid, titulo, subtitulo, conteudo)
+        VALUES (new.id, new.titulo, new.subtitulo, new.conteudo);
+    END
+    """,
+    """
+    CREATE TRIGGER noticias_fts_ad AFTER DELETE ON noticias BEGIN
+        INSERT INTO noticias_fts(noticias_fts, rowid, titulo, subtitulo, conteudo)
+        VALUES ('delete', old.id, old.titulo, old.subtitulo, old.conteudo);
+    END
+    """,
+    """
+    CREATE TRIGGER noticias_fts_au AFTER UPDATE OF titulo, subtitulo, conteudo ON noticias BEGIN
+        INSERT INTO noticias_fts(noticias_fts, rowid, titulo, subtitulo, conteudo)
+        VALUES ('delete', old.id, old.titulo, old.subtitulo, old.conteudo);
+        INSERT INTO noticias_fts(rowid, titulo, subtitulo, conteudo)
+        VALUES (new.id, new.titulo, new.subtitulo, new.conteudo);
+    END
+    """,
+]
+
+for _sql in _BUSCA_POSTGRES:
+    event.listen(Noticia.__table__, "after_create", DDL(_sql).execute_if(dialect="postgresql"))
+
+for _sql in _BUSCA_SQLITE:
+    event.listen(Noticia.__table__, "after_create", DDL(_sql).execute_if(dialect="sqlite"))
+
+# Remove a tabela FTS antes da tabela principal (drop_all em testes locais)
+event.listen(
+    Noticia.__table__, "before_drop",
+    DDL("DROP TABLE IF EXISTS noticias_fts").execute_if(dialect="sqlite")
+)
@@ -0,0 +1,23 @@
+from datetime import datetime
+from sqlmodel import SQLModel, Field, Index
+
+# --- Pontuação de "em alta" ---
+# Uma linha por notícia com atividade recente: a soma das curtidas,
+# comentários e visualizações, cada um com peso que cai pela metade a cada
+# TRENDING_MEIA_VIDA_HORAS. Guardada em unidades da `janela` (ver
+# app/services/tendencias.py) para que somar um evento novo seja só
+# "pontuacao + delta", sem reprocessar o histórico.
+class PontuacaoTendencia(SQLModel, table=True):
+    __tablename__ = "tendencias"
+    # Top-K por categoria e geral direto pelo índice, sem ordenar a tabela
+    __table_args__ = (
+        Index("ix_tendencias_categoria_id_pontuacao", "categoria_id", "pontuacao"),
+        Index("ix_tendencias_pontuacao", "pontuacao"),
+    )
+
+    noticia_id: int = Field(foreign_key="noticias.id", primary_key=True)
+    # Cópia de Noticia.categoria_id, renovada a cada evento
+    categoria_id: int | None = None
+    pontuacao: float = 0.0
+    janela: int = 0
+    atualizado_em: datetime = Field(default_factory=datetime.now)
@@ -1,7 +1,7 @@
 from typing import TYPE_CHECKING, List, Optional
 from datetime import datetime
 from enum import Enum
-from sqlmodel import SQLModel, Field, Relationship
+from sqlmodel import SQLModel, Field, Relationship, Index
 
 if TYPE_CHECKING:
     from .noticia import Noticia, CurtidaNoticia
@@ -17,6 +17,14 @@ class RoleEnum(str, Enum):
 
 class Usuario(SQLModel, table=True):
     __tablename__ = "usuarios"
+    # Bolsistas de um professor, separados entre pendentes e ativos; o
+    # final (criado_em, id) é a ordem e o cursor da fila de aprovação
+    __table_args__ = (
+        Index(
+            "ix_usuarios_orientador_id_is_active_criado_em_id",
+            "orientador_id", "is_active", "criado_em", "id"
+        ),
+    )
 
     id: int | None = Field(default=None, primary_key=True)
     nome: str
@@ -0,0 +1,92 @@
+from datetime import datetime
+from sqlalchemy import event, update, insert, inspect
+from sqlalchemy.orm import Session
+from sqlmodel import SQLModel, Field
+
+from .noticia import Noticia, Tag, NoticiasTags
+from .categoria import Categoria
+from .evento import Evento
+from .usuario import Usuario
+
+# --- Versão das coleções ---
+# Um contador por coleção ("noticias", "eventos"), incrementado na mesma
+# transação de qualquer escrita feita pelo ORM. Serve de ETag/Last-Modified
+# para as listagens sem precisar varrer a tabela (ver app/core/http_cache.py).
+class VersaoColecao(SQLModel, table=True):
+    __tablename__ = "versoes_colecao"
+
+    nome: str = Field(primary_key=True)
+    versao: int = 0
+    atualizado_em: datetime = Field(default_factory=datetime.now)
+
+
+# Quais modelos afetam cada coleção
+COLECOES: dict[str, tuple[type, ...]] = {
+    "noticias": (Noticia, Tag, NoticiasTags, Categoria),
+    "eventos": (Evento,),
+    # Dados de outras tabelas embutidos na página do artigo (nomes de
+    # categorias e tags). Entra no validador de cada artigo junto com
+    # (id, atualizado_em); o nome do autor também conta (ver abaixo).
+    "relacoes_artigo": (Tag, Categoria),
+}
+
+
+def incrementar_versao(conexao, nome: str) -> None:
+    """
+    Incrementa a versão da coleção. Escritas em massa que não passam pelo
+    ORM (UPDATE/INSERT direto) devem chamar esta função explicitamente.
+    """
+    agora = datetime.now()
+    resultado = conexao.execute(
+        update(VersaoColecao)
+        .where(VersaoColecao.nome == nome)
+        .values(versao=VersaoColecao.versao + 1, atualizado_em=agora)
+    )
+    if resultado.rowcount == 0:
+        conexao.execute(insert(VersaoColecao).values(nome=nome, versao=1, atualizado_em=agora))
+
+
+@event.listens_for(VersaoColecao.__table__, "after_create")
+def _criar_versoes_iniciais(tabela, conexao, **kw):
+    # Linhas criadas junto com a tabela: o UPDATE acima sempre encontra a sua
+    conexao.execute(insert(tabela), [{"nome": nome, "versao": 0} for nome in COLECOES])
+
+
+@event.listens_for(Session, "after_flush")
+def _versionar_colecoes(session, flush_context):
+    # Em after_flush, new/dirty/deleted ainda refletem o que acabou de ser gravado
+    alterados = [
+        obj for obj in session.dirty if session.is_modified(obj)
+    ] + list(session.new) + list(session.deleted)
+
+    for nome, modelos in COLECOES.items():
+        if any(isinstance(obj, modelos) for obj in alterados):
+            incrementar_versao(session.connection(), nome)
+
+    # Troca de nome de usuário muda o autor_nome dos artigos dele (as demais
+    # escritas em usuários, como login e aprovação, não mexem nos artigos)
+    if any(
+        isinstance(obj, Usuario) and inspect(obj).attrs.nome.history.has_changes()
+        for obj in session.dirty
+    ):
+        incrementar_versao(session.connection(), "relacoes_artigo")
+
+
+@event.listens_for(Session, "after_flush")
+def _renovar_artigos_com_tags_alteradas(session, flush_context):
+    # Vincular/desvincular tags não altera colunas da notícia: renova
+    # atualizado_em para que o validador e o cache do artigo mudem também
+    noticia_ids = {
+        obj.noticia_id for obj in list(session.new) + list(session.deleted)
+        if isinstance(obj, NoticiasTags) and obj.noticia_id is not None
+    }
+    noticia_ids.update(
+        obj.id for obj in session.dirty
+        if isinstance(obj, Noticia) and obj.id is not None
+        and inspect(obj).attrs.tags.history.has_changes()
+    )
+    if noticia_ids:
+        tabela = Noticia.__table__
+        session.connection().execute(
+            update(tabela).where(tabela.c.id.in_(noticia_ids)).values(atualizado_em=datetime.now())
+        )
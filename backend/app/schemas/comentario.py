@@ -0,0 +1,16 @@
+from datetime import datetime
+from sqlmodel import SQLModel
+
+# --- READ ---
+class ComentarioRead(SQLModel):
+    id: int
+    conteudo: str
+    criado_em: datetime
+    usuario_id: int | None = None
+    autor_nome: str | None = None
+    curtidas: int = 0
+
+# --- PÁGINA DE COMENTÁRIOS ---
+class PaginaComentarios(SQLModel):
+    items: list[ComentarioRead]
+    next_cursor: str | None = None
@@ -0,0 +1,5 @@
+from sqlmodel import SQLModel
+
+# Resposta das rotas de curtir/descurtir
+class EstadoCurtida(SQLModel):
+    curtido: bool
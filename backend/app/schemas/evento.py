@@ -0,0 +1,14 @@
+from datetime import datetime
+from sqlmodel import SQLModel
+
+# --- READ ---
+class EventoRead(SQLModel):
+    id: int
+    titulo: str
+    descricao: str | None = None
+    data_inicio: datetime
+    data_fim: datetime
+    local: str | None = None
+    imagem_url: str | None = None
+    destaque: bool = False
+    criado_em: datetime
@@ -0,0 +1,12 @@
+# app/schemas/midia.py
+from sqlmodel import SQLModel
+
+# --- RESPOSTA DO UPLOAD ---
+class ImagemEnviada(SQLModel):
+    url: str # Use este valor em Noticia.imagem_capa / Evento.imagem_url
+    sha256: str
+    tamanho: int
+    duplicada: bool # True se o mesmo conteúdo já estava armazenado
+    # Largura -> URL. Geradas em segundo plano: podem levar alguns
+    # segundos para existir depois da resposta.
+    miniaturas: dict[int, str]
@@ -0,0 +1,107 @@
+from datetime import datetime
+from sqlmodel import SQLModel
+
+# --- ITEM DO FEED ---
+# Versão resumida da notícia (sem o conteúdo completo) para listagens
+class NoticiaResumo(SQLModel):
+    id: int
+    titulo: str
+    subtitulo: str | None = None
+    slug: str
+    imagem_capa: str | None = None
+    publicado_em: datetime
+    autor_id: int | None = None
+    categoria_id: int | None = None
+
+# --- EM ALTA ---
+# Item do ranking de tendências (app/services/tendencias.py)
+class NoticiaEmAlta(NoticiaResumo):
+    pontuacao: float # Soma dos pesos dos eventos, já com o decaimento
+
+# --- LEITURA ---
+# Notícia completa, como exibida na página do artigo
+class NoticiaRead(SQLModel):
+    id: int
+    titulo: str
+    subtitulo: str | None = None
+    conteudo: str
+    slug: str
+    imagem_capa: str | None = None
+    publicado_em: datetime | None = None
+    atualizado_em: datetime
+    autor_id: int | None = None
+    categoria_id: int | None = None
+
+# --- ARTIGO COMPLETO ---
+# Payload da página do artigo (é o que fica no cache de artigos)
+class CategoriaResumo(SQLModel):
+    id: int
+    nome: str
+    slug: str
+
+class TagResumo(SQLModel):
+    nome: str
+    slug: str
+
+class NoticiaDetalhe(NoticiaRead):
+    autor_nome: str | None = None
+    categoria: CategoriaResumo | None = None
+    tags: list[TagResumo] = []
+    curtidas: int = 0
+
+# --- PÁGINA DO FEED ---
+# next_cursor vem preenchido enquanto houver mais itens a buscar
+class FeedNoticias(SQLModel):
+    items: list[NoticiaResumo]
+    next_cursor: str | None = None
+
+# --- RESULTADO DE BUSCA ---
+# `trecho` traz o conteúdo em texto puro (escapado), com as ocorrências marcadas em <mark>
+class ResultadoBusca(SQLModel):
+    id: int
+    titulo: str
+    subtitulo: str | None = None
+    slug: str
+    publicado_em: datetime | None = None
+    rank: float
+    trecho: str | None = None
+
+# --- FACETAS ---
+# Contagem de notícias publicadas por categoria/tag (sidebar e filtros)
+class FacetaItem(SQLModel):
+    id: int
+    nome: str
+    slug: str
+    total: int
+
+class Facetas(SQLModel):
+    categorias: list[FacetaItem]
+    tags: list[FacetaItem]
+
+# --- IMPORTAÇÃO EM MASSA ---
+# Uma linha do arquivo NDJSON de importação
+class CategoriaImportacao(SQLModel):
+    slug: str
+    nome: str
+
+class TagImportacao(SQLModel):
+    slug: str
+    nome: str
+
+class NoticiaImportacao(SQLModel):
+    titulo: str
+    subtitulo: str | None = None
+    conteudo: str
+    slug: str
+    imagem_capa: str | None = None
+    publicado: bool = False
+    publicado_em: datetime | None = None
+    autor_id: int | None = None
+    categoria: CategoriaImportacao | None = None
+    tags: list[TagImportacao] = []
+
+class ResultadoImportacao(SQLModel):
+    lidas: int = 0
+    importadas: int = 0
+    ja_existentes: int = 0 # Slug já cadastrado (importação idempotente)
+    erros: list[str] = [] # Primeiros erros (validação ou banco), com o número da linha
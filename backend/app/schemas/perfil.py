@@ -0,0 +1,15 @@
+# app/schemas/perfil.py
+from datetime import datetime
+from sqlmodel import SQLModel
+
+# --- PERFIL DE UMA REQUISIÇÃO (app/core/perfilador.py) ---
+class PerfilRequisicao(SQLModel):
+    id: str
+    metodo: str
+    rota: str # Modelo da rota (/api/v1/usuarios/), o mesmo rótulo do /metrics
+    caminho: str
+    status: int
+    duracao_ms: float
+    amostras: int
+    explicito: bool # True se pedido pelo cabeçalho X-Profile
+    criado_em: datetime
@@ -1,6 +1,7 @@
 from typing import Optional
-from sqlmodel import SQLModel
-from pydantic import EmailStr, model_validator
+from datetime import datetime
+from sqlmodel import SQLModel, Field
+from pydantic import ConfigDict, EmailStr, model_validator
 from app.models.usuario import RoleEnum
 
 # --- BASE ---
@@ -41,6 +42,39 @@ class UsuarioRead(UsuarioBase):
     orientador_id: int | None = None
 
 
+# --- BOLSISTAS DO PROFESSOR ---
+# Fila de aprovação (mais antigos primeiro, paginada por cursor)
+class BolsistaPendente(UsuarioRead):
+    criado_em: datetime
+
+class PaginaBolsistasPendentes(SQLModel):
+    items: list[BolsistaPendente]
+    next_cursor: str | None = None
+
+# Aprovação / encerramento em lote
+class LoteBolsistas(SQLModel):
+    aluno_ids: list[int] = Field(min_length=1, max_length=200)
+
+class ResultadoLoteBolsistas(SQLModel):
+    atualizados: list[int]
+    # Inexistentes, de outro orientador ou que já estavam no estado pedido
+    ignorados: list[int]
+
+
+# --- USUÁRIO AUTENTICADO ---
+# Retrato mínimo do usuário logado, guardado no cache de autenticação.
+# Imutável: a mesma instância é compartilhada entre requisições.
+class UsuarioAutenticado(SQLModel):
+    model_config = ConfigDict(frozen=True)
+
+    id: int
+    nome: str
+    email: str
+    role: RoleEnum
+    is_active: bool
+    orientador_id: int | None = None
+
+
 class SolicitacaoBolsa(SQLModel):
     email_orientador: EmailStr
 
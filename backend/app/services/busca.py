@@ -0,0 +1,102 @@
+# app/services/busca.py
+import html
+import re
+from sqlalchemy import text
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+# Motor de busca textual sobre Noticia (titulo, subtitulo, conteudo).
+# - Postgres: coluna tsvector `busca` + índice GIN, ranking ts_rank_cd.
+# - SQLite: tabela FTS5 `noticias_fts`, ranking bm25 (usado em testes locais).
+# As estruturas são criadas em app/models/noticia.py.
+
+# O conteúdo é HTML do editor: o trecho sai do banco com marcadores que não
+# aparecem em texto (uso privado do Unicode) e _limpar_trecho remove as tags,
+# escapa o resto e só então troca os marcadores por <mark>. Assim o único
+# HTML do trecho é o <mark> gerado aqui.
+MARCA_INICIO = "\ue000"
+MARCA_FIM = "\ue001"
+
+_TAG_HTML = re.compile(r"<[^>]*>")
+# Pedaços de tag cortados nas pontas do trecho (ex.: 'ref="/x">texto ... <a hr')
+_TAG_CORTADA = re.compile(r"^[^<>]*>|<[^>]*$")
+_MARCADO = re.compile(f"{MARCA_INICIO}([^{MARCA_INICIO}{MARCA_FIM}]*){MARCA_FIM}")
+
+# O ts_headline é caro: primeiro ranqueia e limita os ids, depois gera
+# os trechos apenas das linhas da página. As tags saem antes do destaque
+# (trechos mais úteis, sem atributos contando como palavras).
+_SQL_POSTGRES = text(f"""
+    WITH consulta AS (
+        SELECT websearch_to_tsquery('portuguese', :termo) AS q
+    ),
+    ranqueadas AS (
+        SELECT n.id, ts_rank_cd(n.busca, consulta.q) AS rank
+        FROM noticias n, consulta
+        WHERE n.busca @@ consulta.q AND n.publicado
+        ORDER BY rank DESC, n.id DESC
+        LIMIT :limit OFFSET :offset
+    )
+    SELECT n.id, n.titulo, n.subtitulo, n.slug, n.publicado_em, r.rank,
+           ts_headline(
+               'portuguese', regexp_replace(n.conteudo, '<[^>]*>', ' ', 'g'), consulta.q,
+               'StartSel={MARCA_INICIO}, StopSel={MARCA_FIM}, MaxFragments=2, MinWords=10, MaxWords=30'
+           ) AS trecho
+    FROM ranqueadas r
+    JOIN noticias n ON n.id = r.id, consulta
+    ORDER BY r.rank DESC, n.id DESC
+""")
+
+# bm25 devolve valores menores para os melhores resultados; invertemos o
+# sinal para que `rank` tenha o mesmo sentido nos dois bancos.
+_SQL_SQLITE = text(f"""
+    SELECT n.id, n.titulo, n.subtitulo, n.slug, n.publicado_em,
+           -bm25(noticias_fts, 10.0, 5.0, 1.0) AS rank,
+           snippet(noticias_fts, 2, '{MARCA_INICIO}', '{MARCA_FIM}', '…', 24) AS trecho
+    FROM noticias_fts
+    JOIN noticias n ON n.id = noticias_fts.rowid
+    WHERE noticias_fts MATCH :termo AND n.publicado = 1
+    ORDER BY rank DESC, n.id DESC
+    LIMIT :limit OFFSET :offset
+""")
+
+
+def _limpar_trecho(trecho: str | None) -> str | None:
+    """Trecho do banco -> texto escapado, com as ocorrências em <mark>."""
+    if trecho is None:
+        return None
+    texto = _TAG_CORTADA.sub("", _TAG_HTML.sub(" ", trecho))
+    texto = html.escape(html.unescape(texto), quote=False)
+    texto = _MARCADO.sub(r"<mark>\1</mark>", texto)
+    return texto.replace(MARCA_INICIO, "").replace(MARCA_FIM, "")
+
+
+def _consulta_fts5(termo: str) -> str:
+    """
+    Converte o texto do usuário em uma consulta FTS5 segura:
+    cada palavra vira um termo entre aspas (E implícito entre eles),
+    evitando que operadores e aspas soltas gerem erro de sintaxe.
+    """
+    palavras = re.findall(r"\w+", termo)
+    return " ".join(f'"{p}"' for p in palavras)
+
+
+async def buscar_noticias(session: AsyncSession, termo: str, limit: int = 20, offset: int = 0) -> list[dict]:
+    """
+    Retorna as notícias publicadas que casam com `termo`, ordenadas por
+    relevância, com um trecho do conteúdo destacando as ocorrências.
+    """
+    dialeto = session.get_bind().dialect.name
+
+    if dialeto == "postgresql":
+        sql, consulta = _SQL_POSTGRES, termo
+    elif dialeto == "sqlite":
+        sql, consulta = _SQL_SQLITE, _consulta_fts5(termo)
+        if not consulta:
+            return []
+    else:
+        raise RuntimeError(f"Busca textual não suportada para o banco '{dialeto}'.")
+
+    linhas = await session.execute(sql, {"termo": consulta, "limit": limit, "offset": offset})
+    resultados = [dict(linha._mapping) for linha in linhas]
+    for resultado in resultados:
+        resultado["trecho"] = _limpar_trecho(resultado["trecho"])
+    return resultados
@@ -0,0 +1,133 @@
+# app/services/cache_artigos.py
+import logging
+from sqlalchemy.orm import joinedload, selectinload
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.models.noticia import Noticia
+from app.schemas.noticia import NoticiaDetalhe
+
+logger = logging.getLogger("app.cache")
+
+# Cache do artigo já serializado (bytes JSON), em duas camadas:
+# 1. LRU em memória do worker (mais rápido, não compartilhado)
+# 2. Redis opcional (REDIS_URL), compartilhado entre workers
+#
+# Invalidação: a chave é o validador do próprio artigo (ver ler_noticia):
+# id + atualizado_em (renovado por qualquer escrita na notícia ou nos seus
+# vínculos de tags) + versão "relacoes_artigo" (nomes de categorias, tags e
+# autores embutidos no payload, app/models/versao.py) + total_curtidas
+# (a descarga dos contadores troca a chave só do artigo curtido). Editar um artigo só
+# troca a chave dele; as antigas deixam de ser lidas e expiram pelo TTL/LRU,
+# em todos os workers e nas duas camadas, sem precisar de pub/sub.
+
+_local = TTLCache(maxsize=settings.ARTICLE_CACHE_MAXSIZE, ttl=settings.ARTICLE_CACHE_TTL_SECONDS)
+_redis = None
+
+
+def _chave(noticia_id: int, validador: str) -> str:
+    return f"artigo:{noticia_id}:{validador}"
+
+
+def _get_redis():
+    """
+    Cliente Redis criado no primeiro uso. O pacote `redis` só é exigido
+    quando REDIS_URL está configurada.
+    """
+    global _redis
+    if _redis is None and settings.REDIS_URL:
+        try:
+            import redis.asyncio as redis_asyncio
+        except ImportError as erro:
+            raise RuntimeError(
+                "REDIS_URL configurada, mas o pacote 'redis' não está instalado."
+            ) from erro
+        _redis = redis_asyncio.from_url(settings.REDIS_URL)
+    return _redis
+
+
+async def _ler_redis(chave: str) -> bytes | None:
+    cliente = _get_redis()
+    if cliente is None:
+        return None
+    try:
+        return await cliente.get(chave)
+    except Exception as erro:
+        # Cache fora do ar não pode derrubar a leitura de artigos
+        logger.warning("Falha ao ler do Redis (%s): %s", chave, erro)
+        return None
+
+
+async def _gravar_redis(chave: str, payload: bytes) -> None:
+    cliente = _get_redis()
+    if cliente is None:
+        return
+    try:
+        await cliente.set(chave, payload, ex=settings.ARTICLE_CACHE_REDIS_TTL_SECONDS)
+    except Exception as erro:
+        logger.warning("Falha ao gravar no Redis (%s): %s", chave, erro)
+
+
+async def montar_artigo(session: AsyncSession, noticia_id: int) -> bytes | None:
+    """
+    Monta o payload completo do artigo publicado (autor, categoria, tags e
+    curtidas) e devolve já serializado. None se não existir.
+    """
+    noticia = (await session.exec(
+        select(Noticia)
+        .where(Noticia.id == noticia_id)
+        .where(Noticia.publicado == True)
+        .options(
+            joinedload(Noticia.autor),
+            joinedload(Noticia.categoria),
+            selectinload(Noticia.tags),
+        )
+    )).first()
+
+    if not noticia:
+        return None
+
+    detalhe = NoticiaDetalhe.model_validate(noticia, update={
+        "autor_nome": noticia.autor.nome if noticia.autor else None,
+        "categoria": noticia.categoria,
+        "tags": noticia.tags,
+        # Contador desnormalizado: fica até LIKES_FLUSH_SECONDS atrás das
+        # curtidas mais recentes (não mais que isso: ele faz parte da chave)
+        "curtidas": noticia.total_curtidas,
+    })
+    return detalhe.model_dump_json().encode()
+
+
+async def obter_artigo(session: AsyncSession, noticia_id: int, validador: str) -> bytes | None:
+    """
+    Busca o artigo serializado no cache (memória -> Redis -> banco),
+    preenchendo as camadas mais rápidas no caminho de volta.
+    """
+    chave = _chave(noticia_id, validador)
+
+    payload = _local.get(chave)
+    if payload is not None:
+        return payload
+
+    payload = await _ler_redis(chave)
+    if payload is None:
+        payload = await montar_artigo(session, noticia_id)
+        if payload is None:
+            return None
+        await _gravar_redis(chave, payload)
+
+    _local.set(chave, payload)
+    return payload
+
+
+def limpar_cache_local() -> None:
+    _local.clear()
+
+
+async def fechar_cache() -> None:
+    global _redis
+    if _redis is not None:
+        await _redis.aclose()
+        _redis = None
@@ -0,0 +1,111 @@
+# app/services/calendario.py
+from datetime import datetime, timezone
+from typing import AsyncIterator
+from sqlalchemy import func, literal_column
+from sqlmodel import select, col
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.database import async_engine
+from app.models.evento import Evento
+
+# Consulta de eventos que se sobrepõem a um período e geração do feed iCal.
+
+
+def filtro_sobreposicao(dialeto: str, de: datetime, ate: datetime):
+    """
+    Condição "o evento se sobrepõe a [de, ate]" no formato que aproveita o
+    índice de cada banco:
+    - Postgres: tsrange(...) && tsrange(...) -> índice GiST ix_eventos_periodo
+    - Demais: data_inicio <= ate AND data_fim >= de -> B-tree (data_inicio, data_fim)
+    O '[]' vai como constante no SQL, não como parâmetro: a expressão precisa
+    ser idêntica à do índice também em planos genéricos (prepared statements).
+    """
+    if dialeto == "postgresql":
+        limites = literal_column("'[]'")
+        periodo_evento = func.tsrange(Evento.data_inicio, Evento.data_fim, limites)
+        return periodo_evento.op("&&")(func.tsrange(de, ate, limites))
+    return (col(Evento.data_inicio) <= ate) & (col(Evento.data_fim) >= de)
+
+
+def query_periodo(dialeto: str, de: datetime, ate: datetime, colunas=None):
+    """Eventos do período; `colunas` troca as instâncias por tuplas dessas colunas."""
+    return (
+        (select(*colunas) if colunas else select(Evento))
+        .where(filtro_sobreposicao(dialeto, de, ate))
+        .order_by(col(Evento.data_inicio), col(Evento.id))
+    )
+
+
+# --- iCalendar (RFC 5545) ---
+
+def _escapar(texto: str) -> str:
+    return (
+        texto.replace("\\", "\\\\").replace(";", "\\;")
+        .replace(",", "\\,").replace("\r\n", "\\n").replace("\n", "\\n")
+    )
+
+
+def _dobrar(linha: str) -> str:
+    # Linhas com mais de 75 octetos continuam na próxima, iniciada por espaço
+    dados = linha.encode()
+    if len(dados) <= 75:
+        return linha + "\r\n"
+    partes, atual = [], b""
+    for caractere in linha:
+        c = caractere.encode()
+        if len(atual) + len(c) > (75 if not partes else 74):
+            partes.append(atual.decode())
+            atual = b""
+        atual += c
+    partes.append(atual.decode())
+    return "\r\n ".join(partes) + "\r\n"
+
+
+def _data_ical(momento: datetime) -> str:
+    # As datas do banco são "naive" em horário local; o feed sai em UTC
+    if momento.tzinfo is None:
+        momento = momento.astimezone()
+    return momento.astimezone(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+
+
+def vevent(evento: Evento) -> str:
+    linhas = [
+        "BEGIN:VEVENT",
+        f"UID:evento-{evento.id}@jornal-ufc",
+        # DTSTAMP/LAST-MODIFIED mudam a cada edição: as agendas atualizam o evento
+        f"DTSTAMP:{_data_ical(evento.atualizado_em)}",
+        f"LAST-MODIFIED:{_data_ical(evento.atualizado_em)}",
+        f"DTSTART:{_data_ical(evento.data_inicio)}",
+        f"DTEND:{_data_ical(evento.data_fim)}",
+        f"SUMMARY:{_escapar(evento.titulo)}",
+    ]
+    if evento.descricao:
+        linhas.append(f"DESCRIPTION:{_escapar(evento.descricao)}")
+    if evento.local:
+        linhas.append(f"LOCATION:{_escapar(evento.local)}")
+    linhas.append("END:VEVENT")
+    return "".join(_dobrar(linha) for linha in linhas)
+
+
+async def gerar_ical(de: datetime, ate: datetime, lote: int = 200) -> AsyncIterator[bytes]:
+    """
+    Gera o .ics aos pedaços: os eventos são lidos em lotes (cursor no
+    servidor quando o driver suporta) e cada VEVENT é enviado assim que
+    montado, sem montar o arquivo inteiro em memória.
+    A sessão é própria: o gerador roda depois que a rota já retornou.
+    """
+    yield (
+        "BEGIN:VCALENDAR\r\nVERSION:2.0\r\n"
+        "PRODID:-//Jornal UFC//Agenda//PT-BR\r\n"
+        "CALSCALE:GREGORIAN\r\nX-WR-CALNAME:Jornal UFC - Eventos\r\n"
+    ).encode()
+
+    async with AsyncSession(async_engine) as session:
+        dialeto = async_engine.dialect.name
+        eventos = await session.stream_scalars(
+            query_periodo(dialeto, de, ate).execution_options(yield_per=lote)
+        )
+        async for evento in eventos:
+            yield vevent(evento).encode()
+
+    yield b"END:VCALENDAR\r\n"
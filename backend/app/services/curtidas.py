@@ -0,0 +1,294 @@
+# app/services/curtidas.py
+"""
+Contadores de curtidas (Noticia.total_curtidas / Comentario.total_curtidas).
+
+Cada curtida grava a sua linha em curtidas_noticias / curtidas_comentarios na
+hora (a PK composta impede duplicadas), mas o contador NÃO é atualizado na
+mesma transação: +1/-1 é somado em memória por linha e, a cada
+LIKES_FLUSH_SECONDS, os saldos vão para o banco em lote
+(total_curtidas = total_curtidas + saldo, em ordem de id). Assim um post
+viral não vira disputa de lock na linha da notícia a cada curtida, nem uma
+contagem na tabela de curtidas a cada descarga.
+
+Se o processo cair, perdem-se os saldos ainda não descarregados. A
+reconciliação periódica (cron) reconta a partir das tabelas de curtidas:
+
+    python -m app.services.curtidas reconciliar
+
+Ela roda com a API no ar. Curtidas recentes já estão na tabela, mas o saldo
+delas pode ainda estar na memória de algum worker; por isso uma linha só é
+corrigida se a divergência continua igual depois de um intervalo de
+descarga (ver reconciliar_contadores).
+"""
+import asyncio
+import logging
+import sys
+import threading
+from datetime import datetime
+from fastapi import HTTPException, status
+from sqlalchemy import bindparam, update, select, func, delete
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.config import settings
+from app.core.database import async_engine
+from app.models.noticia import Noticia, CurtidaNoticia
+from app.models.comentario import Comentario, CurtidaComentario
+
+logger = logging.getLogger("app.curtidas")
+
+# Tabela do contador -> (modelo, modelo da curtida, coluna que aponta para o alvo)
+ALVOS = {
+    "noticias": (Noticia, CurtidaNoticia, CurtidaNoticia.noticia_id),
+    "comentarios": (Comentario, CurtidaComentario, CurtidaComentario.comentario_id),
+}
+
+LOTE = 1000 # Linhas por UPDATE em lote / por transação da reconciliação
+
+_NAO_ENCONTRADO = {"noticias": "Notícia não encontrada.", "comentarios": "Comentário não encontrado."}
+
+
+def _valores_sem_edicao(tabela, valores: dict) -> dict:
+    # Curtida não é edição: mantém atualizado_em (que tem onupdate)
+    if "atualizado_em" in tabela.c:
+        valores["atualizado_em"] = tabela.c.atualizado_em
+    return valores
+
+
+async def aplicar_saldos(conexao: AsyncConnection, alvo: str, saldos: dict[int, int]) -> int:
+    """
+    Soma os saldos ({id: +n/-n}) aos contadores: um UPDATE em lote
+    (executemany), em ordem de id para que dois workers travem as linhas na
+    mesma sequência. Retorna quantas linhas foram atualizadas.
+    """
+    tabela = ALVOS[alvo][0].__table__
+    parametros = [{"b_id": i, "b_saldo": saldo} for i, saldo in sorted(saldos.items()) if saldo]
+    if not parametros:
+        return 0
+    comando = (
+        update(tabela)
+        .where(tabela.c.id == bindparam("b_id"))
+        .values(_valores_sem_edicao(tabela, {
+            "total_curtidas": tabela.c.total_curtidas + bindparam("b_saldo"),
+        }))
+    )
+    for inicio in range(0, len(parametros), LOTE):
+        await conexao.execute(comando, parametros[inicio:inicio + LOTE])
+    return len(parametros)
+
+
+def _contagem_real(alvo: str):
+    modelo, curtida, coluna_alvo = ALVOS[alvo]
+    return (
+        select(func.count())
+        .select_from(curtida.__table__)
+        .where(coluna_alvo == modelo.__table__.c.id)
+        .scalar_subquery()
+    )
+
+
+async def divergencias(conexao: AsyncConnection, alvo: str, ids: list[int]) -> dict[int, int]:
+    """{id: contador - contagem real} das linhas informadas que divergem."""
+    tabela = ALVOS[alvo][0].__table__
+    contagem_real = _contagem_real(alvo)
+    return dict((await conexao.execute(
+        select(tabela.c.id, tabela.c.total_curtidas - contagem_real)
+        .where(tabela.c.id.in_(ids))
+        .where(tabela.c.total_curtidas != contagem_real)
+    )).all())
+
+
+async def recontar(conexao: AsyncConnection, alvo: str, esperadas: dict[int, int]) -> int:
+    """
+    Corrige total_curtidas das linhas cuja divergência ainda é a `esperada`
+    ({id: contador - contagem}, de divergencias). Retorna quantas foram
+    corrigidas. Só para a reconciliação: é uma contagem por linha.
+    """
+    tabela = ALVOS[alvo][0].__table__
+    ids = sorted(esperadas)
+
+    # 1. Trava as linhas em ordem fixa, a mesma da descarga (sem deadlock).
+    #    FOR NO KEY UPDATE não bloqueia a FK de quem está inserindo uma curtida.
+    await conexao.execute(
+        select(tabela.c.id).where(tabela.c.id.in_(ids))
+        .order_by(tabela.c.id).with_for_update(key_share=True)
+    )
+
+    # 2. Com as linhas travadas nenhuma descarga as altera: se a divergência
+    #    mudou, era saldo em trânsito e a linha fica como está
+    confirmadas = [
+        i for i, diferenca in (await divergencias(conexao, alvo, ids)).items()
+        if esperadas[i] == diferenca
+    ]
+    if not confirmadas:
+        return 0
+
+    contagem_real = _contagem_real(alvo)
+    resultado = await conexao.execute(
+        update(tabela)
+        .where(tabela.c.id.in_(confirmadas))
+        .values(_valores_sem_edicao(tabela, {"total_curtidas": contagem_real}))
+    )
+    return resultado.rowcount
+
+
+class AcumuladorCurtidas:
+    """Soma em memória o saldo de curtidas de cada linha até a próxima descarga."""
+
+    def __init__(self):
+        self._saldos: dict[str, dict[int, int]] = {alvo: {} for alvo in ALVOS}
+        self._lock = threading.Lock()
+
+    def registrar(self, alvo: str, alvo_id: int, delta: int) -> None:
+        with self._lock:
+            saldos = self._saldos[alvo]
+            saldos[alvo_id] = saldos.get(alvo_id, 0) + delta
+
+    def _retirar(self) -> dict[str, dict[int, int]]:
+        with self._lock:
+            saldos = self._saldos
+            self._saldos = {alvo: {} for alvo in ALVOS}
+        return saldos
+
+    def _devolver(self, saldos: dict[str, dict[int, int]]) -> None:
+        with self._lock:
+            for alvo, por_id in saldos.items():
+                atuais = self._saldos[alvo]
+                for alvo_id, delta in por_id.items():
+                    atuais[alvo_id] = atuais.get(alvo_id, 0) + delta
+
+    async def descarregar(self, engine: AsyncEngine = async_engine) -> int:
+        """
+        Grava os saldos acumulados (uma transação).
+        Retorna quantas linhas foram atualizadas.
+        """
+        saldos = self._retirar()
+        total = 0
+        try:
+            async with engine.begin() as conexao:
+                for alvo, por_id in saldos.items():
+                    total += await aplicar_saldos(conexao, alvo, por_id)
+        except Exception:
+            # Devolve os saldos para a próxima tentativa
+            self._devolver(saldos)
+            raise
+        return total
+
+
+acumulador = AcumuladorCurtidas()
+
+
+async def curtir(session: AsyncSession, alvo: str, alvo_id: int, usuario_id: int) -> bool:
+    """
+    Grava a curtida do usuário. Idempotente: curtir de novo não conta duas vezes.
+    Retorna True se a curtida é nova; alvo inexistente (FK) vira 404.
+    """
+    curtida = ALVOS[alvo][1].__table__
+    coluna = ALVOS[alvo][2].key
+    dialeto = session.get_bind().dialect.name
+    insert = pg_insert if dialeto == "postgresql" else sqlite_insert
+
+    # Só a PK (usuario, alvo) duplicada é "já curtido"; as demais violações sobem
+    comando = (
+        insert(curtida)
+        .values(usuario_id=usuario_id, criado_em=datetime.now(), **{coluna: alvo_id})
+        .on_conflict_do_nothing(index_elements=[curtida.c.usuario_id, curtida.c[coluna]])
+        .returning(curtida.c.usuario_id)
+    )
+    try:
+        nova = (await session.exec(comando)).first() is not None
+        await session.commit()
+    except IntegrityError:
+        # FK: o alvo foi apagado entre a checagem da rota e o INSERT
+        await session.rollback()
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=_NAO_ENCONTRADO[alvo])
+    if nova:
+        acumulador.registrar(alvo, alvo_id, +1)
+    return nova
+
+
+async def descurtir(session: AsyncSession, alvo: str, alvo_id: int, usuario_id: int) -> datetime | None:
+    """
+    Remove a curtida do usuário. Retorna quando a curtida removida tinha
+    sido feita, ou None se não havia curtida para remover.
+    """
+    curtida = ALVOS[alvo][1]
+    coluna = ALVOS[alvo][2]
+    removida = (await session.exec(
+        delete(curtida)
+        .where(curtida.usuario_id == usuario_id)
+        .where(coluna == alvo_id)
+        .returning(curtida.criado_em)
+    )).first()
+    await session.commit()
+    if removida is None:
+        return None
+    acumulador.registrar(alvo, alvo_id, -1)
+    return removida[0]
+
+
+async def executar_descarga_periodica(parar: asyncio.Event) -> None:
+    """Descarrega os contadores a cada LIKES_FLUSH_SECONDS e uma última vez ao parar."""
+    while not parar.is_set():
+        try:
+            await asyncio.wait_for(parar.wait(), timeout=settings.LIKES_FLUSH_SECONDS)
+        except asyncio.TimeoutError:
+            pass
+        try:
+            await acumulador.descarregar()
+        except Exception:
+            logger.exception("Falha ao descarregar contadores de curtidas")
+
+
+async def reconciliar_contadores(
+    engine: AsyncEngine = async_engine, espera: float | None = None
+) -> dict[str, int]:
+    """
+    Reconta todos os contadores a partir das tabelas de curtidas:
+    1. procura as linhas divergentes, em lotes de LOTE, sem travar nada;
+    2. espera `espera` segundos (padrão: dois intervalos de descarga), para
+       que os saldos em memória dos workers cheguem ao banco;
+    3. corrige só as linhas cuja divergência não mudou (a diferença era
+       perda de saldo, não saldo a caminho).
+    Retorna quantas linhas foram corrigidas por alvo.
+    """
+    suspeitas: dict[str, dict[int, int]] = {}
+    for alvo, (modelo, _, _) in ALVOS.items():
+        tabela = modelo.__table__
+        suspeitas[alvo] = {}
+        ultimo_id = 0
+        while True:
+            async with engine.connect() as conexao:
+                ids = (await conexao.execute(
+                    select(tabela.c.id).where(tabela.c.id > ultimo_id)
+                    .order_by(tabela.c.id).limit(LOTE)
+                )).scalars().all()
+                if not ids:
+                    break
+                suspeitas[alvo].update(await divergencias(conexao, alvo, ids))
+            ultimo_id = ids[-1]
+
+    if any(suspeitas.values()):
+        await asyncio.sleep(2 * settings.LIKES_FLUSH_SECONDS if espera is None else espera)
+
+    corrigidas = {}
+    for alvo, por_id in suspeitas.items():
+        corrigidas[alvo] = 0
+        ids = sorted(por_id)
+        for inicio in range(0, len(ids), LOTE):
+            async with engine.begin() as conexao:
+                corrigidas[alvo] += await recontar(
+                    conexao, alvo, {i: por_id[i] for i in ids[inicio:inicio + LOTE]}
+                )
+    return corrigidas
+
+
+if __name__ == "__main__":
+    if sys.argv[1:] != ["reconciliar"]:
+        print("Uso: python -m app.services.curtidas reconciliar")
+        sys.exit(2)
+    logging.basicConfig(level=logging.INFO)
+    print(asyncio.run(reconciliar_contadores()))
@@ -0,0 +1,208 @@
+# app/services/email_worker.py
+"""
+Worker de entrega da caixa de saída de e-mails (tabela email_outbox).
+
+Pode rodar embutido na API (EMAIL_WORKER_EMBEDDED=True) ou como processo
+separado:
+
+    python -m app.services.email_worker
+
+Só o Postgres tem SKIP LOCKED; nos demais bancos dois workers pegariam o
+mesmo lote e enviariam as mensagens em dobro. Lá vale um worker por banco:
+um lock de arquivo ao lado do banco escolhe um (o primeiro processo do
+uvicorn a subir, ou o processo avulso) e os outros ficam parados.
+
+Para testar localmente sem enviar e-mails de verdade, aponte MAIL_SERVER /
+MAIL_PORT para um servidor SMTP de teste, por exemplo:
+
+    python -m aiosmtpd -n -l localhost:1025   (MAIL_STARTTLS=false)
+"""
+import asyncio
+import logging
+import tempfile
+import time
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from email.message import EmailMessage
+from pathlib import Path
+from typing import Iterator
+from sqlalchemy.engine import make_url
+from sqlmodel import select, col
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.config import settings
+from app.core.database import async_engine
+from app.core.metricas import contador, histograma
+from app.models.email import EmailOutbox, StatusEmail
+
+logger = logging.getLogger("app.email")
+
+# A profundidade da fila é lida do banco no scrape (app/api/metricas.py)
+emails_enviados = contador("email_enviados_total", "E-mails entregues ao servidor SMTP.")
+emails_falhas = contador("email_falhas_total", "Tentativas de envio que falharam (serão retentadas).")
+emails_descartados = contador("email_descartados_total", "E-mails abandonados após EMAIL_MAX_TENTATIVAS.")
+email_lote_duracao = histograma(
+    "email_lote_duracao_segundos", "Duração de cada lote enviado (conexão SMTP + envios).",
+    (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+)
+
+
+def _montar_mensagem(email: EmailOutbox) -> EmailMessage:
+    mensagem = EmailMessage()
+    mensagem["Subject"] = email.assunto
+    mensagem["From"] = settings.MAIL_FROM
+    mensagem["To"] = ", ".join(email.destinatarios)
+    mensagem.set_content(email.corpo_html, subtype="html")
+    return mensagem
+
+
+def _registrar_falha(email: EmailOutbox, erro: Exception) -> None:
+    """
+    Agenda nova tentativa com backoff exponencial, ou desiste de vez
+    ao atingir EMAIL_MAX_TENTATIVAS.
+    """
+    email.tentativas += 1
+    email.ultimo_erro = f"{type(erro).__name__}: {erro}"[:500]
+    emails_falhas.inc()
+
+    if email.tentativas >= settings.EMAIL_MAX_TENTATIVAS:
+        email.status = StatusEmail.FALHOU
+        emails_descartados.inc()
+        logger.error("E-mail %s descartado após %s tentativas: %s", email.id, email.tentativas, erro)
+    else:
+        espera = settings.EMAIL_RETRY_BASE_SECONDS * 2 ** (email.tentativas - 1)
+        email.proxima_tentativa_em = datetime.now() + timedelta(seconds=espera)
+        logger.warning("Falha ao enviar e-mail %s (tentativa %s): %s", email.id, email.tentativas, erro)
+
+
+def _criar_cliente_smtp() -> "aiosmtplib.SMTP":
+    import aiosmtplib
+
+    return aiosmtplib.SMTP(
+        hostname=settings.MAIL_SERVER,
+        port=settings.MAIL_PORT,
+        username=settings.MAIL_USERNAME or None,
+        password=settings.MAIL_PASSWORD or None,
+        use_tls=settings.MAIL_SSL_TLS,
+        start_tls=settings.MAIL_STARTTLS,
+    )
+
+
+async def processar_lote(session: AsyncSession) -> int:
+    """
+    Envia um lote de e-mails pendentes por UMA conexão SMTP.
+    Retorna quantos foram enviados com sucesso.
+    """
+    # 1. Reserva o lote. No Postgres, SKIP LOCKED permite vários workers
+    #    em paralelo sem pegar as mesmas mensagens (no SQLite é ignorado e
+    #    quem evita o envio em dobro é o _worker_exclusivo).
+    emails = (await session.exec(
+        select(EmailOutbox)
+        .where(EmailOutbox.status == StatusEmail.PENDENTE)
+        .where(EmailOutbox.proxima_tentativa_em <= datetime.now())
+        .order_by(col(EmailOutbox.id))
+        .limit(settings.EMAIL_WORKER_BATCH_SIZE)
+        .with_for_update(skip_locked=True)
+    )).all()
+
+    if not emails:
+        return 0
+
+    # Importado só quando há o que enviar: não pesa na subida da API
+    import aiosmtplib
+
+    # 2. Uma única conexão (e um único handshake TLS) para o lote inteiro
+    inicio = time.perf_counter()
+    smtp = _criar_cliente_smtp()
+    try:
+        await smtp.connect()
+    except (aiosmtplib.SMTPException, OSError) as erro:
+        for email in emails:
+            _registrar_falha(email, erro)
+        await session.commit()
+        return 0
+
+    enviados = 0
+    try:
+        for email in emails:
+            try:
+                await smtp.send_message(_montar_mensagem(email))
+            except (aiosmtplib.SMTPException, OSError) as erro:
+                _registrar_falha(email, erro)
+                continue
+            email.status = StatusEmail.ENVIADO
+            email.enviado_em = datetime.now()
+            enviados += 1
+    finally:
+        try:
+            await smtp.quit()
+        except (aiosmtplib.SMTPException, OSError):
+            pass
+        email_lote_duracao.observar(time.perf_counter() - inicio)
+        emails_enviados.inc(enviados)
+
+    # 3. Grava o resultado do lote de uma vez
+    await session.commit()
+    return enviados
+
+
+@contextmanager
+def _worker_exclusivo() -> Iterator[bool]:
+    """
+    Diz se este processo deve enviar. No Postgres, sempre (SKIP LOCKED);
+    nos demais bancos, só quem obtiver o lock de arquivo, mantido até o
+    fim do bloco. Sem fcntl (Windows) o lock não existe: só avisa.
+    """
+    if async_engine.dialect.name == "postgresql":
+        yield True
+        return
+    try:
+        import fcntl
+    except ImportError:
+        logger.warning("Sem lock de arquivo neste sistema: rode um único worker de e-mails")
+        yield True
+        return
+
+    banco = make_url(settings.DATABASE_URL).database
+    if banco and banco != ":memory:":
+        caminho = Path(f"{banco}.email-worker.lock")
+    else:
+        caminho = Path(tempfile.gettempdir()) / "email-worker.lock"
+    with open(caminho, "w") as arquivo:
+        try:
+            fcntl.flock(arquivo, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            yield False
+            return
+        yield True # Fechar o arquivo libera o lock
+
+
+async def executar_worker(parar: asyncio.Event | None = None) -> None:
+    """
+    Laço principal: processa lotes enquanto houver fila e, quando ela
+    esvazia, espera EMAIL_WORKER_POLL_SECONDS antes de consultar de novo.
+    """
+    parar = parar or asyncio.Event()
+    with _worker_exclusivo() as exclusivo:
+        if not exclusivo:
+            logger.info("Outro worker de e-mails já atende este banco; este fica parado")
+            return
+
+        while not parar.is_set():
+            try:
+                async with AsyncSession(async_engine, expire_on_commit=False) as session:
+                    enviados = await processar_lote(session)
+            except Exception:
+                logger.exception("Erro inesperado no worker de e-mails")
+                enviados = 0
+
+            if enviados < settings.EMAIL_WORKER_BATCH_SIZE:
+                try:
+                    await asyncio.wait_for(parar.wait(), timeout=settings.EMAIL_WORKER_POLL_SECONDS)
+                except asyncio.TimeoutError:
+                    pass
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(executar_worker())
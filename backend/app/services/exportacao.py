@@ -0,0 +1,77 @@
+# app/services/exportacao.py
+import csv
+import io
+import json
+from datetime import date, datetime
+from enum import Enum
+from typing import AsyncIterator
+from sqlalchemy import select
+
+from app.core.database import async_engine
+from app.models.comentario import Comentario
+from app.models.noticia import Noticia
+from app.models.usuario import Usuario
+
+# Exportação em massa (NDJSON ou CSV) com memória constante: as linhas vêm
+# do banco em lotes (cursor no servidor quando o driver suporta) e cada lote
+# é serializado e enviado antes de buscar o próximo.
+
+TAMANHO_LOTE = 1_000
+
+# Recurso -> colunas exportadas (senha_hash nunca sai do banco)
+RECURSOS = {
+    "noticias": list(Noticia.__table__.c),
+    "usuarios": [c for c in Usuario.__table__.c if c.name != "senha_hash"],
+    "comentarios": list(Comentario.__table__.c),
+}
+
+FORMATOS = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+}
+
+
+def _valor(valor):
+    if isinstance(valor, Enum):
+        return valor.value
+    if isinstance(valor, (datetime, date)):
+        return valor.isoformat()
+    return valor
+
+
+def _ndjson(nomes: list[str], linhas) -> str:
+    return "".join(
+        json.dumps(dict(zip(nomes, map(_valor, linha))), ensure_ascii=False) + "\n"
+        for linha in linhas
+    )
+
+
+def _csv(linhas) -> str:
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows([_valor(v) for v in linha] for linha in linhas)
+    return buffer.getvalue()
+
+
+async def exportar(recurso: str, formato: str) -> AsyncIterator[bytes]:
+    """
+    Gera o arquivo de exportação aos pedaços (um pedaço por lote de linhas).
+    Usa conexão própria: o gerador roda depois que a rota já retornou.
+    """
+    colunas = RECURSOS[recurso]
+    nomes = [c.name for c in colunas]
+
+    if formato == "csv":
+        yield _csv([nomes]).encode()
+
+    query = (
+        select(*colunas)
+        .order_by(colunas[0].table.c.id)
+        .execution_options(yield_per=TAMANHO_LOTE)
+    )
+    async with async_engine.connect() as conexao:
+        resultado = await conexao.stream(query)
+        async for lote in resultado.partitions():
+            if formato == "csv":
+                yield _csv(lote).encode()
+            else:
+                yield _ndjson(nomes, lote).encode()
@@ -0,0 +1,248 @@
+# app/services/importacao.py
+"""
+Importação em massa de notícias (acervo legado) a partir de NDJSON.
+
+Cada linha segue o schema NoticiaImportacao. As linhas são processadas em
+lotes, um lote por transação:
+1. descarta slugs que já existem (reimportar o mesmo arquivo é seguro);
+2. resolve/cria categorias e tags pelo slug, em lote;
+3. insere notícias e vínculos com COPY (Postgres) ou executemany (demais);
+4. atualiza facetas e a versão da coleção, que o ORM faria sozinho.
+
+Se o lote viola alguma restrição (autor_id inexistente, slug gravado por
+outra importação ao mesmo tempo), ele é refeito linha a linha, cada uma num
+SAVEPOINT: as linhas válidas entram e as recusadas vão para os erros.
+
+Uso pela linha de comando:
+
+    python -m app.services.importacao acervo.ndjson [--lote 1000]
+"""
+import argparse
+import json
+import logging
+from datetime import datetime
+from typing import Iterable, TextIO
+from pydantic import ValidationError
+from sqlalchemy import insert, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.exc import IntegrityError
+
+from app.core.database import engine as engine_padrao
+from app.models.categoria import Categoria
+from app.models.faceta import recalcular_facetas
+from app.models.noticia import Noticia, NoticiasTags, Tag
+from app.models.versao import incrementar_versao
+from app.schemas.noticia import NoticiaImportacao, ResultadoImportacao
+
+logger = logging.getLogger("app.importacao")
+
+TAMANHO_LOTE = 1_000
+MAX_ERROS_REPORTADOS = 50
+
+_COLUNAS_NOTICIA = [
+    "titulo", "subtitulo", "conteudo", "slug", "imagem_capa", "publicado",
+    "publicado_em", "total_curtidas", "criado_em", "atualizado_em",
+    "autor_id", "categoria_id",
+]
+
+
+def _insert_ignorando_duplicados(conexao: Connection, tabela):
+    """INSERT ... ON CONFLICT DO NOTHING no dialeto da conexão (se houver)."""
+    dialeto = conexao.dialect.name
+    if dialeto == "postgresql":
+        return pg_insert(tabela).on_conflict_do_nothing()
+    if dialeto == "sqlite":
+        return sqlite_insert(tabela).on_conflict_do_nothing()
+    return insert(tabela)
+
+
+def _resolver_por_slug(conexao: Connection, modelo, itens: dict[str, str]) -> dict[str, int]:
+    """
+    Devolve {slug: id} para os slugs informados ({slug: nome}), criando em
+    lote os que ainda não existem.
+    """
+    if not itens:
+        return {}
+    tabela = modelo.__table__
+    existentes = dict(conexao.execute(
+        select(tabela.c.slug, tabela.c.id).where(tabela.c.slug.in_(itens))
+    ).all())
+
+    novos = [{"slug": slug, "nome": nome} for slug, nome in itens.items() if slug not in existentes]
+    if novos:
+        conexao.execute(_insert_ignorando_duplicados(conexao, tabela), novos)
+        existentes.update(conexao.execute(
+            select(tabela.c.slug, tabela.c.id).where(tabela.c.slug.in_([n["slug"] for n in novos]))
+        ).all())
+    return existentes
+
+
+def _inserir_linhas(conexao: Connection, tabela, colunas: list[str], linhas: list[tuple]) -> None:
+    """
+    COPY no Postgres (psycopg 3); executemany nos demais bancos.
+    """
+    if not linhas:
+        return
+    if conexao.dialect.name == "postgresql":
+        cursor = conexao.connection.driver_connection.cursor()
+        with cursor.copy(f"COPY {tabela.name} ({', '.join(colunas)}) FROM STDIN") as copy:
+            for linha in linhas:
+                copy.write_row(linha)
+    else:
+        conexao.execute(insert(tabela), [dict(zip(colunas, linha)) for linha in linhas])
+
+
+def _importar_lote(
+    conexao: Connection, noticias: list[NoticiaImportacao]
+) -> tuple[int, set[int], set[int]]:
+    """
+    Insere as notícias ainda não cadastradas. Devolve quantas entraram e os
+    ids de categorias e tags envolvidos (para as facetas).
+    """
+    tabela = Noticia.__table__
+
+    # 1. Idempotência: ignora slugs já cadastrados
+    slugs = [n.slug for n in noticias]
+    ja_existem = set(conexao.execute(
+        select(tabela.c.slug).where(tabela.c.slug.in_(slugs))
+    ).scalars())
+    noticias = [n for n in noticias if n.slug not in ja_existem]
+    if not noticias:
+        return 0, set(), set()
+
+    # 2. Categorias e tags do lote, resolvidas/criadas de uma vez
+    categorias = _resolver_por_slug(
+        conexao, Categoria, {n.categoria.slug: n.categoria.nome for n in noticias if n.categoria}
+    )
+    tags = _resolver_por_slug(
+        conexao, Tag, {t.slug: t.nome for n in noticias for t in n.tags}
+    )
+
+    # 3. Notícias
+    agora = datetime.now()
+    _inserir_linhas(conexao, tabela, _COLUNAS_NOTICIA, [
+        (
+            n.titulo, n.subtitulo, n.conteudo, n.slug, n.imagem_capa, n.publicado,
+            n.publicado_em or (agora if n.publicado else None), 0, agora, agora,
+            n.autor_id, categorias[n.categoria.slug] if n.categoria else None,
+        )
+        for n in noticias
+    ])
+
+    # 4. Vínculos com tags (precisa dos ids recém-gerados)
+    ids = dict(conexao.execute(
+        select(tabela.c.slug, tabela.c.id).where(tabela.c.slug.in_([n.slug for n in noticias]))
+    ).all())
+    vinculos = {(ids[n.slug], tags[t.slug]) for n in noticias for t in n.tags}
+    _inserir_linhas(conexao, NoticiasTags.__table__, ["noticia_id", "tag_id"], sorted(vinculos))
+    return len(noticias), set(categorias.values()), set(tags.values())
+
+
+def _atualizar_agregados(conexao: Connection, categorias: set[int], tags: set[int]) -> None:
+    """O que os hooks do ORM fariam: facetas e versão da coleção."""
+    recalcular_facetas(conexao, categorias, tags)
+    incrementar_versao(conexao, "noticias")
+
+
+def _erros_de_integridade(engine: Engine) -> tuple[type[Exception], ...]:
+    # O COPY usa o cursor do driver direto: o erro chega sem o invólucro do SQLAlchemy
+    return (IntegrityError, engine.dialect.dbapi.IntegrityError)
+
+
+def _importar_linha_a_linha(
+    conexao: Connection, lote: dict[str, tuple[int, NoticiaImportacao]], resultado: ResultadoImportacao
+) -> tuple[int, int, set[int], set[int]]:
+    """
+    Refaz um lote recusado com um SAVEPOINT por notícia. Devolve importadas,
+    recusadas e os ids de categorias e tags envolvidos.
+    """
+    importadas, recusadas, categorias, tags = 0, 0, set(), set()
+    for numero, noticia in lote.values():
+        try:
+            with conexao.begin_nested():
+                novas, cats, tgs = _importar_lote(conexao, [noticia])
+        except _erros_de_integridade(conexao.engine) as erro:
+            recusadas += 1
+            _reportar_erro(resultado, numero, erro)
+            continue
+        importadas += novas
+        categorias |= cats
+        tags |= tgs
+    return importadas, recusadas, categorias, tags
+
+
+def _reportar_erro(resultado: ResultadoImportacao, numero: int, erro: Exception) -> None:
+    if len(resultado.erros) < MAX_ERROS_REPORTADOS:
+        resultado.erros.append(f"linha {numero}: {erro}".splitlines()[0])
+
+
+def importar_noticias(
+    linhas: Iterable[str], engine: Engine = engine_padrao, tamanho_lote: int = TAMANHO_LOTE
+) -> ResultadoImportacao:
+    """
+    Importa as notícias de um iterável de linhas NDJSON.
+    Linhas inválidas ou recusadas pelo banco são reportadas e puladas; cada
+    lote é uma transação.
+    """
+    resultado = ResultadoImportacao()
+    lote: dict[str, tuple[int, NoticiaImportacao]] = {}  # slug -> (nº da linha, notícia)
+
+    def descarregar():
+        if not lote:
+            return
+        recusadas = 0
+        try:
+            with engine.begin() as conexao:
+                importadas, categorias, tags = _importar_lote(
+                    conexao, [noticia for _, noticia in lote.values()]
+                )
+                _atualizar_agregados(conexao, categorias, tags)
+        except _erros_de_integridade(engine):
+            logger.warning("Lote recusado pelo banco; refazendo linha a linha")
+            with engine.begin() as conexao:
+                importadas, recusadas, categorias, tags = _importar_linha_a_linha(
+                    conexao, lote, resultado
+                )
+                _atualizar_agregados(conexao, categorias, tags)
+        resultado.importadas += importadas
+        resultado.ja_existentes += len(lote) - importadas - recusadas
+        logger.info("Lote importado: %s novas de %s", importadas, len(lote))
+        lote.clear()
+
+    for numero, linha in enumerate(linhas, start=1):
+        if not linha.strip():
+            continue
+        resultado.lidas += 1
+        try:
+            noticia = NoticiaImportacao.model_validate(json.loads(linha))
+        except (ValueError, ValidationError) as erro:
+            _reportar_erro(resultado, numero, erro)
+            continue
+
+        if noticia.slug in lote:
+            # Slug repetido no mesmo arquivo: vale a primeira ocorrência
+            resultado.ja_existentes += 1
+            continue
+        lote[noticia.slug] = (numero, noticia)
+        if len(lote) >= tamanho_lote:
+            descarregar()
+
+    descarregar()
+    return resultado
+
+
+def importar_arquivo(arquivo: TextIO, tamanho_lote: int = TAMANHO_LOTE) -> ResultadoImportacao:
+    return importar_noticias(arquivo, tamanho_lote=tamanho_lote)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Importa notícias de um arquivo NDJSON.")
+    parser.add_argument("arquivo")
+    parser.add_argument("--lote", type=int, default=TAMANHO_LOTE)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    with open(args.arquivo, encoding="utf-8") as arquivo:
+        print(importar_arquivo(arquivo, args.lote).model_dump_json(indent=2))
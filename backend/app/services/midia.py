@@ -0,0 +1,222 @@
+# app/services/midia.py
+"""
+Armazenamento de imagens enviadas pelos editores (capas de notícias e
+imagens de eventos).
+
+- O corpo da requisição é lido direto do stream (sem multipart, que o
+  Starlette guardaria inteiro antes de a rota ver o primeiro byte) e
+  copiado para disco em blocos, calculando o SHA-256 e conferindo o limite
+  de tamanho no caminho; a memória usada não depende do tamanho do arquivo.
+- O arquivo é endereçado pelo conteúdo (originais/ab/abcdef....jpg): enviar
+  a mesma imagem duas vezes não ocupa espaço extra e a URL é estável, o que
+  permite cache "imutável" no navegador/CDN.
+- As miniaturas WebP (settings.THUMBNAIL_LARGURAS) são geradas em um pool de
+  processos, fora da requisição. Miniaturas que faltarem (fila cheia, queda
+  do servidor) são refeitas no próximo envio do mesmo arquivo ou por:
+
+    python -m app.services.midia miniaturas
+"""
+import asyncio
+import hashlib
+import logging
+import multiprocessing
+import os
+import tempfile
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from pathlib import Path
+from typing import AsyncIterator
+from fastapi import HTTPException, status
+
+from app.core.config import settings
+from app.core.imagens import detectar_formato, gerar_miniaturas
+from app.schemas.midia import ImagemEnviada
+
+logger = logging.getLogger("app.midia")
+
+TAMANHO_BLOCO = 1024 * 1024
+
+
+def _raiz() -> Path:
+    return Path(settings.MEDIA_ROOT)
+
+def _caminho_original(sha256: str, extensao: str) -> Path:
+    return _raiz() / "originais" / sha256[:2] / f"{sha256}.{extensao}"
+
+def _caminho_miniatura(sha256: str, largura: int) -> Path:
+    return _raiz() / "miniaturas" / sha256[:2] / f"{sha256}-{largura}.webp"
+
+def url_midia(caminho: Path) -> str:
+    return f"{settings.MEDIA_URL}/{caminho.relative_to(_raiz()).as_posix()}"
+
+
+# --- POOL DE MINIATURAS ---
+# Mesmo desenho do pool de hash de senhas (app/core/security.py): processos
+# "spawn" e fila limitada. Aqui ninguém espera o resultado; com a fila cheia
+# o trabalho é apenas adiado.
+_executor: ProcessPoolExecutor | None = None
+_pendentes = 0
+_lock = threading.Lock()
+
+def _get_executor() -> ProcessPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ProcessPoolExecutor(
+            max_workers=settings.THUMBNAIL_WORKERS,
+            mp_context=multiprocessing.get_context("spawn")
+        )
+    return _executor
+
+def _ao_terminar(futuro: Future) -> None:
+    global _pendentes
+    with _lock:
+        _pendentes -= 1
+    if not futuro.cancelled() and futuro.exception() is not None:
+        logger.error("Falha ao gerar miniaturas: %r", futuro.exception())
+
+def agendar_miniaturas(origem: Path, destinos: dict[int, Path]) -> bool:
+    """Envia a geração para o pool. Retorna False se a fila estiver cheia."""
+    global _pendentes
+    with _lock:
+        if _pendentes >= settings.THUMBNAIL_MAX_PENDING:
+            logger.warning("Fila de miniaturas cheia; %s fica para depois", origem.name)
+            return False
+        _pendentes += 1
+
+    for destino in destinos.values():
+        destino.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        futuro = _get_executor().submit(
+            gerar_miniaturas, str(origem), {largura: str(d) for largura, d in destinos.items()}
+        )
+    except Exception:
+        with _lock:
+            _pendentes -= 1
+        raise
+    futuro.add_done_callback(_ao_terminar)
+    return True
+
+def shutdown_pool_miniaturas() -> None:
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
+
+
+# --- UPLOAD ---
+def _arquivo_grande_demais() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+        detail=f"Arquivo maior que {settings.UPLOAD_MAX_BYTES // (1024 * 1024)} MB."
+    )
+
+
+def _gravar_bloco(temporario, sha256, bloco: bytes) -> None:
+    sha256.update(bloco)
+    temporario.write(bloco)
+
+
+def _publicar(temporario: Path, digest: str, extensao: str, tamanho: int) -> ImagemEnviada:
+    # 1. Endereçamento por conteúdo: se já existe, descarta a cópia nova
+    destino = _caminho_original(digest, extensao)
+    duplicada = destino.exists()
+    if duplicada:
+        os.unlink(temporario)
+    else:
+        destino.parent.mkdir(parents=True, exist_ok=True)
+        os.replace(temporario, destino) # Atômico: nunca fica meio arquivo no destino
+
+    # 2. Miniaturas que ainda não existem vão para o pool
+    miniaturas = {largura: _caminho_miniatura(digest, largura) for largura in settings.THUMBNAIL_LARGURAS}
+    faltando = {largura: caminho for largura, caminho in miniaturas.items() if not caminho.exists()}
+    if faltando:
+        agendar_miniaturas(destino, faltando)
+
+    return ImagemEnviada(
+        url=url_midia(destino),
+        sha256=digest,
+        tamanho=tamanho,
+        duplicada=duplicada,
+        miniaturas={largura: url_midia(caminho) for largura, caminho in miniaturas.items()},
+    )
+
+
+async def salvar_imagem(corpo: AsyncIterator[bytes], tamanho_declarado: int | None = None) -> ImagemEnviada:
+    """
+    Grava a imagem que chega em `corpo` (ex.: request.stream()) e agenda as
+    miniaturas. O hash e a escrita rodam numa thread, em blocos de até
+    TAMANHO_BLOCO; o loop de eventos só junta os pedaços recebidos.
+    """
+    # 1. Content-Length acima do limite: recusa sem ler o corpo
+    if tamanho_declarado is not None and tamanho_declarado > settings.UPLOAD_MAX_BYTES:
+        raise _arquivo_grande_demais()
+
+    pasta_tmp = Path(settings.UPLOAD_TMP_DIR)
+    pasta_tmp.mkdir(parents=True, exist_ok=True)
+    sha256 = hashlib.sha256()
+    tamanho = 0
+    extensao = None
+    pendente = bytearray()
+
+    async def gravar() -> None:
+        nonlocal extensao
+        # O primeiro bloco gravado tem o início do arquivo: confere o formato antes
+        if extensao is None:
+            extensao = detectar_formato(bytes(pendente[:16]))
+            if extensao is None:
+                raise HTTPException(
+                    status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+                    detail="Envie uma imagem JPEG, PNG, GIF ou WebP."
+                )
+        await asyncio.to_thread(_gravar_bloco, temporario, sha256, bytes(pendente))
+        pendente.clear()
+
+    # 2. Copia em blocos para um arquivo temporário; o limite vale para o que
+    #    chega de fato, com ou sem Content-Length
+    with tempfile.NamedTemporaryFile(dir=pasta_tmp, delete=False) as temporario:
+        try:
+            async for pedaco in corpo:
+                tamanho += len(pedaco)
+                if tamanho > settings.UPLOAD_MAX_BYTES:
+                    raise _arquivo_grande_demais()
+                pendente += pedaco
+                if len(pendente) >= TAMANHO_BLOCO:
+                    await gravar()
+            await gravar()
+        except BaseException:
+            temporario.close()
+            os.unlink(temporario.name)
+            raise
+
+    # 3. Move para o destino definitivo e agenda as miniaturas
+    return await asyncio.to_thread(
+        _publicar, Path(temporario.name), sha256.hexdigest(), extensao, tamanho
+    )
+
+
+def gerar_miniaturas_pendentes() -> int:
+    """Gera (no processo atual) as miniaturas que faltam. Retorna quantas foram criadas."""
+    total = 0
+    for original in sorted((_raiz() / "originais").glob("*/*")):
+        faltando = {
+            largura: str(caminho)
+            for largura in settings.THUMBNAIL_LARGURAS
+            if not (caminho := _caminho_miniatura(original.stem, largura)).exists()
+        }
+        if not faltando:
+            continue
+        _caminho_miniatura(original.stem, 0).parent.mkdir(parents=True, exist_ok=True)
+        try:
+            total += len(gerar_miniaturas(str(original), faltando))
+        except Exception as erro:
+            logger.error("Falha ao gerar miniaturas de %s: %r", original.name, erro)
+    return total
+
+
+if __name__ == "__main__":
+    import sys
+
+    logging.basicConfig(level=logging.INFO)
+    if sys.argv[1:] != ["miniaturas"]:
+        sys.exit("uso: python -m app.services.midia miniaturas")
+    print(f"{gerar_miniaturas_pendentes()} miniaturas geradas")
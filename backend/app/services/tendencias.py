@@ -0,0 +1,273 @@
+# app/services/tendencias.py
+"""
+Ranking de notícias "em alta" (GET /noticias/em-alta).
+
+A pontuação de uma notícia é a soma dos seus eventos (visualização, curtida,
+comentário), cada um com o peso TRENDING_PESO_* que cai pela metade a cada
+TRENDING_MEIA_VIDA_HORAS. Em vez de reduzir todas as pontuações com o tempo,
+cada evento entra com peso 2^((t - inicio_da_janela) / meia_vida): todas as
+notícias "decaem" no mesmo ritmo, então a ordem não muda e somar um evento
+novo é só `pontuacao + delta`. A cada JANELA_MEIAS_VIDAS meias-vidas a base é
+trocada (as pontuações são multiplicadas por 2^-64) para o número não crescer
+sem limite.
+
+Fluxo:
+1. Os eventos são somados em memória, sem tocar no banco (como as curtidas).
+2. A cada TRENDING_INTERVALO_SECONDS os deltas viram um único upsert na
+   tabela `tendencias` (somando os de todos os workers).
+3. Em seguida o top-K geral e de cada categoria é relido pelos índices da
+   tabela e fica em memória: a rota não faz nenhuma query.
+
+Se o processo cair, perdem-se no máximo os eventos de um intervalo; ao
+subir, o ranking é recarregado da tabela.
+"""
+import asyncio
+import logging
+import threading
+import time
+from collections import Counter
+from datetime import datetime
+from sqlalchemy import case, delete, event, inspect, or_, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.database import async_engine
+from app.models.categoria import Categoria
+from app.models.comentario import Comentario
+from app.models.noticia import Noticia
+from app.models.tendencia import PontuacaoTendencia
+
+logger = logging.getLogger("app.tendencias")
+
+JANELA_MEIAS_VIDAS = 64
+REESCALA = 2.0 ** -JANELA_MEIAS_VIDAS # Leva uma pontuação para a janela seguinte
+
+PESOS = {
+    "visualizacao": settings.TRENDING_PESO_VISUALIZACAO,
+    "curtida": settings.TRENDING_PESO_CURTIDA,
+    "comentario": settings.TRENDING_PESO_COMENTARIO,
+}
+
+
+def _meia_vida() -> float:
+    return settings.TRENDING_MEIA_VIDA_HORAS * 3600
+
+
+def janela_atual(agora: float) -> int:
+    return int(agora // (_meia_vida() * JANELA_MEIAS_VIDAS))
+
+
+def peso_no_instante(agora: float, janela: int) -> float:
+    """Peso de um evento de valor 1 em `agora`, nas unidades da janela (1 a 2^64)."""
+    inicio = janela * _meia_vida() * JANELA_MEIAS_VIDAS
+    return 2.0 ** ((agora - inicio) / _meia_vida())
+
+
+def _upsert(conexao, tabela):
+    """
+    INSERT ... ON CONFLICT DO UPDATE que soma o delta à pontuação guardada,
+    levando a que estiver em outra janela para a mesma base antes de somar.
+    """
+    stmt = (pg_insert if conexao.dialect.name == "postgresql" else sqlite_insert)(tabela)
+    novo = stmt.excluded
+    return stmt.on_conflict_do_update(
+        index_elements=[tabela.c.noticia_id],
+        set_={
+            "pontuacao": case(
+                (tabela.c.janela == novo.janela, tabela.c.pontuacao + novo.pontuacao),
+                (tabela.c.janela < novo.janela, tabela.c.pontuacao * REESCALA + novo.pontuacao),
+                # Outro worker já virou a janela (relógios um pouco diferentes)
+                else_=tabela.c.pontuacao + novo.pontuacao * REESCALA,
+            ),
+            "janela": case((tabela.c.janela > novo.janela, tabela.c.janela), else_=novo.janela),
+            "categoria_id": novo.categoria_id,
+            "atualizado_em": novo.atualizado_em,
+        },
+    )
+
+
+class RankingTendencias:
+    """Eventos pendentes e o top-K carregado da tabela `tendencias`."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._por_id: Counter = Counter() # noticia_id -> peso pendente
+        self._por_slug: Counter = Counter() # Visualizações chegam pelo slug
+        # categoria_id (None = geral) -> itens do mais ao menos pontuado, já
+        # nos campos de NoticiaEmAlta (a rota serializa direto com o orjson)
+        self._ranking: dict[int | None, list[dict]] = {}
+        self._janela_reescalada: int | None = None
+
+    def registrar(self, noticia_id: int, evento: str, quantidade: float = 1) -> None:
+        with self._lock:
+            self._por_id[noticia_id] += PESOS[evento] * quantidade
+
+    def remover(self, noticia_id: int, evento: str, ocorrido_em: datetime) -> None:
+        """
+        Desfaz um evento (ex.: curtida removida): retira só o peso que ele
+        ainda tem, já decaído desde `ocorrido_em`, e não o de um evento novo.
+        """
+        fator = 2.0 ** ((ocorrido_em.timestamp() - time.time()) / _meia_vida())
+        self.registrar(noticia_id, evento, -min(fator, 1.0))
+
+    def registrar_visualizacao(self, slug: str) -> None:
+        with self._lock:
+            self._por_slug[slug] += PESOS["visualizacao"]
+
+    def em_alta(self, categoria_id: int | None = None, limite: int = 20) -> list[dict]:
+        return self._ranking.get(categoria_id, [])[:limite]
+
+    def _retirar(self) -> tuple[Counter, Counter]:
+        with self._lock:
+            por_id, por_slug = self._por_id, self._por_slug
+            self._por_id, self._por_slug = Counter(), Counter()
+        return por_id, por_slug
+
+    def _devolver(self, por_id: Counter, por_slug: Counter) -> None:
+        with self._lock:
+            self._por_id.update(por_id)
+            self._por_slug.update(por_slug)
+
+    async def atualizar(self, engine: AsyncEngine = async_engine) -> int:
+        """
+        Grava os eventos pendentes e recarrega o top-K. Retorna quantas
+        notícias tiveram a pontuação alterada.
+        """
+        por_id, por_slug = self._retirar()
+        agora = time.time()
+        janela = janela_atual(agora)
+        peso = peso_no_instante(agora, janela)
+        tabela = PontuacaoTendencia.__table__
+        noticias = Noticia.__table__
+
+        try:
+            async with engine.begin() as conexao:
+                # 1. Janela nova: leva as pontuações da anterior para a nova base
+                #    (idempotente: o worker que chegar depois não encontra linhas)
+                if self._janela_reescalada != janela:
+                    await conexao.execute(
+                        update(tabela).where(tabela.c.janela == janela - 1)
+                        .values(pontuacao=tabela.c.pontuacao * REESCALA, janela=janela)
+                    )
+                    # Duas janelas atrás: já decaiu para menos de 2^-64
+                    await conexao.execute(delete(tabela).where(tabela.c.janela < janela - 1))
+
+                # 2. Resolve slug/categoria das notícias com eventos (só publicadas)
+                deltas = {}
+                filtros = []
+                if por_id:
+                    filtros.append(noticias.c.id.in_(list(por_id)))
+                if por_slug:
+                    filtros.append(noticias.c.slug.in_(list(por_slug)))
+                if filtros:
+                    linhas = await conexao.execute(
+                        select(noticias.c.id, noticias.c.slug, noticias.c.categoria_id)
+                        .where(noticias.c.publicado == True)
+                        .where(or_(*filtros))
+                    )
+                    for noticia_id, slug, categoria_id in linhas:
+                        valor = por_id.get(noticia_id, 0) + por_slug.get(slug, 0)
+                        if valor:
+                            deltas[noticia_id] = (categoria_id, valor * peso)
+
+                # 3. Um upsert para todas (ids em ordem fixa, como nas curtidas)
+                if deltas:
+                    atualizado_em = datetime.now()
+                    await conexao.execute(_upsert(conexao, tabela), [
+                        {
+                            "noticia_id": noticia_id, "categoria_id": categoria_id,
+                            "pontuacao": delta, "janela": janela, "atualizado_em": atualizado_em,
+                        }
+                        for noticia_id, (categoria_id, delta) in sorted(deltas.items())
+                    ])
+
+                # 4. Top-K geral e por categoria, de volta para a memória
+                ranking = await self._carregar(conexao, janela, peso)
+        except Exception:
+            self._devolver(por_id, por_slug)
+            raise
+
+        self._janela_reescalada = janela
+        self._ranking = ranking
+        return len(deltas)
+
+    async def _carregar(self, conexao, janela: int, peso: float) -> dict[int | None, list[dict]]:
+        tabela = PontuacaoTendencia.__table__
+        noticias = Noticia.__table__
+        base = (
+            select(
+                noticias.c.id, noticias.c.titulo, noticias.c.subtitulo, noticias.c.slug,
+                noticias.c.imagem_capa, noticias.c.publicado_em, noticias.c.autor_id,
+                noticias.c.categoria_id, tabela.c.pontuacao,
+            )
+            .join(noticias, noticias.c.id == tabela.c.noticia_id)
+            .where(tabela.c.janela == janela)
+            .where(tabela.c.pontuacao > 0)
+            .where(noticias.c.publicado == True)
+            .where(noticias.c.publicado_em.is_not(None))
+            .order_by(tabela.c.pontuacao.desc())
+            .limit(settings.TRENDING_TOP_K)
+        )
+
+        categoria_ids = (await conexao.execute(select(Categoria.__table__.c.id))).scalars().all()
+        ranking = {}
+        for categoria_id in [None, *categoria_ids]:
+            query = base if categoria_id is None else base.where(tabela.c.categoria_id == categoria_id)
+            linhas = (await conexao.execute(query)).mappings()
+            ranking[categoria_id] = [
+                # Pontuação exibida: valor decaído até agora, em "eventos de peso 1"
+                {**linha, "pontuacao": round(linha["pontuacao"] / peso, 3)}
+                for linha in linhas
+            ]
+        return ranking
+
+
+ranking = RankingTendencias()
+
+
+async def executar_atualizacao_periodica(parar: asyncio.Event) -> None:
+    """Atualiza o ranking ao subir, a cada TRENDING_INTERVALO_SECONDS e ao parar."""
+    while True:
+        try:
+            await ranking.atualizar()
+        except Exception:
+            logger.exception("Falha ao atualizar o ranking de tendências")
+        if parar.is_set():
+            return
+        try:
+            await asyncio.wait_for(parar.wait(), timeout=settings.TRENDING_INTERVALO_SECONDS)
+        except asyncio.TimeoutError:
+            pass
+
+
+# --- Comentários ---
+# Não há uma rota única que crie comentários: qualquer comentário aprovado
+# gravado pelo ORM conta, mas só depois do commit.
+
+def _comentarios_pendentes(session) -> list[int]:
+    return session.info.setdefault("tendencias_comentarios", [])
+
+
+@event.listens_for(Session, "after_flush")
+def _comentarios_gravados(session, flush_context):
+    # Comentários novos já aprovados, ou aprovados agora pela moderação
+    pendentes = _comentarios_pendentes(session)
+    for obj in list(session.new) + list(session.dirty):
+        if not isinstance(obj, Comentario) or not obj.aprovado or obj.noticia_id is None:
+            continue
+        if obj in session.new or False in inspect(obj).attrs.aprovado.history.deleted:
+            pendentes.append(obj.noticia_id)
+
+
+@event.listens_for(Session, "after_commit")
+def _registrar_comentarios(session):
+    for noticia_id in session.info.pop("tendencias_comentarios", ()):
+        ranking.registrar(noticia_id, "comentario")
+
+
+@event.listens_for(Session, "after_rollback")
+def _descartar_comentarios(session):
+    session.info.pop("tendencias_comentarios", None)
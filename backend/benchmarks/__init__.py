@@ -0,0 +1,5 @@
+"""
+Benchmark da API: popula um banco com dados sintéticos e mede a latência
+(p50/p95/p99) e a vazão por rota, chamando o app FastAPI no próprio
+processo (sem rede). Ver benchmarks/__main__.py para o uso.
+"""
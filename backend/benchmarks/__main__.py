@@ -0,0 +1,171 @@
+# benchmarks/__main__.py
+"""
+Executa o benchmark (a partir da pasta backend/):
+
+    python -m benchmarks                                   # SQLite temporário
+    python -m benchmarks --database-url postgresql://localhost/jornal_bench
+    python -m benchmarks --escala 5 --requisicoes 20000 --json resultado.json
+    python -m benchmarks --base resultado.json             # compara com uma execução anterior
+
+O banco indicado é APAGADO e recriado com dados sintéticos. A API roda no
+mesmo processo (httpx + ASGITransport, sem rede), com o lifespan real.
+Limites de requisição ficam desligados para não medir 429.
+"""
+import argparse
+import asyncio
+import json
+import math
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+from collections import defaultdict
+
+
+def _percentil(ordenados: list[float], p: float) -> float:
+    # Nearest-rank: sempre um valor observado
+    return ordenados[max(0, math.ceil(p / 100 * len(ordenados)) - 1)]
+
+
+def _configurar_ambiente(args) -> None:
+    # As settings são lidas na importação do app: o ambiente vem antes
+    os.environ["DATABASE_URL"] = args.database_url
+    os.environ.setdefault("MAIL_USERNAME", "benchmark")
+    os.environ.setdefault("MAIL_PASSWORD", "benchmark")
+    os.environ.setdefault("MAIL_FROM", "benchmark@ufc.br")
+    os.environ.setdefault("MAIL_SERVER", "localhost")
+    os.environ["EMAIL_WORKER_EMBEDDED"] = "False" # E-mails ficam na caixa de saída
+    os.environ["RATE_LIMIT_ENABLED"] = "False"
+    os.environ.setdefault("MEDIA_ROOT", tempfile.mkdtemp(prefix="jornal-bench-media-"))
+
+
+async def _executar(args) -> dict:
+    import httpx
+    from app.core.config import settings
+    from app.core.database import engine
+    from benchmarks.cenario import MIX
+    from benchmarks.dados import popular
+    from main import app
+
+    inicio = time.perf_counter()
+    dados = popular(engine, escala=args.escala, semente=args.semente)
+    print(f"Banco populado em {time.perf_counter() - inicio:.1f}s ({engine.dialect.name}, escala {args.escala})")
+
+    pesos = [op.peso for op in MIX]
+    amostras: dict[str, list[float]] = defaultdict(list)
+    erros: dict[str, int] = defaultdict(int)
+
+    async with app.router.lifespan_context(app):
+        transporte = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transporte, base_url="http://benchmark/api/v1") as cliente:
+
+            async def trabalhador(rng: random.Random, fila: list[int], medir: bool):
+                while fila:
+                    fila.pop()
+                    op = rng.choices(MIX, weights=pesos)[0]
+                    t0 = time.perf_counter()
+                    resposta = await op.executar(cliente, rng, dados)
+                    duracao = time.perf_counter() - t0
+                    if not medir:
+                        continue
+                    amostras[op.rota].append(duracao)
+                    if resposta.status_code not in op.status_esperado:
+                        erros[op.rota] += 1
+
+            async def rodada(total: int, medir: bool, semente: int) -> float:
+                fila = list(range(total))
+                t0 = time.perf_counter()
+                await asyncio.gather(*(
+                    trabalhador(random.Random(semente + i), fila, medir)
+                    for i in range(args.concorrencia)
+                ))
+                return time.perf_counter() - t0
+
+            await rodada(args.aquecimento, medir=False, semente=args.semente * 1_000)
+            duracao_total = await rodada(args.requisicoes, medir=True, semente=args.semente)
+
+    rotas = {}
+    for op in MIX:
+        ordenados = sorted(amostras[op.rota])
+        if not ordenados:
+            continue
+        rotas[op.rota] = {
+            "n": len(ordenados),
+            "erros": erros[op.rota],
+            "req_s": len(ordenados) / duracao_total,
+            "p50_ms": _percentil(ordenados, 50) * 1000,
+            "p95_ms": _percentil(ordenados, 95) * 1000,
+            "p99_ms": _percentil(ordenados, 99) * 1000,
+        }
+
+    return {
+        "ambiente": {
+            "dialeto": engine.dialect.name,
+            "escala": args.escala,
+            "semente": args.semente,
+            "requisicoes": args.requisicoes,
+            "concorrencia": args.concorrencia,
+            "bcrypt_rounds": settings.BCRYPT_ROUNDS,
+            "python": platform.python_version(),
+        },
+        "duracao_s": duracao_total,
+        "req_s": args.requisicoes / duracao_total,
+        "rotas": rotas,
+    }
+
+
+def _imprimir(resultado: dict, base: dict | None) -> None:
+    cabecalho = f"{'rota':<34}{'n':>7}{'erros':>7}{'req/s':>9}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}"
+    if base:
+        cabecalho += f"{'Δ p95':>9}"
+    print(cabecalho)
+    print("-" * len(cabecalho))
+    for rota, r in resultado["rotas"].items():
+        linha = (
+            f"{rota:<34}{r['n']:>7}{r['erros']:>7}{r['req_s']:>9.1f}"
+            f"{r['p50_ms']:>9.2f}{r['p95_ms']:>9.2f}{r['p99_ms']:>9.2f}"
+        )
+        anterior = (base or {}).get("rotas", {}).get(rota)
+        if anterior:
+            linha += f"{(r['p95_ms'] / anterior['p95_ms'] - 1) * 100:>+8.0f}%"
+        print(linha)
+    print(f"\nTotal: {resultado['req_s']:.1f} req/s em {resultado['duracao_s']:.1f}s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark da API do Jornal UFC.")
+    parser.add_argument("--database-url", help="Padrão: SQLite em arquivo temporário")
+    parser.add_argument("--escala", type=float, default=1.0)
+    parser.add_argument("--requisicoes", type=int, default=5_000)
+    parser.add_argument("--aquecimento", type=int, default=500)
+    parser.add_argument("--concorrencia", type=int, default=16)
+    parser.add_argument("--semente", type=int, default=42)
+    parser.add_argument("--json", help="Grava o resultado neste arquivo")
+    parser.add_argument("--base", help="Resultado anterior (JSON) para comparar o p95")
+    args = parser.parse_args()
+
+    if not args.database_url:
+        pasta = tempfile.mkdtemp(prefix="jornal-bench-")
+        args.database_url = f"sqlite:///{os.path.join(pasta, 'benchmark.sqlite')}"
+
+    _configurar_ambiente(args)
+    resultado = asyncio.run(_executar(args))
+
+    base = None
+    if args.base:
+        with open(args.base, encoding="utf-8") as arquivo:
+            base = json.load(arquivo)
+    _imprimir(resultado, base)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as arquivo:
+            json.dump(resultado, arquivo, indent=2, ensure_ascii=False)
+
+    if any(r["erros"] for r in resultado["rotas"].values()):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
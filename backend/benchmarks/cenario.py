@@ -0,0 +1,64 @@
+# benchmarks/cenario.py
+"""
+Mistura fixa de operações do benchmark. Os pesos aproximam o tráfego real:
+a maior parte é leitura (feed, artigo, comentários); login e cadastro são
+raros, mas caros (bcrypt).
+"""
+import itertools
+import random
+from dataclasses import dataclass
+from typing import Awaitable, Callable
+import httpx
+
+from benchmarks.dados import DadosGerados, SENHA_PADRAO
+
+Executor = Callable[[httpx.AsyncClient, random.Random, DadosGerados], Awaitable[httpx.Response]]
+
+
+@dataclass(frozen=True)
+class Operacao:
+    rota: str # Nome usado no relatório
+    peso: int
+    executar: Executor
+    status_esperado: frozenset[int] = frozenset({200})
+
+
+async def _feed(cliente, rng, dados):
+    return await cliente.get("/noticias/", params={"limit": 20})
+
+async def _feed_categoria(cliente, rng, dados):
+    return await cliente.get("/noticias/", params={"limit": 20, "categoria_id": rng.choice(dados.ids_categorias)})
+
+async def _artigo(cliente, rng, dados):
+    # Cauda longa: poucas notícias concentram a maior parte das leituras
+    indice = min(int(rng.paretovariate(1.2)) - 1, len(dados.slugs_publicados) - 1)
+    return await cliente.get(f"/noticias/{dados.slugs_publicados[indice]}")
+
+async def _comentarios(cliente, rng, dados):
+    indice = min(int(rng.paretovariate(1.2)) - 1, len(dados.ids_publicados) - 1)
+    return await cliente.get(f"/noticias/{dados.ids_publicados[indice]}/comentarios", params={"limit": 20})
+
+async def _login(cliente, rng, dados):
+    return await cliente.post("/auth/login", data={
+        "username": rng.choice(dados.emails_leitores), "password": SENHA_PADRAO
+    })
+
+_sequencia_cadastro = itertools.count()
+
+async def _cadastro(cliente, rng, dados):
+    n = next(_sequencia_cadastro)
+    corpo = {"nome": f"Novo {n}", "email": f"novo{n}@exemplo.com", "senha": SENHA_PADRAO}
+    if n % 4 == 0:
+        # Bolsista: busca o orientador e enfileira e-mail para ele
+        corpo.update(role="bolsista", email_orientador=rng.choice(dados.emails_professores))
+    return await cliente.post("/usuarios/", json=corpo)
+
+
+MIX = [
+    Operacao("GET /noticias/", 35, _feed),
+    Operacao("GET /noticias/?categoria_id", 10, _feed_categoria),
+    Operacao("GET /noticias/{slug}", 30, _artigo),
+    Operacao("GET /noticias/{id}/comentarios", 15, _comentarios),
+    Operacao("POST /auth/login", 7, _login),
+    Operacao("POST /usuarios/", 3, _cadastro, frozenset({201})),
+]
@@ -0,0 +1,185 @@
+# benchmarks/dados.py
+"""
+Gerador de dados sintéticos, determinístico (mesma escala e semente ->
+mesmo banco). Escala 1 equivale a um jornal de porte médio; as
+quantidades crescem linearmente com a escala.
+"""
+import random
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from sqlalchemy import insert
+from sqlalchemy.engine import Engine
+from sqlmodel import SQLModel
+
+from app.core.config import settings
+from app.core.hashing import hash_senha
+from app.models import (
+    Usuario, Noticia, Tag, NoticiasTags, CurtidaNoticia, Categoria,
+    Comentario, CurtidaComentario,
+)
+from app.models.faceta import reconstruir_facetas
+from app.models.usuario import RoleEnum
+from app.models.versao import incrementar_versao
+
+SENHA_PADRAO = "senha-benchmark" # Senha de todos os usuários gerados
+TAMANHO_LOTE = 5_000
+
+# Quantidades na escala 1
+POR_ESCALA = {
+    "professores": 20,
+    "bolsistas_por_professor": 5,
+    "leitores": 1_000,
+    "categorias": 10,
+    "tags": 60,
+    "noticias": 2_000,
+    "comentarios": 20_000,
+    "curtidas_noticias": 50_000,
+    "curtidas_comentarios": 20_000,
+}
+
+
+@dataclass
+class DadosGerados:
+    """O que o cenário precisa para montar requisições válidas."""
+    emails_leitores: list[str] = field(default_factory=list)
+    emails_professores: list[str] = field(default_factory=list)
+    slugs_publicados: list[str] = field(default_factory=list)
+    ids_publicados: list[int] = field(default_factory=list)
+    ids_categorias: list[int] = field(default_factory=list)
+
+
+def _inserir(conexao, modelo, linhas: list[dict]) -> None:
+    for inicio in range(0, len(linhas), TAMANHO_LOTE):
+        conexao.execute(insert(modelo.__table__), linhas[inicio:inicio + TAMANHO_LOTE])
+
+
+def _quantidade(nome: str, escala: float) -> int:
+    return max(1, round(POR_ESCALA[nome] * escala))
+
+
+def popular(engine: Engine, escala: float = 1.0, semente: int = 42) -> DadosGerados:
+    """Recria todas as tabelas e gera os dados na escala pedida."""
+    rng = random.Random(semente)
+    agora = datetime(2025, 1, 1)
+    # Um único hash real (com o custo configurado): o login faz o bcrypt de verdade
+    senha_hash = hash_senha(SENHA_PADRAO, settings.BCRYPT_ROUNDS)
+
+    SQLModel.metadata.drop_all(engine)
+    SQLModel.metadata.create_all(engine)
+
+    with engine.begin() as conexao:
+        # 1. Usuários: professores -> bolsistas (hierarquia), leitores
+        usuarios = []
+        n_professores = _quantidade("professores", escala)
+        for i in range(n_professores):
+            usuarios.append(dict(
+                id=len(usuarios) + 1, nome=f"Professor {i}", email=f"professor{i}@ufc.br",
+                senha_hash=senha_hash, role=RoleEnum.PROFESSOR, is_active=True,
+                criado_em=agora, orientador_id=None,
+            ))
+        for i in range(n_professores * POR_ESCALA["bolsistas_por_professor"]):
+            usuarios.append(dict(
+                id=len(usuarios) + 1, nome=f"Bolsista {i}", email=f"bolsista{i}@alu.ufc.br",
+                senha_hash=senha_hash, role=RoleEnum.BOLSISTA,
+                is_active=rng.random() < 0.8, # Parte aguardando aprovação
+                criado_em=agora, orientador_id=i % n_professores + 1,
+            ))
+        for i in range(_quantidade("leitores", escala)):
+            usuarios.append(dict(
+                id=len(usuarios) + 1, nome=f"Leitor {i}", email=f"leitor{i}@exemplo.com",
+                senha_hash=senha_hash, role=RoleEnum.LEITOR, is_active=True,
+                criado_em=agora, orientador_id=None,
+            ))
+        _inserir(conexao, Usuario, usuarios)
+        autores = [u["id"] for u in usuarios if u["role"] in (RoleEnum.PROFESSOR, RoleEnum.BOLSISTA)]
+        leitores = [u["id"] for u in usuarios if u["role"] == RoleEnum.LEITOR]
+
+        # 2. Categorias e tags
+        categorias = [
+            dict(id=i + 1, nome=f"Categoria {i}", slug=f"categoria-{i}")
+            for i in range(_quantidade("categorias", escala))
+        ]
+        tags = [dict(id=i + 1, nome=f"Tag {i}", slug=f"tag-{i}") for i in range(_quantidade("tags", escala))]
+        _inserir(conexao, Categoria, categorias)
+        _inserir(conexao, Tag, tags)
+
+        # 3. Notícias (90% publicadas, espalhadas por dois anos) e vínculos com tags
+        noticias, vinculos = [], []
+        palavras = ["campus", "pesquisa", "extensão", "reitoria", "bolsa", "edital",
+                    "congresso", "laboratório", "estudantes", "ciência", "cultura", "esporte"]
+        for i in range(_quantidade("noticias", escala)):
+            publicado = rng.random() < 0.9
+            publicado_em = agora - timedelta(minutes=rng.randrange(2 * 365 * 24 * 60))
+            noticias.append(dict(
+                id=i + 1,
+                titulo=" ".join(rng.choices(palavras, k=6)).capitalize(),
+                subtitulo=" ".join(rng.choices(palavras, k=12)),
+                conteudo=" ".join(rng.choices(palavras, k=rng.randrange(200, 800))),
+                slug=f"noticia-{i}",
+                imagem_capa=None,
+                publicado=publicado,
+                publicado_em=publicado_em if publicado else None,
+                total_curtidas=0,
+                criado_em=publicado_em,
+                atualizado_em=publicado_em,
+                autor_id=rng.choice(autores),
+                categoria_id=rng.choice(categorias)["id"],
+            ))
+            for tag in rng.sample(tags, k=min(len(tags), rng.randrange(1, 5))):
+                vinculos.append(dict(noticia_id=i + 1, tag_id=tag["id"]))
+        publicadas = [n for n in noticias if n["publicado"]]
+
+        # 4. Comentários (concentrados nas notícias mais populares) e curtidas
+        comentarios = []
+        pesos = [1 / (posicao + 1) for posicao in range(len(publicadas))] # Cauda longa
+        for i, noticia in enumerate(rng.choices(publicadas, weights=pesos, k=_quantidade("comentarios", escala))):
+            comentarios.append(dict(
+                id=i + 1, conteudo=" ".join(rng.choices(palavras, k=20)),
+                criado_em=noticia["publicado_em"] + timedelta(minutes=rng.randrange(1, 10_000)),
+                aprovado=rng.random() < 0.95, total_curtidas=0,
+                usuario_id=rng.choice(leitores), noticia_id=noticia["id"],
+            ))
+
+        def curtidas(alvos: list[dict], chave: str, quantidade: int, pesos=None) -> list[dict]:
+            # Pares repetidos (mesmo leitor, mesmo alvo) viram uma curtida só
+            pares = {
+                (rng.choice(leitores), alvo["id"])
+                for alvo in rng.choices(alvos, weights=pesos, k=quantidade)
+            }
+            contagem: dict[int, int] = {}
+            for _, alvo_id in pares:
+                contagem[alvo_id] = contagem.get(alvo_id, 0) + 1
+            for alvo in alvos:
+                alvo["total_curtidas"] = contagem.get(alvo["id"], 0)
+            return [dict(usuario_id=u, **{chave: a}, criado_em=agora) for u, a in pares]
+
+        curtidas_noticias = curtidas(publicadas, "noticia_id", _quantidade("curtidas_noticias", escala), pesos)
+        curtidas_comentarios = curtidas(comentarios, "comentario_id", _quantidade("curtidas_comentarios", escala))
+
+        _inserir(conexao, Noticia, noticias)
+        _inserir(conexao, NoticiasTags, vinculos)
+        _inserir(conexao, Comentario, comentarios)
+        _inserir(conexao, CurtidaNoticia, curtidas_noticias)
+        _inserir(conexao, CurtidaComentario, curtidas_comentarios)
+
+        # 5. O que os hooks do ORM manteriam: facetas e versões das coleções
+        reconstruir_facetas(conexao)
+        incrementar_versao(conexao, "noticias")
+
+    # Sequências do Postgres: os ids foram inseridos explicitamente
+    if engine.dialect.name == "postgresql":
+        with engine.begin() as conexao:
+            for modelo in (Usuario, Categoria, Tag, Noticia, Comentario):
+                tabela = modelo.__tablename__
+                conexao.exec_driver_sql(
+                    f"SELECT setval(pg_get_serial_sequence('{tabela}', 'id'), "
+                    f"(SELECT max(id) FROM {tabela}))"
+                )
+
+    return DadosGerados(
+        emails_leitores=[u["email"] for u in usuarios if u["role"] == RoleEnum.LEITOR],
+        emails_professores=[u["email"] for u in usuarios if u["role"] == RoleEnum.PROFESSOR],
+        slugs_publicados=[n["slug"] for n in publicadas],
+        ids_publicados=[n["id"] for n in publicadas],
+        ids_categorias=[c["id"] for c in categorias],
+    )
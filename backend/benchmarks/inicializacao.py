@@ -0,0 +1,156 @@
+# benchmarks/inicializacao.py
+"""
+Mede a subida a frio de um worker (a partir da pasta backend/):
+
+    python -m benchmarks.inicializacao                          # orçamento padrão
+    python -m benchmarks.inicializacao --orcamento-ms 800 --json subida.json
+    python -m benchmarks.inicializacao --base subida.json       # falha se piorar > 20%
+
+Cada execução é um processo Python novo que importa `main` e roda a subida
+do lifespan. Termina com código 1 (para usar no CI) se a mediana passar do
+orçamento, se piorar além da tolerância em relação à base, ou se algum
+subsistema que deveria ser carregado só no primeiro uso (e-mail, bcrypt,
+JWT, imagens, perfilador, Redis) já estiver importado depois da subida.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+ORCAMENTO_MS = 1500.0 # import + subida, mediana
+
+# Carregados sob demanda: não podem aparecer em sys.modules depois da subida
+PROIBIDOS = (
+    "fastapi_mail", "aiosmtplib", "passlib", "bcrypt", "jose", "cryptography",
+    "PIL", "pyinstrument", "redis",
+)
+
+_CODIGO = """
+import asyncio, json, sys, time
+inicio = time.perf_counter()
+import main
+importado = time.perf_counter()
+
+from sqlmodel import SQLModel
+from app.core.database import engine
+SQLModel.metadata.create_all(engine) # Fora da medição: só para o lifespan ter tabelas
+
+async def subir():
+    contexto = main.app.router.lifespan_context(main.app)
+    t0 = time.perf_counter()
+    await contexto.__aenter__()
+    subida = time.perf_counter() - t0
+    carregados = [m for m in json.loads(sys.argv[1]) if m in sys.modules]
+    await contexto.__aexit__(None, None, None)
+    return subida, carregados
+
+subida, carregados = asyncio.run(subir())
+print(json.dumps({
+    "importacao_ms": (importado - inicio) * 1000,
+    "subida_ms": subida * 1000,
+    "carregados": carregados,
+}))
+"""
+
+
+def _ambiente(database_url: str | None) -> dict:
+    env = dict(os.environ)
+    if database_url:
+        env["DATABASE_URL"] = database_url
+    else:
+        pasta = tempfile.mkdtemp(prefix="jornal-subida-")
+        env["DATABASE_URL"] = f"sqlite:///{os.path.join(pasta, 'subida.sqlite')}"
+    env.setdefault("MAIL_USERNAME", "benchmark")
+    env.setdefault("MAIL_PASSWORD", "benchmark")
+    env.setdefault("MAIL_FROM", "benchmark@ufc.br")
+    env.setdefault("MAIL_SERVER", "localhost")
+    env["PROFILER_ENABLED"] = "False" # Ligado, exige o pyinstrument já na subida
+    return env
+
+
+def _executar(env: dict, importtime: bool = False) -> tuple[dict, str]:
+    comando = [sys.executable]
+    if importtime:
+        comando += ["-X", "importtime"]
+    comando += ["-c", _CODIGO, json.dumps(PROIBIDOS)]
+    processo = subprocess.run(comando, env=env, capture_output=True, text=True)
+    if processo.returncode != 0:
+        sys.stderr.write(processo.stderr)
+        sys.exit(processo.returncode)
+    return json.loads(processo.stdout.strip().splitlines()[-1]), processo.stderr
+
+
+def _maiores_pacotes(importtime: str, quantidade: int) -> list[tuple[str, float]]:
+    """
+    Tempo de import por pacote de primeiro nível (ms): soma do tempo próprio
+    de cada módulo do pacote, sem contar duas vezes o que ele importa de outros.
+    """
+    totais: dict[str, float] = {}
+    for linha in importtime.splitlines():
+        if not linha.startswith("import time:") or "cumulative" in linha:
+            continue
+        proprio, _, nome = linha[len("import time:"):].split("|")
+        pacote = nome.strip().split(".")[0]
+        totais[pacote] = totais.get(pacote, 0) + int(proprio) / 1000
+    return sorted(totais.items(), key=lambda item: item[1], reverse=True)[:quantidade]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Tempo de import e subida da API do Jornal UFC.")
+    parser.add_argument("--database-url", help="Padrão: SQLite em arquivo temporário")
+    parser.add_argument("--execucoes", type=int, default=7)
+    parser.add_argument("--orcamento-ms", type=float, default=ORCAMENTO_MS)
+    parser.add_argument("--json", help="Grava o resultado neste arquivo")
+    parser.add_argument("--base", help="Resultado anterior (JSON) para comparar")
+    parser.add_argument("--tolerancia", type=float, default=0.2, help="Piora aceita sobre a base")
+    args = parser.parse_args()
+
+    env = _ambiente(args.database_url)
+    _executar(env) # Aquecimento: .pyc gerados e cache de disco quente
+
+    execucoes = [_executar(env)[0] for _ in range(args.execucoes)]
+    importacao = statistics.median(e["importacao_ms"] for e in execucoes)
+    subida = statistics.median(e["subida_ms"] for e in execucoes)
+    total = statistics.median(e["importacao_ms"] + e["subida_ms"] for e in execucoes)
+    carregados = sorted({m for e in execucoes for m in e["carregados"]})
+
+    _, importtime = _executar(env, importtime=True)
+    print(f"{'pacote':<24}{'import ms':>10}")
+    print("-" * 34)
+    for pacote, ms in _maiores_pacotes(importtime, 12):
+        print(f"{pacote:<24}{ms:>10.1f}")
+
+    resultado = {"importacao_ms": importacao, "subida_ms": subida, "total_ms": total}
+    print(
+        f"\nMediana de {args.execucoes}: import {importacao:.0f} ms + "
+        f"subida {subida:.0f} ms = {total:.0f} ms (orçamento {args.orcamento_ms:.0f} ms)"
+    )
+
+    falhas = []
+    if total > args.orcamento_ms:
+        falhas.append(f"subida de {total:.0f} ms acima do orçamento de {args.orcamento_ms:.0f} ms")
+    if args.base:
+        with open(args.base, encoding="utf-8") as arquivo:
+            base = json.load(arquivo)
+        limite = base["total_ms"] * (1 + args.tolerancia)
+        print(f"Base: {base['total_ms']:.0f} ms ({(total / base['total_ms'] - 1) * 100:+.0f}%)")
+        if total > limite:
+            falhas.append(f"subida {total / base['total_ms'] - 1:+.0%} em relação à base")
+    if carregados:
+        falhas.append(f"carregados na subida (deveriam ser sob demanda): {', '.join(carregados)}")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as arquivo:
+            json.dump(resultado, arquivo, indent=2, ensure_ascii=False)
+
+    if falhas:
+        for falha in falhas:
+            print(f"FALHOU: {falha}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
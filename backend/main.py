@@ -1,21 +1,59 @@
+import asyncio
+import os
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.staticfiles import StaticFiles
 from app.core.config import settings
-from app.core.database import engine
-from sqlmodel import SQLModel
+from app.core.database import async_engine
+from app.core.instrumentation import DBStatsMiddleware
+from app.core.metricas import MetricasMiddleware
+from app.core.perfilador import PerfiladorMiddleware
+from app.core.rate_limit import fechar_limitador
+from app.core.security import shutdown_hash_pool
+from app.services.email_worker import executar_worker
+from app.services.cache_artigos import fechar_cache
+from app.services.curtidas import executar_descarga_periodica
+from app.services.tendencias import executar_atualizacao_periodica
+from app.services.midia import shutdown_pool_miniaturas
 
 # Importar modelos
 from app import models
 from app.api.router import api_router
+from app.api.metricas import router as metricas_router
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    # Cria as tabelas ao iniciar (idealmente Alembic em produção)
-    SQLModel.metadata.create_all(engine)
+    # O esquema do banco é responsabilidade das migrações (alembic upgrade head,
+    # executado uma vez no deploy); a API não faz nenhum trabalho de DDL aqui.
+
+    # Worker da caixa de saída de e-mails rodando junto com a API
+    # (desative com EMAIL_WORKER_EMBEDDED=False se ele rodar em processo próprio)
+    parar_worker = asyncio.Event()
+    worker_email = None
+    if settings.EMAIL_WORKER_EMBEDDED:
+        worker_email = asyncio.create_task(executar_worker(parar_worker))
+
+    # Descarga periódica dos contadores de curtidas (e uma final ao desligar)
+    descarga_curtidas = asyncio.create_task(executar_descarga_periodica(parar_worker))
+
+    # Ranking "em alta": grava os eventos e recarrega o top-K periodicamente
+    tendencias = asyncio.create_task(executar_atualizacao_periodica(parar_worker))
+
     yield
 
+    parar_worker.set()
+    if worker_email:
+        await worker_email
+    await descarga_curtidas
+    await tendencias
+    shutdown_hash_pool()
+    shutdown_pool_miniaturas()
+    await fechar_cache()
+    await fechar_limitador()
+    await async_engine.dispose()
+
 
 app = FastAPI(
     title=settings.PROJECT_NAME,
@@ -34,6 +72,21 @@ app.add_middleware(
     allow_headers=["*"],          # <--- Permite Content-Type, Authorization etc.
 )
 
+# Latência e status por rota (/metrics). Adicionado antes do DBStats para
+# ficar por dentro dele e enxergar o tempo de banco da requisição
+if settings.METRICS_ENABLED:
+    app.add_middleware(MetricasMiddleware)
+
+# Métricas de banco por requisição (log estruturado; Server-Timing só com
+# DB_QUERY_STATS_HEADERS, em desenvolvimento)
+if settings.DB_QUERY_STATS:
+    app.add_middleware(DBStatsMiddleware)
+
+# Perfilador por amostragem (resultados em /api/v1/admin/perfis). Adicionado
+# por último para ficar por fora de tudo e incluir o custo dos middlewares
+if settings.PROFILER_ENABLED:
+    app.add_middleware(PerfiladorMiddleware)
+
 # ----------------------
 # Rotas
 # ----------------------
@@ -42,3 +95,17 @@ def root():
     return {"message": "API do Jornal UFC está rodando!", "docs": "/docs"}
 
 app.include_router(api_router, prefix=settings.API_V1_STR)
+
+if settings.METRICS_ENABLED:
+    app.include_router(metricas_router)
+
+# Imagens enviadas (em produção, sirva originais/ e miniaturas/ direto pelo
+# proxy/CDN: os nomes são o hash do conteúdo, então o cache pode ser permanente).
+# Só essas duas pastas são públicas; nada mais em MEDIA_ROOT é servido.
+for pasta in ("originais", "miniaturas"):
+    os.makedirs(os.path.join(settings.MEDIA_ROOT, pasta), exist_ok=True)
+    app.mount(
+        f"{settings.MEDIA_URL}/{pasta}",
+        StaticFiles(directory=os.path.join(settings.MEDIA_ROOT, pasta)),
+        name=f"media-{pasta}",
+    )
@@ -0,0 +1,61 @@
+# migrations/env.py
+from logging.config import fileConfig
+from alembic import context
+from sqlalchemy import create_engine, pool
+from sqlmodel import SQLModel
+
+from app.core.database import database_url
+# Importar modelos (registra todas as tabelas em SQLModel.metadata)
+from app import models
+
+config = context.config
+if config.config_file_name is not None:
+    fileConfig(config.config_file_name)
+
+target_metadata = SQLModel.metadata
+
+# Estruturas criadas por DDL própria (busca textual, índice GiST), fora do
+# metadata: o autogenerate não deve propor removê-las
+OBJETOS_MANUAIS = {"busca", "ix_noticias_busca", "ix_eventos_periodo"}
+
+
+def incluir_objeto(objeto, nome, tipo, refletido, comparado_com):
+    if refletido and comparado_com is None:
+        if nome in OBJETOS_MANUAIS or (tipo == "table" and nome.startswith("noticias_fts")):
+            return False
+    return True
+
+
+def run_migrations_offline() -> None:
+    """Gera o SQL sem conectar no banco (alembic upgrade head --sql)."""
+    context.configure(
+        url=database_url,
+        target_metadata=target_metadata,
+        literal_binds=True,
+        dialect_opts={"paramstyle": "named"},
+        render_as_batch=database_url.startswith("sqlite"),
+        include_object=incluir_objeto,
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def run_migrations_online() -> None:
+    # Engine própria, sem pool e sem a instrumentação da API
+    conectavel = create_engine(database_url, poolclass=pool.NullPool)
+    with conectavel.connect() as conexao:
+        context.configure(
+            connection=conexao,
+            target_metadata=target_metadata,
+            # SQLite não tem ALTER TABLE completo: o Alembic recria a tabela
+            render_as_batch=conexao.dialect.name == "sqlite",
+            include_object=incluir_objeto,
+        )
+        with context.begin_transaction():
+            context.run_migrations()
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
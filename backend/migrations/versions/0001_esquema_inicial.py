@@ -0,0 +1,140 @@
+"""esquema inicial
+
+Exatamente o esquema que o create_all gerava antes das migrações (tabelas,
+chaves e índices únicos originais). Tudo o que veio depois está nas
+revisões seguintes, uma por funcionalidade, com o preenchimento dos dados.
+Bancos já existentes: `alembic stamp 0001` e depois `alembic upgrade head`.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-18 09:55:48.990986
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0001'
+down_revision: Union[str, Sequence[str], None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('categorias',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('nome', sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+    sa.Column('slug', sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('slug')
+    )
+    op.create_table('tags',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('nome', sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+    sa.Column('slug', sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('slug')
+    )
+    op.create_table('usuarios',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('nome', sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+    sa.Column('email', sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+    sa.Column('senha_hash', sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+    sa.Column('role', sa.Enum('ADMIN', 'PROFESSOR', 'BOLSISTA', 'LEITOR', name='roleenum'), nullable=False),
+    sa.Column('is_active', sa.Boolean(), nullable=False),
+    sa.Column('criado_em', sa.DateTime(), nullable=False),
+    sa.Column('orientador_id', sa.Integer(), nullable=True),
+    sa.ForeignKeyConstraint(['orientador_id'], ['usuarios.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_usuarios_email', 'usuarios', ['email'], unique=True)
+
+    op.create_table('eventos',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('titulo', sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+    sa.Column('descricao', sqlmodel.sql.sqltypes.AutoString(), nullable=True),
+    sa.Column('data_inicio', sa.DateTime(), nullable=False),
+    sa.Column('data_fim', sa.DateTime(), nullable=False),
+    sa.Column('local', sqlmodel.sql.sqltypes.AutoString(), nullable=True),
+    sa.Column('imagem_url', sqlmodel.sql.sqltypes.AutoString(), nullable=True),
+    sa.Column('destaque', sa.Boolean(), nullable=False),
+    sa.Column('criado_em', sa.DateTime(), nullable=False),
+    sa.Column('usuario_id', sa.Integer(), nullable=True),
+    sa.ForeignKeyConstraint(['usuario_id'], ['usuarios.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+
+    op.create_table('noticias',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('titulo', sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+    sa.Column('subtitulo', sqlmodel.sql.sqltypes.AutoString(), nullable=True),
+    sa.Column('conteudo', sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+    sa.Column('slug', sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+    sa.Column('imagem_capa', sqlmodel.sql.sqltypes.AutoString(), nullable=True),
+    sa.Column('publicado', sa.Boolean(), nullable=False),
+    sa.Column('publicado_em', sa.DateTime(), nullable=True),
+    sa.Column('criado_em', sa.DateTime(), nullable=False),
+    sa.Column('atualizado_em', sa.DateTime(), nullable=False),
+    sa.Column('autor_id', sa.Integer(), nullable=True),
+    sa.Column('categoria_id', sa.Integer(), nullable=True),
+    sa.ForeignKeyConstraint(['autor_id'], ['usuarios.id'], ),
+    sa.ForeignKeyConstraint(['categoria_id'], ['categorias.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_noticias_slug', 'noticias', ['slug'], unique=True)
+
+    op.create_table('comentarios',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('conteudo', sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+    sa.Column('criado_em', sa.DateTime(), nullable=False),
+    sa.Column('aprovado', sa.Boolean(), nullable=False),
+    sa.Column('usuario_id', sa.Integer(), nullable=True),
+    sa.Column('noticia_id', sa.Integer(), nullable=True),
+    sa.ForeignKeyConstraint(['noticia_id'], ['noticias.id'], ),
+    sa.ForeignKeyConstraint(['usuario_id'], ['usuarios.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+
+    op.create_table('curtidas_noticias',
+    sa.Column('usuario_id', sa.Integer(), nullable=False),
+    sa.Column('noticia_id', sa.Integer(), nullable=False),
+    sa.Column('criado_em', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['noticia_id'], ['noticias.id'], ),
+    sa.ForeignKeyConstraint(['usuario_id'], ['usuarios.id'], ),
+    sa.PrimaryKeyConstraint('usuario_id', 'noticia_id')
+    )
+    op.create_table('noticiastags',
+    sa.Column('noticia_id', sa.Integer(), nullable=False),
+    sa.Column('tag_id', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['noticia_id'], ['noticias.id'], ),
+    sa.ForeignKeyConstraint(['tag_id'], ['tags.id'], ),
+    sa.PrimaryKeyConstraint('noticia_id', 'tag_id')
+    )
+    op.create_table('curtidas_comentarios',
+    sa.Column('usuario_id', sa.Integer(), nullable=False),
+    sa.Column('comentario_id', sa.Integer(), nullable=False),
+    sa.Column('criado_em', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['comentario_id'], ['comentarios.id'], ),
+    sa.ForeignKeyConstraint(['usuario_id'], ['usuarios.id'], ),
+    sa.PrimaryKeyConstraint('usuario_id', 'comentario_id')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('curtidas_comentarios')
+    op.drop_table('noticiastags')
+    op.drop_table('curtidas_noticias')
+    op.drop_table('comentarios')
+    op.drop_table('noticias')
+    op.drop_table('eventos')
+    op.drop_table('usuarios')
+    op.drop_table('tags')
+    op.drop_table('categorias')
+    if op.get_bind().dialect.name == "postgresql":
+        sa.Enum(name='roleenum').drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,48 @@
+"""indices do feed
+
+Índices compostos da paginação keyset do feed: (publicado, publicado_em, id),
+a variante com categoria_id e o índice reverso de noticiastags para o filtro
+por tag. No Postgres são criados com CONCURRENTLY, sem bloquear escritas.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18 09:56:02.418733
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0002'
+down_revision: Union[str, Sequence[str], None] = '0001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+INDICES = [
+    ('ix_noticias_publicado_publicado_em_id', 'noticias', ['publicado', 'publicado_em', 'id']),
+    (
+        'ix_noticias_categoria_id_publicado_publicado_em_id', 'noticias',
+        ['categoria_id', 'publicado', 'publicado_em', 'id'],
+    ),
+    ('ix_noticiastags_tag_id_noticia_id', 'noticiastags', ['tag_id', 'noticia_id']),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CONCURRENTLY não pode rodar dentro de transação
+    with op.get_context().autocommit_block():
+        for nome, tabela, colunas in INDICES:
+            op.create_index(nome, tabela, colunas, postgresql_concurrently=True, if_not_exists=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for nome, tabela, _ in reversed(INDICES):
+            op.drop_index(nome, table_name=tabela, postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,92 @@
+"""busca textual
+
+Estruturas da busca (mesmo SQL de app/models/noticia.py, congelado aqui):
+- Postgres: coluna tsvector gerada + índice GIN. O ADD COLUMN ... STORED
+  reescreve a tabela (calcula o vetor das notícias existentes); o índice é
+  criado depois, com CONCURRENTLY.
+- SQLite: tabela FTS5 de conteúdo externo e triggers; o 'rebuild' indexa
+  as notícias que já existem.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18 09:56:11.902316
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0003'
+down_revision: Union[str, Sequence[str], None] = '0002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+BUSCA_POSTGRES = """
+    ALTER TABLE noticias ADD COLUMN busca tsvector GENERATED ALWAYS AS (
+        setweight(to_tsvector('portuguese', coalesce(titulo, '')), 'A') ||
+        setweight(to_tsvector('portuguese', coalesce(subtitulo, '')), 'B') ||
+        setweight(to_tsvector('portuguese', coalesce(conteudo, '')), 'D')
+    ) STORED
+"""
+INDICE_POSTGRES = "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_noticias_busca ON noticias USING GIN (busca)"
+
+BUSCA_SQLITE = [
+    """
+    CREATE VIRTUAL TABLE noticias_fts USING fts5(
+        titulo, subtitulo, conteudo,
+        content='noticias', content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2'
+    )
+    """,
+    """
+    CREATE TRIGGER noticias_fts_ai AFTER INSERT ON noticias BEGIN
+        INSERT INTO noticias_fts(rowid, titulo, subtitulo, conteudo)
+        VALUES (new.id, new.titulo, new.subtitulo, new.conteudo);
+    END
+    """,
+    """
+    CREATE TRIGGER noticias_fts_ad AFTER DELETE ON noticias BEGIN
+        INSERT INTO noticias_fts(noticias_fts, rowid, titulo, subtitulo, conteudo)
+        VALUES ('delete', old.id, old.titulo, old.subtitulo, old.conteudo);
+    END
+    """,
+    """
+    CREATE TRIGGER noticias_fts_au AFTER UPDATE OF titulo, subtitulo, conteudo ON noticias BEGIN
+        INSERT INTO noticias_fts(noticias_fts, rowid, titulo, subtitulo, conteudo)
+        VALUES ('delete', old.id, old.titulo, old.subtitulo, old.conteudo);
+        INSERT INTO noticias_fts(rowid, titulo, subtitulo, conteudo)
+        VALUES (new.id, new.titulo, new.subtitulo, new.conteudo);
+    END
+    """,
+    # Indexa as notícias existentes (lidas da tabela de conteúdo)
+    "INSERT INTO noticias_fts(noticias_fts) VALUES ('rebuild')",
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    dialeto = op.get_context().dialect.name
+    if dialeto == "postgresql":
+        op.execute(BUSCA_POSTGRES)
+        with op.get_context().autocommit_block():
+            op.execute(INDICE_POSTGRES)
+    elif dialeto == "sqlite":
+        for sql in BUSCA_SQLITE:
+            op.execute(sql)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    dialeto = op.get_context().dialect.name
+    if dialeto == "postgresql":
+        op.execute("DROP INDEX IF EXISTS ix_noticias_busca")
+        op.execute("ALTER TABLE noticias DROP COLUMN IF EXISTS busca")
+    elif dialeto == "sqlite":
+        for trigger in ("noticias_fts_ai", "noticias_fts_ad", "noticias_fts_au"):
+            op.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+        op.execute("DROP TABLE IF EXISTS noticias_fts")
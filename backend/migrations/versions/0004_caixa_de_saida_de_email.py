@@ -0,0 +1,48 @@
+"""caixa de saida de email
+
+Tabela email_outbox: os e-mails são gravados na mesma transação da regra de
+negócio e enviados pelo worker (app/services/email_worker.py).
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-18 09:56:19.551027
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0004'
+down_revision: Union[str, Sequence[str], None] = '0003'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('email_outbox',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('assunto', sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+    sa.Column('destinatarios', sa.JSON(), nullable=False),
+    sa.Column('corpo_html', sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+    sa.Column('status', sa.Enum('PENDENTE', 'ENVIADO', 'FALHOU', name='statusemail'), nullable=False),
+    sa.Column('tentativas', sa.Integer(), nullable=False),
+    sa.Column('proxima_tentativa_em', sa.DateTime(), nullable=False),
+    sa.Column('ultimo_erro', sqlmodel.sql.sqltypes.AutoString(), nullable=True),
+    sa.Column('criado_em', sa.DateTime(), nullable=False),
+    sa.Column('enviado_em', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_email_outbox_status_proxima_tentativa_em', 'email_outbox', ['status', 'proxima_tentativa_em'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_email_outbox_status_proxima_tentativa_em', table_name='email_outbox')
+    op.drop_table('email_outbox')
+    if op.get_context().dialect.name == "postgresql":
+        op.execute("DROP TYPE IF EXISTS statusemail")
@@ -0,0 +1,43 @@
+"""versoes colecao
+
+Contador de versão por coleção, usado como ETag/Last-Modified das listagens
+(app/models/versao.py). Começa com uma linha por coleção.
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-18 09:56:26.137465
+
+"""
+from datetime import datetime
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0005'
+down_revision: Union[str, Sequence[str], None] = '0004'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    versoes = op.create_table('versoes_colecao',
+    sa.Column('nome', sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+    sa.Column('versao', sa.Integer(), nullable=False),
+    sa.Column('atualizado_em', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('nome')
+    )
+    op.bulk_insert(versoes, [
+        {"nome": "noticias", "versao": 0, "atualizado_em": datetime.now()},
+        {"nome": "eventos", "versao": 0, "atualizado_em": datetime.now()},
+        {"nome": "relacoes_artigo", "versao": 0, "atualizado_em": datetime.now()},
+    ])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('versoes_colecao')
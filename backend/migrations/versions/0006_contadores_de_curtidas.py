@@ -0,0 +1,56 @@
+"""contadores de curtidas
+
+Contadores desnormalizados noticias.total_curtidas e
+comentarios.total_curtidas (app/services/curtidas.py), preenchidos a partir
+das tabelas de curtidas já existentes.
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-18 09:56:33.704182
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0006'
+down_revision: Union[str, Sequence[str], None] = '0005'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# alvo, tabela de curtidas, coluna que aponta para o alvo
+CONTADORES = [
+    ('noticias', 'curtidas_noticias', 'noticia_id'),
+    ('comentarios', 'curtidas_comentarios', 'comentario_id'),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for alvo, curtidas, chave in CONTADORES:
+        # server_default preenche as linhas existentes com 0 no próprio ADD COLUMN
+        op.add_column(alvo, sa.Column('total_curtidas', sa.Integer(), nullable=False, server_default='0'))
+
+        tabela_alvo = sa.table(alvo, sa.column('id'), sa.column('total_curtidas'))
+        tabela_curtidas = sa.table(curtidas, sa.column(chave))
+        op.execute(
+            tabela_alvo.update()
+            .where(tabela_alvo.c.id.in_(sa.select(tabela_curtidas.c[chave])))
+            .values(total_curtidas=(
+                sa.select(sa.func.count())
+                .where(tabela_curtidas.c[chave] == tabela_alvo.c.id)
+                .scalar_subquery()
+            ))
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for alvo, _, _ in reversed(CONTADORES):
+        with op.batch_alter_table(alvo) as batch:
+            batch.drop_column('total_curtidas')
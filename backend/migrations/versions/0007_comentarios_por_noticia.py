@@ -0,0 +1,38 @@
+"""comentarios por noticia
+
+Índice (noticia_id, criado_em, id) da paginação keyset dos comentários.
+No Postgres, CONCURRENTLY.
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-18 09:56:40.016298
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0007'
+down_revision: Union[str, Sequence[str], None] = '0006'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+INDICE = ('ix_comentarios_noticia_id_criado_em_id', 'comentarios', ['noticia_id', 'criado_em', 'id'])
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CONCURRENTLY não pode rodar dentro de transação
+    with op.get_context().autocommit_block():
+        op.create_index(*INDICE, postgresql_concurrently=True, if_not_exists=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(INDICE[0], table_name=INDICE[1], postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,55 @@
+"""facetas
+
+Contagem de notícias publicadas por categoria e por tag (app/models/faceta.py),
+preenchida com as notícias existentes (equivalente a reconstruir_facetas,
+congelado aqui em SQL para funcionar também com --sql).
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-18 09:56:44.271905
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0008'
+down_revision: Union[str, Sequence[str], None] = '0007'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    facetas = op.create_table('facetas',
+    sa.Column('tipo', sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+    sa.Column('ref_id', sa.Integer(), nullable=False),
+    sa.Column('total', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('tipo', 'ref_id')
+    )
+
+    noticias = sa.table('noticias', sa.column('id'), sa.column('publicado'), sa.column('categoria_id'))
+    links = sa.table('noticiastags', sa.column('noticia_id'), sa.column('tag_id'))
+    op.execute(facetas.insert().from_select(
+        ['tipo', 'ref_id', 'total'],
+        sa.select(sa.literal('categoria'), noticias.c.categoria_id, sa.func.count())
+        .where(noticias.c.publicado == sa.true())
+        .where(noticias.c.categoria_id.is_not(None))
+        .group_by(noticias.c.categoria_id)
+    ))
+    op.execute(facetas.insert().from_select(
+        ['tipo', 'ref_id', 'total'],
+        sa.select(sa.literal('tag'), links.c.tag_id, sa.func.count())
+        .select_from(links.join(noticias, noticias.c.id == links.c.noticia_id))
+        .where(noticias.c.publicado == sa.true())
+        .group_by(links.c.tag_id)
+    ))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('facetas')
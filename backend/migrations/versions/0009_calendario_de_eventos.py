@@ -0,0 +1,46 @@
+"""calendario de eventos
+
+Índices da consulta "eventos que se sobrepõem a [de, ate]": B-tree
+(data_inicio, data_fim) e, no Postgres, GiST sobre tsrange. Ambos com
+CONCURRENTLY no Postgres.
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2026-10-18 09:56:48.830477
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0009'
+down_revision: Union[str, Sequence[str], None] = '0008'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+INDICE = ('ix_eventos_data_inicio_data_fim', 'eventos', ['data_inicio', 'data_fim'])
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CONCURRENTLY não pode rodar dentro de transação
+    with op.get_context().autocommit_block():
+        op.create_index(*INDICE, postgresql_concurrently=True, if_not_exists=True)
+        if op.get_context().dialect.name == "postgresql":
+            op.execute(
+                "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_eventos_periodo ON eventos "
+                "USING GIST (tsrange(data_inicio, data_fim, '[]'))"
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        if op.get_context().dialect.name == "postgresql":
+            op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_eventos_periodo")
+        op.drop_index(INDICE[0], table_name=INDICE[1], postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,48 @@
+"""indices de acesso
+
+Índices reversos das tabelas de curtidas e dos bolsistas por orientador.
+No Postgres são criados com CONCURRENTLY, sem bloquear escritas nas
+tabelas durante a migração.
+
+(Noticia(categoria_id, publicado_em) e Comentario(noticia_id, criado_em)
+já são atendidos pelos índices compostos da 0002 e da 0007.)
+
+Revision ID: 0010
+Revises: 0009
+Create Date: 2026-10-18 09:56:45.834208
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0010'
+down_revision: Union[str, Sequence[str], None] = '0009'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+INDICES = [
+    ('ix_curtidas_noticias_noticia_id_usuario_id', 'curtidas_noticias', ['noticia_id', 'usuario_id']),
+    ('ix_curtidas_comentarios_comentario_id_usuario_id', 'curtidas_comentarios', ['comentario_id', 'usuario_id']),
+    ('ix_usuarios_orientador_id', 'usuarios', ['orientador_id']),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CONCURRENTLY não pode rodar dentro de transação
+    with op.get_context().autocommit_block():
+        for nome, tabela, colunas in INDICES:
+            op.create_index(nome, tabela, colunas, postgresql_concurrently=True, if_not_exists=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for nome, tabela, _ in reversed(INDICES):
+            op.drop_index(nome, table_name=tabela, postgresql_concurrently=True, if_exists=True)
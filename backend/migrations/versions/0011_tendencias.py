@@ -0,0 +1,44 @@
+"""tendencias
+
+Pontuações do ranking "em alta" (app/services/tendencias.py). Tabela nova e
+vazia: os índices são criados junto, sem necessidade de CONCURRENTLY.
+
+Revision ID: 0011
+Revises: 0010
+Create Date: 2026-10-18 10:06:26.433820
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0011'
+down_revision: Union[str, Sequence[str], None] = '0010'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('tendencias',
+    sa.Column('noticia_id', sa.Integer(), nullable=False),
+    sa.Column('categoria_id', sa.Integer(), nullable=True),
+    sa.Column('pontuacao', sa.Float(), nullable=False),
+    sa.Column('janela', sa.Integer(), nullable=False),
+    sa.Column('atualizado_em', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['noticia_id'], ['noticias.id'], ),
+    sa.PrimaryKeyConstraint('noticia_id')
+    )
+    op.create_index('ix_tendencias_categoria_id_pontuacao', 'tendencias', ['categoria_id', 'pontuacao'], unique=False)
+    op.create_index('ix_tendencias_pontuacao', 'tendencias', ['pontuacao'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_tendencias_pontuacao', table_name='tendencias')
+    op.drop_index('ix_tendencias_categoria_id_pontuacao', table_name='tendencias')
+    op.drop_table('tendencias')
@@ -0,0 +1,44 @@
+"""fila de bolsistas
+
+Troca o índice de usuarios(orientador_id) por (orientador_id, is_active,
+criado_em, id): atende a fila de aprovação do professor (pendentes, em
+ordem de cadastro, paginada por cursor) e continua servindo as buscas só
+por orientador_id, que usam o prefixo. No Postgres, CONCURRENTLY: o novo é
+criado antes de o antigo ser removido.
+
+Revision ID: 0012
+Revises: 0011
+Create Date: 2026-10-18 10:14:02.117530
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0012'
+down_revision: Union[str, Sequence[str], None] = '0011'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+NOVO = ('ix_usuarios_orientador_id_is_active_criado_em_id', ['orientador_id', 'is_active', 'criado_em', 'id'])
+ANTIGO = ('ix_usuarios_orientador_id', ['orientador_id'])
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CONCURRENTLY não pode rodar dentro de transação
+    with op.get_context().autocommit_block():
+        op.create_index(NOVO[0], 'usuarios', NOVO[1], postgresql_concurrently=True, if_not_exists=True)
+        op.drop_index(ANTIGO[0], table_name='usuarios', postgresql_concurrently=True, if_exists=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(ANTIGO[0], 'usuarios', ANTIGO[1], postgresql_concurrently=True, if_not_exists=True)
+        op.drop_index(NOVO[0], table_name='usuarios', postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,39 @@
+"""eventos atualizado_em
+
+Data da última alteração do evento, validador do GET /eventos/{id}
+(antes vinha de criado_em e não mudava com edições). Os eventos existentes
+começam com atualizado_em = criado_em.
+
+Revision ID: 0013
+Revises: 0012
+Create Date: 2026-10-18 10:31:07.264518
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0013'
+down_revision: Union[str, Sequence[str], None] = '0012'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 1. Coluna opcional, 2. preenchida com criado_em, 3. obrigatória
+    op.add_column('eventos', sa.Column('atualizado_em', sa.DateTime(), nullable=True))
+    eventos = sa.table('eventos', sa.column('criado_em'), sa.column('atualizado_em'))
+    op.execute(eventos.update().values(atualizado_em=eventos.c.criado_em))
+    with op.batch_alter_table('eventos') as batch:
+        batch.alter_column('atualizado_em', existing_type=sa.DateTime(), nullable=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('eventos') as batch:
+        batch.drop_column('atualizado_em')